@@ -1,7 +1,17 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
+import functools
+import io
+import json
+import struct
 import numpy as np
 from sympy import symbols, diff, lambdify, parsing, sympify, expand
 from metodos.metodos import DiferenciasFinitas, Derivacion, Integracion, SistemasLineales, EcuacionesDiferenciales, EcuacionesUnaVariable
+from metodos.metodos import ProblemasFrontera, estadisticas_cache_expresiones, resultados_como_arreglos
+
+try:
+    import msgpack
+except ImportError:  # MessagePack es opcional; sin él ese formato no se ofrece
+    msgpack = None
 
 app = Flask(__name__)
 
@@ -50,6 +60,11 @@ def health():
     """Endpoint de verificación de salud"""
     return jsonify({'status': 'ok', 'message': 'App de Métodos Numéricos funcionando'})
 
+@app.route('/api/cache-expresiones', methods=['GET'])
+def api_cache_expresiones():
+    """Estadísticas de la caché de expresiones compiladas"""
+    return jsonify(estadisticas_cache_expresiones())
+
 @app.route('/api/calcular-derivadas', methods=['POST'])
 def api_calcular_derivadas():
     """Calcular derivadas totales automáticamente usando sympy para métodos de Taylor"""
@@ -62,50 +77,21 @@ def api_calcular_derivadas():
             return jsonify({'error': 'Se requiere una expresión'}), 400
         
         try:
-            # Crear símbolos
-            x, y = symbols('x y')
-            
-            # Parsear la expresión (reemplazar y1 por y para compatibilidad)
-            expr_str = f_expr_str.replace('y1', 'y')
-            
-            # Procesar la expresión para agregar multiplicación implícita
-            # Por ejemplo: 2y -> 2*y, xy -> x*y, etc.
-            processed_expr = _process_implicit_multiplication(expr_str)
-            
-            f = sympify(processed_expr)
-            
-            # Calcular derivadas totales usando el método correcto
-            # f (función original)
-            derivs = [f]
-            
-            # f' = ∂f/∂x + ∂f/∂y * f
-            f_prime = diff(f, x) + diff(f, y) * f
-            
-            if orden >= 1:
-                derivs.append(f_prime)
-            
-            if orden >= 2:
-                # f'' = ∂f'/∂x + ∂f'/∂y * f'
-                f_double_prime = diff(f_prime, x) + diff(f_prime, y) * f_prime
-                derivs.append(f_double_prime)
-            
-            if orden >= 3:
-                # f''' = ∂f''/∂x + ∂f''/∂y * f''
-                f_triple_prime = diff(f_double_prime, x) + diff(f_double_prime, y) * f_double_prime
-                derivs.append(f_triple_prime)
+            # Derivadas totales f', f'', f''' (la expresión analizada sale de la caché)
+            derivs = EcuacionesDiferenciales._taylor_derivatives(f_expr_str, max(1, min(int(orden), 3)))
             
-            # Construir respuesta simplificando las expresiones
+            # Construir respuesta con las expresiones expandidas
             resultado = {
                 'f_expr': f_expr_str,
                 'orden': orden
             }
             
-            if len(derivs) > 1:
-                resultado['df_expr'] = str(expand(derivs[1]))
-            if len(derivs) > 2:
-                resultado['ddf_expr'] = str(expand(derivs[2]))
-            if len(derivs) > 3:
-                resultado['dddf_expr'] = str(expand(derivs[3]))
+            if orden >= 1:
+                resultado['df_expr'] = derivs[1]
+            if orden >= 2:
+                resultado['ddf_expr'] = derivs[2]
+            if orden >= 3:
+                resultado['dddf_expr'] = derivs[3]
             
             return jsonify(resultado), 200
             
@@ -115,36 +101,6 @@ def api_calcular_derivadas():
     except Exception as e:
         return jsonify({'error': f'Error en el servidor: {str(e)}'}), 500
 
-
-def _process_implicit_multiplication(expr: str) -> str:
-    """
-    Procesa una expresión para agregar multiplicación explícita donde sea necesario.
-    Por ejemplo: '2y' -> '2*y', 'xy' -> 'x*y', '2(x+1)' -> '2*(x+1)', etc.
-    """
-    import re
-    
-    result = expr
-    
-    # Agregar * entre número y variable: 2y -> 2*y, 3x -> 3*x
-    result = re.sub(r'(\d)([xy])', r'\1*\2', result)
-    
-    # Agregar * entre variable y variable: xy -> x*y, yx -> y*x (pero no en exponentes)
-    result = re.sub(r'([xy])([xy])', r'\1*\2', result)
-    
-    # Agregar * entre número y paréntesis: 2(...) -> 2*(...)
-    result = re.sub(r'(\d)\(', r'\1*(', result)
-    
-    # Agregar * entre variable y paréntesis: x(...) -> x*(...)
-    result = re.sub(r'([xy])\(', r'\1*(', result)
-    
-    # Agregar * entre paréntesis y número: (...)2 -> (...)*2
-    result = re.sub(r'\)(\d)', r')*\1', result)
-    
-    # Agregar * entre paréntesis y variable: (...)x -> (...)*x
-    result = re.sub(r'\)([xy])', r')*\1', result)
-    
-    return result
-
 @app.route('/api/diferencias-divididas', methods=['POST'])
 def api_diferencias_divididas():
     """API para calcular diferencias divididas"""
@@ -296,17 +252,12 @@ def api_integracion():
                 except (ValueError, TypeError):
                     return jsonify({'error': 'n inválido'}), 400
                 
-                # Compilar la función y evaluar en puntos
-                from sympy import lambdify
-                x_sym = symbols('x')
-                f_sym = sympify(f_expr)
-                f_func = lambdify(x_sym, f_sym, 'numpy')
-                
-                # Generar puntos
-                x_points = np.linspace(a, b, n + 1)
+                # Compilar la función (caché de expresiones) y evaluar en los puntos
                 try:
-                    valores_f = [float(f_func(xi)) for xi in x_points]
-                except:
+                    valores_f = Integracion.valores_funcion(f_expr, a, b, n)
+                except ValueError:
+                    raise
+                except Exception:
                     return jsonify({'error': 'Error evaluando la función'}), 400
                 
                 # Ejecutar el método con los valores calculados
@@ -433,6 +384,11 @@ def api_sistemas_lineales():
                 'L': L,
                 'detalles': detalles
             }), 200
+        elif metodo == 'tridiagonal':
+            A = np.array(matriz_A)
+            if A.ndim != 2 or A.shape[0] != A.shape[1] or np.any(np.triu(A, 2)) or np.any(np.tril(A, -2)):
+                return jsonify({'error': 'La matriz debe ser cuadrada y tridiagonal'}), 400
+            solucion, detalles = SistemasLineales.tridiagonal(np.diag(A, -1), np.diag(A), np.diag(A, 1), vector_b)
         else:
             return jsonify({'error': 'Método no válido'}), 400
         
@@ -446,7 +402,167 @@ def api_sistemas_lineales():
     except Exception as e:
         return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
 
+@app.route('/api/problemas-frontera', methods=['POST'])
+def api_problemas_frontera():
+    """API para resolver problemas de frontera y'' = f(x, y, y'), y(a) = alfa, y(b) = beta"""
+    try:
+        datos = request.get_json()
+        
+        if not datos:
+            return jsonify({'error': 'No se recibieron datos'}), 400
+        
+        metodo = datos.get('metodo')
+        f_expr = datos.get('f_expr')  # y'' en función de x, y1 (= y) e y2 (= y')
+        a = datos.get('a')
+        b = datos.get('b')
+        alfa = datos.get('alfa')
+        beta = datos.get('beta')
+        n = datos.get('n')
+        
+        if not all([metodo, f_expr, a is not None, b is not None, alfa is not None,
+                    beta is not None, n is not None]):
+            return jsonify({'error': 'Faltan campos requeridos'}), 400
+        
+        try:
+            a, b, alfa, beta = float(a), float(b), float(alfa), float(beta)
+            n = int(n)
+            tolerancia = float(datos.get('tolerancia', 1e-10))
+            max_iteraciones = int(datos.get('max_iteraciones', 50))
+        except (ValueError, TypeError) as e:
+            return jsonify({'error': f'Datos inválidos: {str(e)}'}), 400
+        
+        if metodo == 'disparo':
+            x_vals, y_vals, detalles = ProblemasFrontera.disparo(
+                a, b, alfa, beta, n, f_expr, tolerancia, max_iteraciones)
+        elif metodo == 'diferencias_finitas':
+            x_vals, y_vals, detalles = ProblemasFrontera.diferencias_finitas(
+                a, b, alfa, beta, n, f_expr, tolerancia, max_iteraciones)
+        else:
+            return jsonify({'error': 'Método no válido'}), 400
+        
+        return jsonify({
+            'x_valores': x_vals,
+            'y_valores': y_vals,
+            'detalles': detalles
+        }), 200
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
+
+def _salida_densa(salida: dict, n: int, x_salida: list = None):
+    """Traduce las opciones de salida a (n, x_salida) para los métodos con salida densa"""
+    if not salida:
+        return n, x_salida
+    if 'x_salida' in salida:
+        return n, salida['x_salida']
+    if 'muestras' in salida:
+        return max(int(salida['muestras']) - 1, 1), None
+    if 'cada' in salida:
+        if int(salida['cada']) < 1:
+            raise ValueError("salida['cada'] debe ser un entero positivo")
+        return max(n // int(salida['cada']), 1), None
+    return n, x_salida
+
+
+def _lineas_ndjson(encabezado: dict, pasos, tamano_bloque: int = 1000):
+    """
+    Convierte un generador de pasos (x, y) en líneas NDJSON.
+    
+    La primera línea es el encabezado, luego bloques {"x": [...], "y": [...]}
+    de hasta tamano_bloque puntos y al final {"fin": true, "puntos": N}. Un
+    error durante la integración se informa como una línea {"error": ...}.
+    """
+    yield json.dumps(encabezado) + '\n'
+    xs, ys = [], []
+    puntos = 0
+    try:
+        for x, y in pasos:
+            xs.append(x)
+            ys.append(y)
+            if len(xs) == tamano_bloque:
+                yield json.dumps({'x': xs, 'y': ys}) + '\n'
+                puntos += len(xs)
+                xs, ys = [], []
+        if xs:
+            yield json.dumps({'x': xs, 'y': ys}) + '\n'
+            puntos += len(xs)
+        yield json.dumps({'fin': True, 'puntos': puntos}) + '\n'
+    except Exception as e:
+        yield json.dumps({'error': f'Error en el cálculo: {str(e)}'}) + '\n'
+
+
+# Formatos binarios negociados con Accept; JSON sigue siendo el predeterminado
+_FORMATOS_BINARIOS = {
+    'application/octet-stream': 'columnas',
+    'application/x-npz': 'npz',
+    'application/msgpack': 'msgpack',
+    'application/x-msgpack': 'msgpack',
+}
+
+
+def _formato_binario():
+    """Formato binario pedido en la cabecera Accept, o None para responder JSON"""
+    ofrecidos = [tipo for tipo, formato in _FORMATOS_BINARIOS.items()
+                 if formato != 'msgpack' or msgpack is not None]
+    tipo = request.accept_mimetypes.best_match(['application/json'] + ofrecidos)
+    return _FORMATOS_BINARIOS.get(tipo)
+
+
+def _arreglos_si_binario(vista):
+    """
+    Ejecuta la vista con resultados_como_arreglos cuando se negocia un formato
+    binario, para que las columnas salgan de los ndarrays de los integradores
+    sin pasar por listas de Python; la respuesta JSON sigue recibiendo listas.
+    """
+    @functools.wraps(vista)
+    def envoltura(*args, **kwargs):
+        with resultados_como_arreglos(_formato_binario() is not None):
+            return vista(*args, **kwargs)
+    return envoltura
+
+
+def _respuesta_columnas(columnas: dict, detalles: dict, formato: str):
+    """
+    Serializa columnas de igual longitud como float64 little-endian.
+    
+    Con _arreglos_si_binario las columnas de los integradores de arreglos son
+    ndarrays float64 y se copian a la matriz de salida sin conversión por
+    elemento (solo los métodos de paso escalar, como euler o rk4 de una
+    ecuación, entregan listas de floats).
+    
+    - columnas (application/octet-stream): uint32 LE con la longitud del
+      encabezado JSON {'dtype', 'filas', 'columnas', 'detalles'}, el encabezado
+      (rellenado a múltiplo de 8 bytes) y luego cada columna contigua
+    - npz (application/x-npz): archivo con 'datos' (columnas, filas),
+      'columnas' (nombres) y 'detalles' (JSON en bytes uint8), todo en el cuerpo
+    - msgpack (application/msgpack): mapa con el mismo encabezado y cada
+      columna como bytes
+    """
+    nombres = list(columnas)
+    matriz = np.ascontiguousarray(np.vstack([np.asarray(c, dtype=float) for c in columnas.values()]),
+                                  dtype='<f8')
+    encabezado = {'dtype': '<f8', 'filas': matriz.shape[1], 'columnas': nombres, 'detalles': detalles}
+    
+    if formato == 'npz':
+        buffer = io.BytesIO()
+        np.savez(buffer, datos=matriz, columnas=np.array(nombres),
+                 detalles=np.frombuffer(json.dumps(detalles).encode('utf-8'), dtype=np.uint8))
+        return Response(buffer.getvalue(), mimetype='application/x-npz')
+    
+    if formato == 'msgpack':
+        encabezado['columnas'] = {nombre: fila.tobytes() for nombre, fila in zip(nombres, matriz)}
+        return Response(msgpack.packb(encabezado, use_bin_type=True), mimetype='application/msgpack')
+    
+    texto = json.dumps(encabezado).encode('utf-8')
+    texto += b' ' * (-(4 + len(texto)) % 8)
+    return Response(struct.pack('<I', len(texto)) + texto + matriz.tobytes(),
+                    mimetype='application/octet-stream')
+
+
 @app.route('/api/ecuaciones-diferenciales', methods=['POST'])
+@_arreglos_si_binario
 def api_ecuaciones_diferenciales():
     """API para resolver ecuaciones diferenciales (single o sistemas)"""
     try:
@@ -494,19 +610,82 @@ def api_ecuaciones_diferenciales():
         except (ValueError, TypeError) as e:
             return jsonify({'error': f'Datos inválidos: {str(e)}'}), 400
         
+        # MODO STREAMING: líneas NDJSON a medida que avanza la integración
+        if datos.get('stream') or 'application/x-ndjson' in request.headers.get('Accept', ''):
+            cada = int(datos.get('cada', 1))
+            # Compila y valida antes de empezar a responder (los errores siguen siendo 400)
+            pasos = EcuacionesDiferenciales.generar_pasos(
+                metodo, x0, y0, xf, n, functions if is_sistema else f_expr, cada
+            )
+            encabezado = {
+                'metodo': metodo,
+                'x0': x0,
+                'xf': xf,
+                'n': n,
+                'h': (xf - x0) / n,
+                'cada': cada,
+                'sistema': is_sistema
+            }
+            return Response(stream_with_context(_lineas_ndjson(encabezado, pasos)),
+                            mimetype='application/x-ndjson')
+        
+        # Muestreo de la salida: los métodos de paso fijo guardan solo las muestras pedidas
+        # y los de salida densa (dopri, bs, taylor_serie, rosenbrock) evalúan su interpolante
+        salida = datos.get('salida')
+        n_denso, x_salida = _salida_densa(salida, n, datos.get('x_salida'))
+        formato = _formato_binario()
+        
         # RESOLVER SISTEMAS DE ECUACIONES
         if is_sistema:
             if not functions:
                 return jsonify({'error': 'Se requiere lista de funciones para sistema'}), 400
             
             if metodo == 'euler':
-                x_vals, y_vals, detalles = EcuacionesDiferenciales.euler_sistema(x0, y0, xf, n, functions)
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.euler_sistema(
+                    x0, y0, xf, n, functions, salida=salida)
             elif metodo == 'rk4':
-                x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4_sistema(x0, y0, xf, n, functions)
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4_sistema(
+                    x0, y0, xf, n, functions, datos.get('eventos'), salida=salida)
+            elif metodo == 'dopri':
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.dormand_prince_sistema(
+                    x0, y0, xf, n_denso, functions, float(datos.get('tolerancia', 1e-6)), x_salida)
+            elif metodo == 'bs':
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.bulirsch_stoer_sistema(
+                    x0, y0, xf, n_denso, functions, float(datos.get('tolerancia', 1e-10)), x_salida)
+            elif metodo == 'taylor_serie':
+                orden = datos.get('orden')
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_serie_sistema(
+                    x0, y0, xf, n_denso, functions, float(datos.get('tolerancia', 1e-12)),
+                    int(orden) if orden is not None else None, x_salida)
+            elif metodo == 'adams_b':
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.adams_bashforth_sistema(
+                    x0, y0, xf, n, functions, int(datos.get('orden', 4)), salida)
+            elif metodo == 'adams_m':
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.adams_moulton_sistema(
+                    x0, y0, xf, n, functions, int(datos.get('orden', 4)), float(datos.get('tolerancia', 1e-10)),
+                    salida=salida)
+            elif metodo == 'retardo':
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.retardo_sistema(
+                    x0, y0, xf, n, functions, datos.get('historia'), salida)
+            elif metodo in ('verlet', 'leapfrog', 'yoshida4', 'yoshida6'):
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.simplectico_sistema(
+                    x0, y0, xf, n, functions, metodo, datos.get('energia'), salida)
+            elif metodo == 'bdf':
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.bdf_sistema(
+                    x0, y0, xf, n, functions, int(datos.get('orden', 2)), salida=salida)
+            elif metodo == 'rosenbrock':
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.rosenbrock_sistema(
+                    x0, y0, xf, n_denso, functions, float(datos.get('tolerancia', 1e-6)), x_salida)
             else:
                 # Para otros métodos en sistema, usar RK4 por defecto
-                x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4_sistema(x0, y0, xf, n, functions)
+                x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4_sistema(
+                    x0, y0, xf, n, functions, salida=salida)
             
+            if formato:
+                columnas = {'x': x_vals}
+                columnas.update((f'y{i + 1}', fila) for i, fila in enumerate(y_vals))
+                return _respuesta_columnas(columnas, detalles, formato)
+        
             return jsonify({
                 'x_valores': x_vals,
                 'y_valores': y_vals,
@@ -518,29 +697,68 @@ def api_ecuaciones_diferenciales():
             return jsonify({'error': 'Se requiere f_expr para ecuación única'}), 400
         
         if metodo == 'euler':
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.euler(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.euler(
+                x0, y0, xf, n, f_expr, datos.get('eventos'), salida=salida)
         elif metodo == 'taylor_2':
             # Las derivadas se calculan automáticamente usando SymPy
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_orden_2(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_orden_2(x0, y0, xf, n, f_expr, salida)
         elif metodo == 'taylor_3':
             # Las derivadas se calculan automáticamente usando SymPy
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_orden_3(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_orden_3(x0, y0, xf, n, f_expr, salida)
         elif metodo == 'taylor_4':
             # Las derivadas se calculan automáticamente usando SymPy
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_orden_4(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_orden_4(x0, y0, xf, n, f_expr, salida)
         elif metodo == 'rk3':
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_3(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_3(x0, y0, xf, n, f_expr, salida)
         elif metodo == 'rk4':
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4(
+                x0, y0, xf, n, f_expr, datos.get('eventos'), salida=salida)
         elif metodo == 'rkf':
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_fehlberg(x0, y0, xf, n, f_expr)
+            # Con tolerancia el paso es adaptativo; sin ella se usan n pasos fijos
+            tolerancia = datos.get('tolerancia')
+            tolerancia = float(tolerancia) if tolerancia is not None else None
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_fehlberg(
+                x0, y0, xf, n, f_expr, tolerancia, salida=salida)
+        elif metodo == 'dopri':
+            # n solo fija la densidad de la salida; la precisión la controla la tolerancia
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.dormand_prince(
+                x0, y0, xf, n_denso, f_expr, float(datos.get('tolerancia', 1e-6)), x_salida)
+        elif metodo == 'retardo':
+            # Términos retardados y(x - tau); historia = phi(x) para x <= x0
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.retardo(
+                x0, y0, xf, n, f_expr, datos.get('historia'), salida)
+        elif metodo == 'bs':
+            # Extrapolación de Bulirsch-Stoer; n solo fija la densidad de la salida
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.bulirsch_stoer(
+                x0, y0, xf, n_denso, f_expr, float(datos.get('tolerancia', 1e-10)), x_salida)
+        elif metodo == 'taylor_serie':
+            # Orden alto por diferenciación automática; orden automático si no se indica
+            orden = datos.get('orden')
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_serie(
+                x0, y0, xf, n_denso, f_expr, float(datos.get('tolerancia', 1e-12)),
+                int(orden) if orden is not None else None, x_salida)
+        elif metodo in ('bdf', 'rosenbrock'):
+            # Los métodos implícitos se resuelven como un sistema de una ecuación
+            if metodo == 'bdf':
+                x_vals, y_sis, detalles = EcuacionesDiferenciales.bdf_sistema(
+                    x0, [y0], xf, n, [f_expr], int(datos.get('orden', 2)), salida=salida)
+            else:
+                x_vals, y_sis, detalles = EcuacionesDiferenciales.rosenbrock_sistema(
+                    x0, [y0], xf, n_denso, [f_expr], float(datos.get('tolerancia', 1e-6)), x_salida)
+            y_vals = y_sis[0]
         elif metodo == 'adams_b':
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.adams_bashforth(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.adams_bashforth(
+                x0, y0, xf, n, f_expr, int(datos.get('orden', 4)), salida)
         elif metodo == 'adams_m':
-            x_vals, y_vals, detalles = EcuacionesDiferenciales.adams_moulton(x0, y0, xf, n, f_expr)
+            x_vals, y_vals, detalles = EcuacionesDiferenciales.adams_moulton(
+                x0, y0, xf, n, f_expr, int(datos.get('orden', 4)), float(datos.get('tolerancia', 1e-10)),
+                salida=salida)
         else:
             return jsonify({'error': 'Método no válido'}), 400
         
+        if formato:
+            return _respuesta_columnas({'x': x_vals, 'y': y_vals}, detalles, formato)
+        
         return jsonify({
             'x_valores': x_vals,
             'y_valores': [y_vals],  # Envolver en lista para mantener formato consistente
@@ -553,6 +771,154 @@ def api_ecuaciones_diferenciales():
     except Exception as e:
         return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
 
+@app.route('/api/ecuaciones-diferenciales/lote', methods=['POST'])
+@_arreglos_si_binario
+def api_ecuaciones_diferenciales_lote():
+    """API para resolver una EDO desde muchas condiciones iniciales en una sola llamada"""
+    try:
+        datos = request.get_json()
+        
+        if not datos:
+            return jsonify({'error': 'No se recibieron datos'}), 400
+        
+        metodo = datos.get('metodo')
+        x0 = datos.get('x0')
+        y0 = datos.get('y0')  # Vector (ecuación única) o matriz (sistema)
+        xf = datos.get('xf')
+        n = datos.get('n')
+        parametros = datos.get('parametros')  # Valores opcionales del parámetro p
+        functions = datos.get('functions')
+        f_expr = datos.get('f_expr')
+        
+        if functions and len(functions) == 1 and not f_expr:
+            f_expr = functions[0]
+            functions = None
+        
+        if not all([metodo, x0 is not None, y0 is not None, xf is not None, n is not None]):
+            return jsonify({'error': 'Faltan campos requeridos'}), 400
+        if not (f_expr or functions):
+            return jsonify({'error': 'Se requiere f_expr o functions'}), 400
+        
+        try:
+            x0 = float(x0)
+            xf = float(xf)
+            n = int(n)
+        except (ValueError, TypeError) as e:
+            return jsonify({'error': f'Datos inválidos: {str(e)}'}), 400
+        
+        x_vals, trayectorias, detalles = EcuacionesDiferenciales.resolver_lote(
+            metodo, x0, y0, xf, n, functions if functions else f_expr, parametros
+        )
+        
+        formato = _formato_binario()
+        if formato:
+            # Una columna por trayectoria (y por componente en sistemas)
+            columnas = {'x': x_vals}
+            for k, trayectoria in enumerate(trayectorias):
+                if functions:
+                    columnas.update((f't{k + 1}_y{i + 1}', fila) for i, fila in enumerate(trayectoria))
+                else:
+                    columnas[f't{k + 1}'] = trayectoria
+            return _respuesta_columnas(columnas, detalles, formato)
+        
+        return jsonify({
+            'x_valores': x_vals,
+            'trayectorias': trayectorias,
+            'detalles': detalles
+        }), 200
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
+
+@app.route('/api/ecuaciones-diferenciales/barrido', methods=['POST'])
+def api_barrido_parametros():
+    """API para resolver una EDO sobre una malla de parámetros usando todos los núcleos"""
+    try:
+        datos = request.get_json()
+        
+        if not datos:
+            return jsonify({'error': 'No se recibieron datos'}), 400
+        
+        metodo = datos.get('metodo')
+        x0 = datos.get('x0')
+        y0 = datos.get('y0')
+        xf = datos.get('xf')
+        n = datos.get('n')
+        malla = datos.get('malla')  # nombre -> lista de valores (x0, y0, xf, n o constantes)
+        procesos = datos.get('procesos')
+        functions = datos.get('functions')
+        f_expr = datos.get('f_expr')
+        
+        if functions and len(functions) == 1 and not f_expr:
+            f_expr = functions[0]
+            functions = None
+        
+        if not all([metodo, x0 is not None, y0 is not None, xf is not None, n is not None, malla]):
+            return jsonify({'error': 'Faltan campos requeridos'}), 400
+        if not (f_expr or functions):
+            return jsonify({'error': 'Se requiere f_expr o functions'}), 400
+        if not isinstance(malla, dict):
+            return jsonify({'error': 'malla debe ser un objeto nombre -> lista de valores'}), 400
+        
+        try:
+            x0 = float(x0)
+            xf = float(xf)
+            n = int(n)
+            procesos = int(procesos) if procesos is not None else None
+        except (ValueError, TypeError) as e:
+            return jsonify({'error': f'Datos inválidos: {str(e)}'}), 400
+        
+        resultados, detalles = EcuacionesDiferenciales.barrido_parametros(
+            metodo, functions if functions else f_expr, x0, y0, xf, n, malla, procesos
+        )
+        
+        return jsonify({
+            'resultados': resultados,
+            'detalles': detalles
+        }), 200
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
+
+@app.route('/api/ecuaciones-diferenciales/jacobiano', methods=['POST'])
+def api_jacobiano():
+    """API para evaluar el jacobiano simbólico de un sistema y diagnosticar rigidez"""
+    try:
+        datos = request.get_json()
+        
+        if not datos:
+            return jsonify({'error': 'No se recibieron datos'}), 400
+        
+        functions = datos.get('functions')
+        x = datos.get('x', 0)
+        y = datos.get('y')
+        
+        if not functions or y is None:
+            return jsonify({'error': 'Se requieren functions y y'}), 400
+        
+        try:
+            x = float(x)
+            y = [float(v) for v in (y if isinstance(y, list) else [y])]
+        except (ValueError, TypeError) as e:
+            return jsonify({'error': f'Datos inválidos: {str(e)}'}), 400
+        
+        matriz, detalles = EcuacionesDiferenciales.jacobiano(functions, x, y)
+        
+        return jsonify({
+            'jacobiano': matriz,
+            'detalles': detalles
+        }), 200
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
+
+
 @app.route('/api/ecuaciones-una-variable', methods=['POST'])
 def api_ecuaciones_una_variable():
     """API para resolver ecuaciones de una variable"""
@@ -603,6 +969,27 @@ def api_ecuaciones_una_variable():
             
             raiz, detalles = EcuacionesUnaVariable.falsa_posicion(funcion, a, b, tolerancia, max_iteraciones)
             
+        elif metodo in ('brent', 'illinois', 'anderson_bjorck', 'newton_biseccion'):
+            a = datos.get('a')
+            b = datos.get('b')
+            if not all([a is not None, b is not None]):
+                return jsonify({'error': 'Se requieren a y b para este método'}), 400
+            try:
+                a = float(a)
+                b = float(b)
+            except (ValueError, TypeError):
+                return jsonify({'error': 'a y b deben ser números'}), 400
+        
+            if metodo == 'brent':
+                raiz, detalles = EcuacionesUnaVariable.brent(funcion, a, b, tolerancia, max_iteraciones)
+            elif metodo == 'newton_biseccion':
+                derivada = datos.get('derivada') or None  # Si falta, se deriva automáticamente
+                raiz, detalles = EcuacionesUnaVariable.newton_biseccion(
+                    funcion, a, b, derivada, tolerancia, max_iteraciones)
+            else:
+                raiz, detalles = EcuacionesUnaVariable.illinois(
+                    funcion, a, b, tolerancia, max_iteraciones, variante=metodo)
+        
         elif metodo == 'secante':
             x0 = datos.get('x0')
             x1 = datos.get('x1')
@@ -618,9 +1005,9 @@ def api_ecuaciones_una_variable():
             
         elif metodo == 'newton_raphson':
             x0 = datos.get('x0')
-            derivada = datos.get('derivada')
-            if not all([x0 is not None, derivada]):
-                return jsonify({'error': 'Se requieren x0 y derivada para Newton-Raphson'}), 400
+            derivada = datos.get('derivada') or None  # Si falta, se deriva automáticamente
+            if x0 is None:
+                return jsonify({'error': 'Se requiere x0 para Newton-Raphson'}), 400
             try:
                 x0 = float(x0)
             except (ValueError, TypeError):
@@ -655,6 +1042,25 @@ def api_ecuaciones_una_variable():
             
             raiz, detalles = EcuacionesUnaVariable.muller(funcion, x0, x1, x2, tolerancia, max_iteraciones)
             
+        elif metodo == 'todas_las_raices':
+            a = datos.get('a')
+            b = datos.get('b')
+            if not all([a is not None, b is not None]):
+                return jsonify({'error': 'Se requieren a y b para buscar todas las raíces'}), 400
+            try:
+                a = float(a)
+                b = float(b)
+                puntos = int(datos.get('puntos', 10000))
+            except (ValueError, TypeError):
+                return jsonify({'error': 'a, b y puntos deben ser números'}), 400
+            
+            raices, detalles = EcuacionesUnaVariable.todas_las_raices(
+                funcion, a, b, puntos, tolerancia, max_iteraciones)
+            return jsonify({
+                'raices': raices,
+                'detalles': detalles
+            }), 200
+            
         else:
             return jsonify({'error': 'Método no válido'}), 400
         
@@ -672,6 +1078,58 @@ def api_ecuaciones_una_variable():
     except Exception as e:
         return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
 
+@app.route('/api/ecuaciones-una-variable/lote', methods=['POST'])
+def api_ecuaciones_una_variable_lote():
+    """API para resolver f(x; p) = 0 para muchos puntos iniciales o parámetros en una sola llamada"""
+    try:
+        datos = request.get_json()
+        
+        if not datos:
+            return jsonify({'error': 'No se recibieron datos'}), 400
+        
+        metodo = datos.get('metodo')
+        funcion = datos.get('funcion')
+        parametros = datos.get('parametros')  # Valores opcionales del parámetro p, uno por carril
+        
+        if not all([metodo, funcion]):
+            return jsonify({'error': 'Faltan campos requeridos'}), 400
+        
+        try:
+            tolerancia = float(datos.get('tolerancia', 1e-10))
+            max_iteraciones = int(datos.get('max_iteraciones', 100))
+        except (ValueError, TypeError):
+            return jsonify({'error': 'Datos inválidos'}), 400
+        
+        if metodo == 'newton_raphson':
+            if datos.get('x0') is None:
+                return jsonify({'error': 'Se requiere x0 para Newton-Raphson'}), 400
+            raices, detalles = EcuacionesUnaVariable.newton_lote(
+                funcion, datos['x0'], parametros, datos.get('derivada'), tolerancia, max_iteraciones)
+        elif metodo == 'secante':
+            if datos.get('x0') is None or datos.get('x1') is None:
+                return jsonify({'error': 'Se requieren x0 y x1 para secante'}), 400
+            raices, detalles = EcuacionesUnaVariable.secante_lote(
+                funcion, datos['x0'], datos['x1'], parametros, tolerancia, max_iteraciones)
+        elif metodo == 'biseccion':
+            if datos.get('a') is None or datos.get('b') is None:
+                return jsonify({'error': 'Se requieren a y b para bisección'}), 400
+            raices, detalles = EcuacionesUnaVariable.biseccion_lote(
+                funcion, datos['a'], datos['b'], parametros, tolerancia, max(max_iteraciones, 200))
+        else:
+            return jsonify({'error': 'Método no válido'}), 400
+        
+        return jsonify({
+            'raices': raices,
+            'iteraciones': detalles['iteraciones'],
+            'convergio': detalles['convergio'],
+            'detalles': detalles
+        }), 200
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
+
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,174 +1,2803 @@
+import ast
+import threading
+from contextlib import contextmanager
 import numpy as np
 from typing import List, Tuple, Union
-from sympy import symbols, sympify, diff, expand
+from sympy import symbols, sympify, diff, log, E, pi, Tuple as TuplaSympy
+from sympy.core.sympify import SympifyError
+
+
+# ================== COMPILACIÓN DE EXPRESIONES ==================
+
+# Constantes reconocidas al analizar las expresiones del usuario
+_CONSTANTES_EXPRESION = {'e': E, 'pi': pi}
+
+# Funciones sin equivalente directo en sympy, expresadas con funciones conocidas
+_FUNCIONES_EXPRESION = {'log10': lambda a: log(a, 10)}
+
+# Funciones que se pueden llamar en una expresión: las de
+# EcuacionesUnaVariable._math_functions y las que sympy escribe al derivar
+_FUNCIONES_PERMITIDAS = frozenset({
+    'sqrt', 'cbrt', 'root', 'exp', 'log', 'ln', 'log10',
+    'sin', 'cos', 'tan', 'cot', 'sec', 'csc',
+    'asin', 'acos', 'atan', 'atan2',
+    'sinh', 'cosh', 'tanh', 'asinh', 'acosh', 'atanh',
+    'abs', 'Abs', 'sign', 'floor', 'ceiling', 'Min', 'Max',
+    'Heaviside', 'DiracDelta', 'Piecewise', 'erf', 'gamma', 'factorial'
+})
+
+# Nodos del árbol de Python que puede contener una expresión matemática
+_NODOS_PERMITIDOS = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Tuple, ast.List, ast.Compare, ast.operator,
+    ast.unaryop, ast.cmpop
+)
+
+
+def _validar_expresion(f_expr: str, variables: Tuple[str, ...]):
+    """
+    Revisa el árbol sintáctico de una expresión antes de que sympy la evalúe.
+    
+    sympify evalúa el texto como código de Python, así que se rechaza todo
+    lo que no sea aritmética sobre números, las variables, las constantes
+    y llamadas directas a _FUNCIONES_PERMITIDAS (sin atributos, índices,
+    lambdas ni nombres como __import__).
+    
+    Raises:
+        ValueError: Si la expresión contiene algo fuera de la lista blanca
+    """
+    try:
+        arbol = ast.parse(f_expr, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Expresión inválida '{f_expr}': {e.msg}")
+    
+    nombres = set(variables) | set(_CONSTANTES_EXPRESION) | {'E'}
+    for nodo in ast.walk(arbol):
+        if not isinstance(nodo, _NODOS_PERMITIDOS):
+            raise ValueError(f"Expresión inválida '{f_expr}': {type(nodo).__name__} no está permitido")
+        if isinstance(nodo, ast.Constant) and not isinstance(nodo.value, (int, float)):
+            raise ValueError(f"Expresión inválida '{f_expr}': {nodo.value!r} no es un número")
+        if isinstance(nodo, ast.Call):
+            if not isinstance(nodo.func, ast.Name) or nodo.func.id not in _FUNCIONES_PERMITIDAS:
+                raise ValueError(f"Función no permitida en '{f_expr}': {ast.unparse(nodo.func)}")
+            if nodo.keywords:
+                raise ValueError(f"Expresión inválida '{f_expr}': argumentos con nombre no permitidos")
+        elif isinstance(nodo, ast.Name) and nodo.id not in nombres and nodo.id not in _FUNCIONES_PERMITIDAS:
+            raise ValueError(f"Variables desconocidas en '{f_expr}': {nodo.id}")
+
+
+def _construir_expresion(f_expr: str, variables: Tuple[str, ...]):
+    """
+    Analiza una expresión con sympy y la compila con lambdify.
+    
+    La expresión se valida con _validar_expresion antes de llegar a sympify.
+    
+    Returns:
+        Tupla (expresión sympy, función numérica f(*variables))
+    """
+    from sympy import lambdify
+    
+    _validar_expresion(f_expr, variables)
+    try:
+        expr = sympify(f_expr, locals={**_CONSTANTES_EXPRESION, **_FUNCIONES_EXPRESION})
+    except (SympifyError, TypeError, SyntaxError) as e:
+        raise ValueError(f"Expresión inválida '{f_expr}': {str(e)}")
+    
+    # Una tupla de expresiones (lado derecho de un sistema) se compila como una sola función
+    if isinstance(expr, (list, tuple)):
+        expr = TuplaSympy(*expr)
+    
+    desconocidas = sorted(str(s) for s in expr.free_symbols if str(s) not in variables)
+    if desconocidas:
+        raise ValueError(f"Variables desconocidas en '{f_expr}': {', '.join(desconocidas)}")
+    
+    return expr, lambdify(symbols(list(variables)), expr, 'numpy')
+
+
+class _CacheExpresiones:
+    """
+    Caché LRU acotada de expresiones analizadas y compiladas, compartida por
+    todo el proceso.
+    
+    La clave es la expresión sin espacios junto con la tupla de variables,
+    de modo que 'x + y' y 'x+y' comparten la misma entrada. Por defecto
+    cada entrada es (expresión sympy, función numérica); constructor permite
+    guardar otros objetos compilados a partir de la misma clave.
+    """
+    
+    def __init__(self, capacidad: int = 256, constructor=None):
+        from collections import OrderedDict
+        import threading
+        
+        self.capacidad = capacidad
+        self._constructor = constructor or _construir_expresion
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def obtener(self, f_expr: str, variables: Tuple[str, ...]):
+        """Devuelve (expresión sympy, función numérica), compilándola si no está en caché"""
+        clave = (''.join(str(f_expr).split()), tuple(variables))
+        
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return entrada
+            self.fallos += 1
+        
+        # Compilar fuera del candado: sympify y lambdify pueden tardar milisegundos
+        entrada = self._constructor(clave[0], clave[1])
+        
+        with self._lock:
+            self._entradas[clave] = entrada
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+        
+        return entrada
+    
+    def estadisticas(self) -> dict:
+        """Resumen de uso de la caché"""
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                'capacidad': self.capacidad,
+                'entradas': len(self._entradas),
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'tasa_aciertos': self.aciertos / total if total else 0.0
+            }
+    
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores"""
+        with self._lock:
+            self._entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+
+_cache_expresiones = _CacheExpresiones()
+
+
+def estadisticas_cache_expresiones() -> dict:
+    """Estadísticas de la caché de expresiones compiladas del proceso"""
+    return _cache_expresiones.estadisticas()
+
+
+def _analizar_expresion(f_expr: str, variables: Tuple[str, ...] = ('x', 'y')):
+    """Devuelve el árbol sympy de una expresión, usando la caché de expresiones"""
+    return _cache_expresiones.obtener(f_expr, variables)[0]
+
+
+def _compilar_expresion(f_expr: str, variables: Tuple[str, ...] = ('x', 'y')):
+    """
+    Compila una expresión una sola vez en una función numérica.
+    
+    La expresión se analiza con sympy y se convierte con lambdify en una
+    función que acepta floats o arreglos de NumPy, de modo que los métodos
+    iterativos no reconstruyen ni evalúan el string en cada paso. El
+    resultado se guarda en la caché LRU de expresiones del proceso.
+    
+    Args:
+        f_expr: Expresión como string (ej: 'x + y')
+        variables: Nombres de las variables, en el orden de los argumentos
+    
+    Returns:
+        Función numérica f(*variables)
+    """
+    return _cache_expresiones.obtener(f_expr, variables)[1]
+
+
+def _derivar(expr, variable: str, variables: Tuple[str, ...]):
+    """
+    Derivada simbólica de expr respecto a variable, con las variables reales.
+    
+    sympy supone símbolos complejos, así que d|x|/dx quedaría en términos de
+    re(x) e im(x); con símbolos reales da sign(x). El resultado vuelve a
+    escribirse con los símbolos originales para lambdify.
+    
+    Raises:
+        ValueError: Si la derivada no tiene forma cerrada evaluable (ej: floor)
+    """
+    from sympy import Symbol, Derivative
+    
+    reales = {Symbol(v): Symbol(v, real=True) for v in variables}
+    derivada = diff(expr.subs(reales), reales[Symbol(variable)])
+    derivada = derivada.subs({real: simbolo for simbolo, real in reales.items()})
+    if derivada.has(Derivative):
+        raise ValueError(f"No se puede derivar automáticamente '{expr}' respecto a {variable}; "
+                         f"indique la derivada")
+    return derivada
+
+
+def _compilar_ode(f_expr: str, constantes: Tuple[str, ...] = ()):
+    """
+    Compila el lado derecho f(x, y) de una EDO dy/dx = f(x, y).
+    
+    Acepta 'y1' como sinónimo de 'y' y multiplicación implícita (ej: '2y').
+    Los nombres en constantes (ej: ('p',)) se agregan como argumentos
+    adicionales: f(x, y, *valores_constantes).
+    """
+    expr_str = _process_implicit_multiplication_metodos(f_expr.replace('y1', 'y'))
+    return _compilar_expresion(expr_str, ('x', 'y') + tuple(constantes))
+
+
+class _DerivadasTaylor:
+    """
+    Derivadas totales de una EDO dy/dx = f(x, y) y sus núcleos numéricos.
+    
+    Las derivadas f', f'', ... se calculan a demanda y se conservan, de modo
+    que pedir un orden mayor solo deriva los términos que faltan. Para cada
+    orden se compila un único núcleo que devuelve (f, f', ..., f^(orden))
+    en una sola llamada; lambdify con cse=True extrae las subexpresiones
+    comunes, que así se evalúan una vez en lugar de una por derivada.
+    """
+    
+    def __init__(self, f, variables: Tuple[str, ...]):
+        self.variables = tuple(variables)
+        self._derivadas = [f]
+        self._nucleos = {}
+    
+    def derivadas(self, orden: int) -> list:
+        """Expresiones sympy [f, f', ..., f^(orden)]"""
+        x, y = symbols('x y')
+        f = self._derivadas[0]
+        while len(self._derivadas) <= orden:
+            # Derivada total a lo largo de la solución: d/dx g(x, y) = ∂g/∂x + ∂g/∂y * f
+            g = self._derivadas[-1]
+            self._derivadas.append(diff(g, x) + diff(g, y) * f)
+        return self._derivadas[:orden + 1]
+    
+    def nucleo(self, orden: int, escalar: bool = False):
+        """
+        Función numérica nucleo(x, y, *constantes) -> (f, f', ..., f^(orden))
+        
+        Con escalar=True se compila sobre el módulo math, bastante más rápido
+        cuando x e y son floats; el núcleo por defecto acepta arreglos.
+        """
+        from sympy import lambdify
+        
+        clave = (orden, escalar)
+        if clave not in self._nucleos:
+            modulos = ['math', 'numpy'] if escalar else 'numpy'
+            self._nucleos[clave] = lambdify(symbols(list(self.variables)),
+                                            TuplaSympy(*self.derivadas(orden)), modulos, cse=True)
+        return self._nucleos[clave]
+
+
+_cache_taylor = _CacheExpresiones(
+    capacidad=64,
+    constructor=lambda f_expr, variables: _DerivadasTaylor(_analizar_expresion(f_expr, variables), variables)
+)
+
+
+def _taylor_ode(f_expr: str, constantes: Tuple[str, ...] = ()) -> _DerivadasTaylor:
+    """Derivadas totales de dy/dx = f(x, y), tomadas de la caché por expresión"""
+    expr_str = _process_implicit_multiplication_metodos(f_expr.replace('y1', 'y'))
+    return _cache_taylor.obtener(expr_str, ('x', 'y') + tuple(constantes))
+
+
+def _variables_sistema(m: int) -> Tuple[str, ...]:
+    """Variables ('x', 'y1', ..., 'ym') de un sistema de m ecuaciones"""
+    return ('x',) + tuple(f'y{i}' for i in range(1, m + 1))
+
+
+def _fuente_sistema(f_exprs: List[str], constantes: Tuple[str, ...] = (), m: int = None):
+    """
+    Une las ecuaciones de un sistema en una sola expresión tupla.
+    
+    Una 'y' sin índice se interpreta como 'y1'. Por defecto hay una variable
+    por expresión; m fija otro número de variables (ej: funciones de evento).
+    
+    Returns:
+        Tupla (fuente '((f1), (f2), ...)', variables ('x', 'y1', ..., 'ym', *constantes))
+    """
+    import re
+    
+    exprs = [re.sub(r'\by\b', 'y1', str(f_expr)) for f_expr in f_exprs]
+    fuente = '(' + ', '.join(f'({e})' for e in exprs) + ',)'
+    return fuente, _variables_sistema(len(exprs) if m is None else m) + tuple(constantes)
+
+
+def _compilar_sistema(f_exprs: List[str], constantes: Tuple[str, ...] = ()):
+    """
+    Compila el lado derecho de un sistema dY/dx = F(x, Y) en una sola función
+    vectorial.
+    
+    Todas las ecuaciones se analizan juntas y se compilan en una única
+    función, de modo que cada evaluación de F es una sola llamada en lugar
+    de una por ecuación. Una 'y' sin índice se interpreta como 'y1'.
+    
+    Y puede ser un vector (m,) o una matriz (m, k) con k trayectorias por
+    columna; en ese caso F devuelve una matriz (m, k).
+    
+    Args:
+        f_exprs: Lista de funciones como strings (ej: ['y2', '-y1'])
+        constantes: Nombres adicionales, recibidos como F(x, Y, *valores)
+    
+    Returns:
+        Función F(x, Y, *valores_constantes) -> ndarray con una componente por ecuación
+    """
+    fuente, variables = _fuente_sistema(f_exprs, constantes)
+    f_tupla = _compilar_expresion(fuente, variables)
+    
+    # Las componentes que no dependen de Y devuelven un escalar y deben
+    # extenderse cuando se integran varias trayectorias a la vez
+    nombres_y = set(variables[1:len(f_exprs) + 1])
+    independientes = any(
+        not {str(s) for s in e.free_symbols} & nombres_y
+        for e in _analizar_expresion(fuente, variables)
+    )
+    
+    def F(x, Y, *valores):
+        componentes = f_tupla(x, *Y, *valores)
+        if independientes and np.ndim(Y) > 1:
+            componentes = np.broadcast_arrays(*componentes)
+        return np.array(componentes, dtype=float)
+    
+    return F
+
+
+class JacobianoCompilado:
+    """
+    Jacobiano simbólico compilado de un sistema dY/dx = F(x, Y).
+    
+    Se llama como J(x, Y) y devuelve la matriz (m, m) con J[i, j] = ∂Fi/∂yj.
+    Solo se compilan y evalúan las entradas que no son idénticamente cero;
+    su posición queda en patron, de modo que los sistemas grandes y poco
+    acoplados pueden usar J.dispersa(x, Y) y una factorización dispersa.
+    
+    Se obtiene con compilar_jacobiano, que lo guarda en caché.
+    """
+    
+    def __init__(self, componentes, variables: Tuple[str, ...]):
+        from sympy import lambdify
+        
+        componentes = list(componentes)
+        simbolos = symbols(list(variables))
+        self.m = len(componentes)
+        
+        # Solo se deriva respecto de las variables que aparecen en cada
+        # componente: en sistemas poco acoplados casi todo el jacobiano es cero
+        entradas = {}
+        for i, componente in enumerate(componentes):
+            libres = componente.free_symbols
+            for j, simbolo in enumerate(simbolos[1:self.m + 1]):
+                if simbolo in libres:
+                    derivada = diff(componente, simbolo)
+                    if derivada != 0:
+                        entradas[(i, j)] = derivada
+        
+        self.patron = np.zeros((self.m, self.m), dtype=bool)
+        for i, j in entradas:
+            self.patron[i, j] = True
+        self.filas, self.columnas = np.nonzero(self.patron)
+        self.expresiones = [['0'] * self.m for _ in range(self.m)]
+        for (i, j), derivada in entradas.items():
+            self.expresiones[i][j] = str(derivada)
+        
+        valores = [entradas[(i, j)] for i, j in zip(self.filas, self.columnas)]
+        self._entradas = lambdify(simbolos, TuplaSympy(*valores), 'numpy')
+        derivadas_x = [diff(c, simbolos[0]) if simbolos[0] in c.free_symbols else 0 for c in componentes]
+        self._derivada_x = lambdify(simbolos, TuplaSympy(*derivadas_x), 'numpy')
+    
+    @property
+    def densidad(self) -> float:
+        """Fracción de entradas estructuralmente no nulas"""
+        return len(self.filas) / self.m ** 2 if self.m else 0.0
+    
+    @property
+    def conviene_dispersa(self) -> bool:
+        """Si la factorización dispersa es preferible a la densa"""
+        return self.m >= 50 and self.densidad <= 0.1
+    
+    def _valores(self, x, Y):
+        return np.array(self._entradas(x, *Y), dtype=float).reshape(-1)
+    
+    def __call__(self, x, Y) -> np.ndarray:
+        J = np.zeros((self.m, self.m))
+        J[self.filas, self.columnas] = self._valores(x, Y)
+        return J
+    
+    def dispersa(self, x, Y):
+        """Jacobiano como matriz scipy.sparse en formato CSR"""
+        from scipy.sparse import csr_matrix
+        
+        return csr_matrix((self._valores(x, Y), (self.filas, self.columnas)), shape=(self.m, self.m))
+    
+    def derivada_x(self, x, Y) -> np.ndarray:
+        """Derivada parcial ∂F/∂x, de forma (m,)"""
+        return np.array(np.broadcast_arrays(*self._derivada_x(x, *Y), x)[:-1], dtype=float).reshape(-1)
+
+
+def _construir_jacobiano(fuente: str, variables: Tuple[str, ...]) -> JacobianoCompilado:
+    return JacobianoCompilado(_analizar_expresion(fuente, variables), variables)
+
+
+_cache_jacobianos = _CacheExpresiones(capacidad=64, constructor=_construir_jacobiano)
+
+
+def compilar_jacobiano(f_exprs: List[str]) -> JacobianoCompilado:
+    """
+    Compila (o toma de la caché) el jacobiano simbólico de un sistema.
+    
+    Las derivadas se obtienen con sympy a partir del mismo árbol que usa
+    _compilar_sistema, así que no se necesitan m evaluaciones extra de F
+    por diferencias finitas.
+    
+    Args:
+        f_exprs: Lista de funciones como strings (ej: ['y2', '-y1'])
+    
+    Returns:
+        JacobianoCompilado, invocable como J(x, Y) -> ndarray (m, m)
+    """
+    fuente, variables = _fuente_sistema(f_exprs)
+    return _cache_jacobianos.obtener(fuente, variables)
+
+
+def _factorizar_iteracion(jacobiano, c: float):
+    """
+    Factoriza LU la matriz de iteración I - c*J de los métodos implícitos.
+    
+    Acepta un jacobiano denso o disperso (scipy.sparse).
+    
+    Returns:
+        Función resolver(b) que devuelve la solución de (I - c*J) x = b
+    """
+    from scipy import sparse
+    
+    if sparse.issparse(jacobiano):
+        from scipy.sparse.linalg import splu
+        
+        return splu(sparse.csc_matrix(sparse.identity(jacobiano.shape[0]) - c * jacobiano)).solve
+    
+    from scipy.linalg import lu_factor, lu_solve
+    
+    lu = lu_factor(np.eye(len(jacobiano)) - c * jacobiano)
+    return lambda b: lu_solve(lu, b)
+
+
+def _thomas(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Resuelve un sistema tridiagonal con el algoritmo de Thomas en O(n).
+    
+    a es la subdiagonal (n - 1), b la diagonal (n), c la superdiagonal
+    (n - 1) y d el término independiente (n). No hay pivoteo: se espera una
+    matriz diagonalmente dominante, como las de diferencias finitas.
+    """
+    n = len(b)
+    c_prima = np.empty(max(n - 1, 0))
+    d_prima = np.empty(n)
+    
+    pivote = b[0]
+    for i in range(n):
+        if abs(pivote) < 1e-14:
+            raise ValueError(f"Matriz singular o mal condicionada (pivote cercano a cero en la fila {i})")
+        if i < n - 1:
+            c_prima[i] = c[i] / pivote
+        d_prima[i] = (d[i] - (a[i - 1] * d_prima[i - 1] if i else 0.0)) / pivote
+        if i < n - 1:
+            pivote = b[i + 1] - a[i] * c_prima[i]
+    
+    x = np.empty(n)
+    x[-1] = d_prima[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = d_prima[i] - c_prima[i] * x[i + 1]
+    return x
+
+
+class _SerieTaylorAD:
+    """
+    Coeficientes de Taylor de la solución de dY/dx = F(x, Y) por
+    diferenciación automática en modo Taylor.
+    
+    La expresión sympy se traduce una vez a un grafo de operaciones sobre
+    series truncadas (suma, producto, división, potencia, exp, log, seno y
+    coseno, ...); los subárboles repetidos comparten un solo nodo. El
+    coeficiente k de cada nodo se obtiene con recurrencias a partir de los
+    coeficientes 0..k de sus argumentos, y el de la solución con
+    y_{k+1} = F_k / (k + 1). El costo crece con el cuadrado del orden, no
+    exponencialmente como las derivadas totales simbólicas.
+    """
+    
+    def __init__(self, componentes, variables: Tuple[str, ...]):
+        from sympy import Symbol
+        
+        self.m = len(variables) - 1
+        self._indices = {Symbol(nombre): i for i, nombre in enumerate(variables)}
+        self._operaciones = [('variable', (), None)] * len(variables)
+        self.salidas = [self._nodo(c) for c in componentes]
+    
+    def _agregar(self, expr, tipo: str, argumentos: tuple, dato=None) -> int:
+        self._operaciones.append((tipo, argumentos, dato))
+        if expr is not None:
+            self._indices[expr] = len(self._operaciones) - 1
+        return len(self._operaciones) - 1
+    
+    def _nodo(self, expr) -> int:
+        """Índice del nodo que calcula expr, creándolo si no existe"""
+        from sympy import (S, Add, Mul, Pow, exp as s_exp, log as s_log, sin as s_sin, cos as s_cos,
+                           tan as s_tan, sinh as s_sinh, cosh as s_cosh, tanh as s_tanh)
+        
+        if expr in self._indices:
+            return self._indices[expr]
+        
+        if expr.is_number:
+            return self._agregar(expr, 'constante', (), float(expr))
+        
+        if isinstance(expr, Add):
+            return self._agregar(expr, 'suma', tuple(self._nodo(a) for a in expr.args))
+        
+        if isinstance(expr, Mul):
+            coeficiente, resto = expr.as_coeff_Mul()
+            if coeficiente != 1:
+                return self._agregar(expr, 'escala', (self._nodo(resto),), float(coeficiente))
+            factores = [self._nodo(a) for a in expr.args]
+            nodo = factores[0]
+            for factor in factores[1:]:
+                nodo = self._agregar(None, 'producto', (nodo, factor))
+            self._indices[expr] = nodo
+            return nodo
+        
+        if isinstance(expr, Pow):
+            base, exponente = expr.args
+            if exponente.is_Integer and exponente != 0:
+                # Potencia entera por productos: no divide entre la base (que puede ser 0)
+                nodo = self._potencia_entera(self._nodo(base), abs(int(exponente)))
+                if exponente < 0:
+                    nodo = self._agregar(None, 'division', (self._nodo(S.One), nodo))
+                self._indices[expr] = nodo
+                return nodo
+            if exponente.is_number:
+                return self._agregar(expr, 'potencia', (self._nodo(base),), float(exponente))
+            # a**b = exp(b*log(a))
+            logaritmo = self._agregar(None, 'log', (self._nodo(base),))
+            producto = self._agregar(None, 'producto', (self._nodo(exponente), logaritmo))
+            return self._agregar(expr, 'exp', (producto,))
+        
+        if isinstance(expr, s_exp):
+            return self._agregar(expr, 'exp', (self._nodo(expr.args[0]),))
+        
+        if isinstance(expr, s_log):
+            return self._agregar(expr, 'log', (self._nodo(expr.args[0]),))
+        
+        if isinstance(expr, (s_sin, s_cos, s_tan)):
+            seno, coseno = self._par(expr.args[0], s_sin, s_cos, 'sin', 'cos')
+            if isinstance(expr, s_tan):
+                return self._agregar(expr, 'division', (seno, coseno))
+            return seno if isinstance(expr, s_sin) else coseno
+        
+        if isinstance(expr, (s_sinh, s_cosh, s_tanh)):
+            seno, coseno = self._par(expr.args[0], s_sinh, s_cosh, 'sinh', 'cosh')
+            if isinstance(expr, s_tanh):
+                return self._agregar(expr, 'division', (seno, coseno))
+            return seno if isinstance(expr, s_sinh) else coseno
+        
+        raise ValueError(f"Función no soportada por la serie de Taylor: {expr.func.__name__}")
+    
+    def _potencia_entera(self, base: int, n: int) -> int:
+        """Nodo de base**n (n >= 1) por elevación al cuadrado"""
+        resultado = None
+        while n:
+            if n & 1:
+                resultado = base if resultado is None else self._agregar(None, 'producto', (resultado, base))
+            n >>= 1
+            if n:
+                base = self._agregar(None, 'producto', (base, base))
+        return resultado
+    
+    def _par(self, argumento, func_seno, func_coseno, tipo_seno: str, tipo_coseno: str):
+        """Nodos de seno y coseno (o sus versiones hiperbólicas) de un mismo argumento"""
+        seno, coseno = func_seno(argumento), func_coseno(argumento)
+        if seno not in self._indices:
+            a = self._nodo(argumento)
+            i = len(self._operaciones)
+            self._agregar(seno, tipo_seno, (a,), i + 1)
+            self._agregar(coseno, tipo_coseno, (a,), i)
+        return self._indices[seno], self._indices[coseno]
+    
+    def coeficientes(self, x0: float, y0: np.ndarray, orden: int) -> np.ndarray:
+        """
+        Coeficientes de Taylor de la solución que pasa por (x0, y0).
+        
+        Returns:
+            Matriz (m, orden + 1) con Y(x0 + t) = sum(C[:, k] * t**k)
+        """
+        m = self.m
+        C = np.zeros((len(self._operaciones), orden + 1))
+        C[0, 0] = x0
+        if orden >= 1:
+            C[0, 1] = 1.0
+        C[1:m + 1, 0] = y0
+        
+        operaciones = self._operaciones[m + 1:]
+        for k in range(orden):
+            for i, (tipo, args, dato) in enumerate(operaciones, m + 1):
+                if tipo == 'constante':
+                    if k == 0:
+                        C[i, 0] = dato
+                elif tipo == 'suma':
+                    C[i, k] = C[list(args), k].sum()
+                elif tipo == 'escala':
+                    C[i, k] = dato * C[args[0], k]
+                elif tipo == 'producto':
+                    C[i, k] = np.dot(C[args[0], :k + 1], C[args[1], k::-1])
+                elif tipo == 'division':
+                    a, b = args
+                    C[i, k] = (C[a, k] - np.dot(C[i, :k], C[b, k:0:-1])) / C[b, 0]
+                else:
+                    a = args[0]
+                    if k == 0:
+                        C[i, 0] = _FUNCIONES_SERIE[tipo](C[a, 0], dato)
+                        continue
+                    j = np.arange(1, k + 1)
+                    if tipo == 'potencia':
+                        # c_k = sum_{j<k} (alfa*(k - j) - j) a_{k-j} c_j / (k a_0)
+                        jj = np.arange(k)
+                        C[i, k] = np.dot((dato * (k - jj) - jj) * C[a, k:0:-1], C[i, :k]) / (k * C[a, 0])
+                    elif tipo == 'exp':
+                        C[i, k] = np.dot(j * C[a, 1:k + 1], C[i, k - 1::-1]) / k
+                    elif tipo == 'log':
+                        C[i, k] = (C[a, k] - np.dot(j[:-1] * C[i, 1:k], C[a, k - 1:0:-1]) / k) / C[a, 0]
+                    elif tipo in ('sin', 'sinh', 'cosh'):
+                        C[i, k] = np.dot(j * C[a, 1:k + 1], C[dato, k - 1::-1]) / k
+                    else:  # cos
+                        C[i, k] = -np.dot(j * C[a, 1:k + 1], C[dato, k - 1::-1]) / k
+        
+            C[1:m + 1, k + 1] = C[self.salidas, k] / (k + 1)
+        
+        return C[1:m + 1]
+
+
+# Valor de orden cero de cada función elemental de la serie: f(a_0, dato)
+_FUNCIONES_SERIE = {
+    'potencia': lambda a, alfa: a ** alfa,
+    'exp': lambda a, _: np.exp(a),
+    'log': lambda a, _: np.log(a),
+    'sin': lambda a, _: np.sin(a),
+    'cos': lambda a, _: np.cos(a),
+    'sinh': lambda a, _: np.sinh(a),
+    'cosh': lambda a, _: np.cosh(a)
+}
+
+
+def _construir_serie(fuente: str, variables: Tuple[str, ...]) -> _SerieTaylorAD:
+    return _SerieTaylorAD(_analizar_expresion(fuente, variables), variables)
+
+
+_cache_series = _CacheExpresiones(capacidad=64, constructor=_construir_serie)
+
+
+def _compilar_serie_taylor(f_exprs: List[str]) -> _SerieTaylorAD:
+    """Grafo de diferenciación automática de un sistema, tomado de la caché"""
+    fuente, variables = _fuente_sistema(f_exprs)
+    return _cache_series.obtener(fuente, variables)
+
+
+def _construir_newton(fuente: str, variables: Tuple[str, ...]):
+    """
+    Compila f y f' de Newton-Raphson en una sola función.
+    
+    fuente es la expresión de f, o '(f, df)' cuando la derivada viene del
+    usuario; si falta, f' se obtiene con sympy. lambdify con cse=True evalúa
+    una sola vez las subexpresiones que comparten f y f'.
+    
+    Returns:
+        Tupla (expresión sympy de f', función numérica x -> (f, f'))
+    """
+    from sympy import lambdify
+    
+    expr = _analizar_expresion(fuente, variables)
+    if isinstance(expr, TuplaSympy):
+        if len(expr) != 2:
+            raise ValueError(f"Expresión inválida '{fuente}'")
+        f, df = expr
+    else:
+        f, df = expr, _derivar(expr, variables[0], variables)
+    return df, lambdify(symbols(list(variables)), TuplaSympy(f, df), 'numpy', cse=True)
+
+
+_cache_newton = _CacheExpresiones(capacidad=64, constructor=_construir_newton)
+
+
+def _construir_parciales_frontera(fuente: str, variables: Tuple[str, ...]):
+    """
+    Compila (df/dy, df/dy') de y'' = f(x, y1, y2) para diferencias finitas.
+    
+    Las parciales se derivan con variables reales y se pasan a lambdify
+    como expresiones sympy, sin volver a analizarlas desde un string.
+    """
+    from sympy import lambdify
+    
+    expr = _analizar_expresion(fuente, variables)[0]
+    parciales = TuplaSympy(_derivar(expr, 'y1', variables), _derivar(expr, 'y2', variables))
+    return lambdify(symbols(list(variables)), parciales, 'numpy', cse=True)
+
+
+_cache_parciales_frontera = _CacheExpresiones(capacidad=64, constructor=_construir_parciales_frontera)
+
+
+# ================== PASOS DE INTEGRACIÓN ==================
+# Cada paso avanza y (float, vector o matriz de trayectorias) de x a x + h.
+
+def _paso_euler(f, x, y, h):
+    """Un paso del método de Euler"""
+    return y + h * f(x, y)
+
+
+def _paso_rk3(f, x, y, h):
+    """Un paso de Runge-Kutta orden 3"""
+    k1 = f(x, y)
+    k2 = f(x + h/2, y + h/2 * k1)
+    k3 = f(x + h, y - h * k1 + 2 * h * k2)
+    return y + (h / 6) * (k1 + 4 * k2 + k3)
+
+
+def _paso_rk4(f, x, y, h):
+    """Un paso de Runge-Kutta orden 4"""
+    k1 = f(x, y)
+    k2 = f(x + h/2, y + h/2 * k1)
+    k3 = f(x + h/2, y + h/2 * k2)
+    k4 = f(x + h, y + h * k3)
+    return y + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
+
+
+def _paso_taylor(nucleo, x, y, h):
+    """Un paso de Taylor; nucleo(x, y) devuelve (f, f', f'', ...) en una sola llamada"""
+    valores = nucleo(x, y)
+    # Horner: h*(f + h/2*(f' + h/3*(f'' + ...)))
+    incremento = 0.0
+    for k in range(len(valores), 0, -1):
+        incremento = h / k * (valores[k - 1] + incremento)
+    return y + incremento
+
+
+# Tabla de Butcher de Runge-Kutta-Fehlberg 4(5)
+_RKF45_C = [0, 1/4, 3/8, 12/13, 1, 1/2]
+_RKF45_A = [[], [1/4], [3/32, 9/32], [1932/2197, -7200/2197, 7296/2197],
+            [439/216, -8, 3680/513, -845/4104], [-8/27, 2, -3544/2565, 1859/4104, -11/40]]
+_RKF45_B5 = [16/135, 0, 6656/12825, 28561/56430, -9/50, 2/55]
+_RKF45_B4 = [25/216, 0, 1408/2565, 2197/4104, -1/5, 0]
+
+
+def _paso_rkf45(f, x, y, h):
+    """
+    Un paso de Runge-Kutta-Fehlberg.
+    
+    Returns:
+        Tupla (y de orden 5, estimación del error local = y5 - y4)
+    """
+    K = []
+    for j in range(6):
+        y_temp = y + h * sum(a_jk * K[k] for k, a_jk in enumerate(_RKF45_A[j]))
+        K.append(f(x + _RKF45_C[j] * h, y_temp))
+    y5 = y + h * sum(b * k for b, k in zip(_RKF45_B5, K))
+    error = h * sum((b5 - b4) * k for b5, b4, k in zip(_RKF45_B5, _RKF45_B4, K))
+    return y5, error
+
+
+def _factor_paso_pi(error_norm: float, error_previo: float, orden: int,
+                    seguridad: float = 0.9, factor_min: float = 0.2, factor_max: float = 5.0) -> float:
+    """
+    Factor de cambio del paso de un controlador PI (Gustafsson).
+    
+    Args:
+        error_norm: Error local del paso actual dividido entre la tolerancia
+        error_previo: Error normalizado del último paso aceptado (None si el
+                      paso actual fue rechazado: se usa solo el término I)
+        orden: Orden del estimador de error (p + 1)
+    
+    Returns:
+        Factor por el que se multiplica h
+    """
+    if error_norm == 0:
+        return factor_max
+    if error_previo is None:
+        return min(1.0, max(factor_min, seguridad * error_norm ** (-1.0 / orden)))
+    factor = seguridad * error_norm ** (-0.7 / orden) * error_previo ** (0.4 / orden)
+    return min(factor_max, max(factor_min, factor))
+
+
+# Tabla de Butcher de Dormand-Prince 5(4) (FSAL: la última etapa es f en el nuevo punto)
+_DOPRI_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_DOPRI_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]
+]
+_DOPRI_B5 = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+_DOPRI_B4 = np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+# Interpolante continuo de orden 4: y(x + t*h) = y + h * K^T @ P @ [t, t^2, t^3, t^4]
+_DOPRI_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423]
+])
+
+
+def _paso_inicial(F, x0: float, y: np.ndarray, f0: np.ndarray, xf: float, tolerancia: float,
+                  orden: int) -> float:
+    """Paso inicial de Hairer, Nørsett y Wanner para un método del orden dado (una evaluación de F)"""
+    direccion = 1.0 if xf >= x0 else -1.0
+    escala = tolerancia * (1.0 + np.abs(y))
+    d0 = np.max(np.abs(y) / escala)
+    d1 = np.max(np.abs(f0) / escala)
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h0 = min(h0, abs(xf - x0))
+    f1 = F(x0 + direccion * h0, y + direccion * h0 * f0)
+    d2 = np.max(np.abs(f1 - f0) / escala) / h0
+    h1 = max(1e-6, h0 * 1e-3) if max(d1, d2) <= 1e-15 else (0.01 / max(d1, d2)) ** (1 / orden)
+    return direccion * min(100 * h0, h1, abs(xf - x0))
+
+
+def _integrar_dormand_prince(F, x0: float, y0: np.ndarray, xf: float, tolerancia: float,
+                             x_salida: np.ndarray = None, max_pasos: int = 100000):
+    """
+    Integra dY/dx = F(x, Y) con Dormand-Prince 5(4) de paso adaptativo.
+    
+    La última etapa de cada paso es F en el nuevo punto y se reutiliza como
+    primera etapa del siguiente (FSAL), por lo que cada paso aceptado cuesta
+    6 evaluaciones. Si se dan x_salida, la solución se evalúa en esos puntos
+    con el interpolante continuo de cada paso, sin forzar pasos pequeños.
+    
+    Returns:
+        Tupla (x, Y de forma (len(x), m), estadísticas)
+    """
+    if tolerancia <= 0:
+        raise ValueError("La tolerancia debe ser positiva")
+    
+    direccion = 1.0 if xf >= x0 else -1.0
+    y = np.array(y0, dtype=float)
+    k = np.empty((7,) + y.shape)
+    k[0] = F(x0, y)
+    h = _paso_inicial(F, x0, y, k[0], xf, tolerancia, 5)
+    evaluaciones = 2
+    
+    if x_salida is not None:
+        x_salida = np.asarray(x_salida, dtype=float)
+        orden_salida = np.argsort(direccion * x_salida)
+        Y_salida = np.empty((len(x_salida),) + y.shape)
+        siguiente = 0
+        # Puntos de salida en x0 (o antes del primer paso) toman el valor inicial
+        while siguiente < len(x_salida) and direccion * (x_salida[orden_salida[siguiente]] - x0) <= 0:
+            Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+    
+    xs = [x0]
+    Ys = [y.copy()]
+    x = x0
+    aceptados = 0
+    rechazados = 0
+    error_previo = 1.0
+    
+    while direccion * (xf - x) > 0:
+        if aceptados + rechazados >= max_pasos:
+            raise ValueError(f"Se alcanzó el máximo de {max_pasos} pasos sin llegar a xf")
+        
+        if direccion * (x + h - xf) > 0:
+            h = xf - x
+        
+        for j in range(1, 7):
+            y_temp = y + h * sum(a_jl * k[l] for l, a_jl in enumerate(_DOPRI_A[j]) if a_jl)
+            k[j] = F(x + _DOPRI_C[j] * h, y_temp)
+        evaluaciones += 6
+        
+        y_new = y_temp  # la etapa 7 se evalúa en la solución de orden 5
+        error = h * np.tensordot(_DOPRI_B5 - _DOPRI_B4, k, axes=1)
+        escala = tolerancia * np.maximum(1.0, np.maximum(np.abs(y), np.abs(y_new)))
+        error_norm = float(np.max(np.abs(error) / escala))
+        
+        if error_norm <= 1.0:
+            x_new = xf if abs(xf - (x + h)) <= 1e-12 * max(1.0, abs(xf)) else x + h
+        
+            if x_salida is not None:
+                # Interpolante continuo para los puntos de salida dentro del paso
+                Q = np.tensordot(k, _DOPRI_P, axes=([0], [0]))  # forma y.shape + (4,)
+                while siguiente < len(x_salida) and direccion * (x_salida[orden_salida[siguiente]] - x_new) <= 0:
+                    t = (x_salida[orden_salida[siguiente]] - x) / h
+                    Y_salida[orden_salida[siguiente]] = y + h * (Q @ np.array([t, t**2, t**3, t**4]))
+                    siguiente += 1
+            else:
+                xs.append(x_new)
+                Ys.append(y_new.copy())
+        
+            x = x_new
+            y = y_new
+            k[0] = k[6]
+            aceptados += 1
+            h *= _factor_paso_pi(error_norm, error_previo, 5)
+            error_previo = max(error_norm, 1e-4)
+        else:
+            rechazados += 1
+            h *= _factor_paso_pi(error_norm, None, 5)
+    
+    estadisticas = {
+        'pasos_aceptados': aceptados,
+        'pasos_rechazados': rechazados,
+        'evaluaciones': evaluaciones
+    }
+    
+    if x_salida is not None:
+        # Puntos más allá de xf (por redondeo) toman el valor final
+        while siguiente < len(x_salida):
+            Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+        return x_salida, Y_salida, estadisticas
+    
+    return np.array(xs), np.array(Ys), estadisticas
+
+
+# Subdivisiones del punto medio para cada fila de la extrapolación (Deuflhard)
+_BS_SUBPASOS = np.array([2, 4, 6, 8, 10, 12, 14, 16, 18])
+
+
+def _punto_medio_modificado(F, x: float, y: np.ndarray, f0: np.ndarray, H: float, pasos: int) -> np.ndarray:
+    """Regla del punto medio de Gragg con n subpasos y suavizado final (n evaluaciones de F)"""
+    h = H / pasos
+    z_previo = y
+    z = y + h * f0
+    for i in range(1, pasos):
+        z_previo, z = z, z_previo + 2 * h * F(x + i * h, z)
+    return 0.5 * (z + z_previo + h * F(x + H, z))
+
+
+def _integrar_bulirsch_stoer(F, x0: float, y0: np.ndarray, xf: float, tolerancia: float,
+                             x_salida: np.ndarray = None, max_pasos: int = 100000):
+    """
+    Integra dY/dx = F(x, Y) con el método de Bulirsch-Stoer.
+    
+    Cada paso H aplica la regla del punto medio modificada con 2, 4, 6, ...
+    subpasos y extrapola los resultados a H -> 0 con el esquema de Aitken-
+    Neville en H^2; la columna k del tablero tiene orden 2k. El orden y el
+    paso se eligen minimizando el trabajo por unidad de x (Hairer, Nørsett y
+    Wanner). Los puntos de salida se alcanzan acortando el paso que los
+    contiene, así que se obtienen con la precisión del método.
+    
+    Returns:
+        Tupla (x, Y de forma (len(x), m), estadísticas)
+    """
+    if tolerancia <= 0:
+        raise ValueError("La tolerancia debe ser positiva")
+    
+    k_max = len(_BS_SUBPASOS) - 1
+    trabajo = 1.0 + np.cumsum(_BS_SUBPASOS)      # evaluaciones para llegar a la fila j
+    
+    direccion = 1.0 if xf >= x0 else -1.0
+    y = np.array(y0, dtype=float)
+    f0 = F(x0, y)
+    H = _paso_inicial(F, x0, y, f0, xf, tolerancia, 5)
+    evaluaciones = 2
+    k_objetivo = int(min(k_max - 1, max(2, -np.log10(tolerancia + 1e-40) * 0.6 + 1.5)))
+    
+    if x_salida is not None:
+        x_salida = np.asarray(x_salida, dtype=float)
+        orden_salida = np.argsort(direccion * x_salida)
+        objetivos = x_salida[orden_salida]
+        Y_salida = np.empty((len(x_salida),) + y.shape)
+    else:
+        objetivos = np.array([xf])
+    siguiente = 0
+    while siguiente < len(objetivos) and direccion * (objetivos[siguiente] - x0) <= 0:
+        if x_salida is not None:
+            Y_salida[orden_salida[siguiente]] = y
+        siguiente += 1
+    
+    xs = [x0]
+    Ys = [y.copy()]
+    x = x0
+    aceptados = 0
+    rechazados = 0
+    
+    while direccion * (xf - x) > 0:
+        if aceptados + rechazados >= max_pasos:
+            raise ValueError(f"Se alcanzó el máximo de {max_pasos} pasos sin llegar a xf")
+        
+        # Acortar el paso para caer exactamente en el siguiente punto de salida
+        destino = objetivos[siguiente] if siguiente < len(objetivos) else xf
+        H_libre = H
+        recortado = direccion * (x + H - destino) >= 0
+        if recortado:
+            H = destino - x
+        
+        T = []
+        H_filas = np.zeros(k_max + 1)
+        error_norm = np.inf
+        aceptado = False
+        for j in range(k_max + 1):
+            fila = [_punto_medio_modificado(F, x, y, f0, H, int(_BS_SUBPASOS[j]))]
+            evaluaciones += int(_BS_SUBPASOS[j])
+            for c in range(1, j + 1):
+                razon = (_BS_SUBPASOS[j] / _BS_SUBPASOS[j - c]) ** 2 - 1.0
+                fila.append(fila[c - 1] + (fila[c - 1] - T[j - 1][c - 1]) / razon)
+            T.append(fila)
+            if j == 0:
+                continue
+        
+            escala = tolerancia * np.maximum(1.0, np.maximum(np.abs(y), np.abs(fila[j])))
+            error_norm = float(np.max(np.abs(fila[j] - fila[j - 1]) / escala))
+            if not np.isfinite(error_norm):
+                error_norm = np.inf
+                break
+            factor = 0.94 * (0.65 / max(error_norm, 1e-12)) ** (1.0 / (2 * j + 1))
+            H_filas[j] = H * min(4.0, max(0.02, factor))
+        
+            if j >= k_objetivo - 1 and error_norm <= 1.0:
+                aceptado = True
+                break
+            if j >= k_objetivo + 1:
+                break
+        
+        if not aceptado:
+            rechazados += 1
+            H = H_filas[j] if H_filas[j] else H * 0.25
+            k_objetivo = max(2, min(k_objetivo, j - 1))
+            continue
+        
+        x_new = destino if recortado else x + H
+        y = T[j][j]
+        x = x_new
+        f0 = F(x, y)
+        evaluaciones += 1
+        aceptados += 1
+        
+        if recortado and siguiente < len(objetivos):
+            if x_salida is not None:
+                Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+        if x_salida is None:
+            xs.append(x)
+            Ys.append(y.copy())
+        
+        # Orden y paso siguientes: la fila con menor trabajo por unidad de x
+        k_objetivo = j
+        trabajo_j = trabajo[j] / abs(H_filas[j])
+        if j > 1 and trabajo[j - 1] / abs(H_filas[j - 1]) < 0.8 * trabajo_j:
+            k_objetivo = j - 1
+            H = H_filas[j - 1]
+        elif j < k_max - 1 and (j == 1 or trabajo[j] / abs(H_filas[j]) < 0.9 * trabajo[j - 1] / abs(H_filas[j - 1])):
+            # Con j == 1 no hay paso estimado para la fila 0: se sube el orden
+            k_objetivo = j + 1
+            H = H_filas[j] * trabajo[j + 1] / trabajo[j]
+        else:
+            H = H_filas[j]
+        if recortado:
+            H = direccion * max(abs(H), abs(H_libre))
+    
+    estadisticas = {
+        'pasos_aceptados': aceptados,
+        'pasos_rechazados': rechazados,
+        'evaluaciones': evaluaciones,
+        'orden_final': 2 * k_objetivo
+    }
+    
+    if x_salida is not None:
+        while siguiente < len(objetivos):
+            Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+        return x_salida, Y_salida, estadisticas
+    
+    return np.array(xs), np.array(Ys), estadisticas
+
+
+# Coeficientes de Adams-Bashforth: y_{n+1} = y_n + h * sum(b_j * f_{n-j})
+_ADAMS_BASHFORTH = {
+    1: np.array([1.0]),
+    2: np.array([3, -1]) / 2,
+    3: np.array([23, -16, 5]) / 12,
+    4: np.array([55, -59, 37, -9]) / 24,
+    5: np.array([1901, -2774, 2616, -1274, 251]) / 720,
+    6: np.array([4277, -7923, 9982, -7298, 2877, -475]) / 1440
+}
+# Coeficientes de Adams-Moulton: y_{n+1} = y_n + h * (b_0 * f_{n+1} + sum(b_j * f_{n+1-j}))
+_ADAMS_MOULTON = {
+    1: np.array([1.0]),
+    2: np.array([1, 1]) / 2,
+    3: np.array([5, 8, -1]) / 12,
+    4: np.array([9, 19, -5, 1]) / 24,
+    5: np.array([251, 646, -264, 106, -19]) / 720,
+    6: np.array([475, 1427, -798, 482, -173, 27]) / 1440
+}
+
+
+def _pesos_anillo(coeficientes: np.ndarray, k: int) -> np.ndarray:
+    """
+    Pesos de una combinación lineal sobre un anillo de k filas.
+    
+    La fila c del resultado aplica coeficientes[j] a la fila (c - j) % k, así
+    que pesos[cabeza] @ anillo combina los valores más recientes sin rotar
+    ni copiar el anillo.
+    """
+    pesos = np.zeros((k, k))
+    for c in range(k):
+        for j, b in enumerate(coeficientes):
+            pesos[c, (c - j) % k] = b
+    return pesos
+
+
+def _integrar_adams(F, x0: float, y0: np.ndarray, xf: float, n: int, orden: int,
+                    corrector: bool = False, tolerancia: float = 1e-10, max_iteraciones: int = 10,
+                    salida: dict = None):
+    """
+    Integra dY/dx = F(x, Y) con Adams-Bashforth de paso fijo o, con
+    corrector, con el par predictor-corrector Adams-Bashforth-Moulton.
+    
+    Los primeros orden - 1 pasos se dan con RK4. Los valores de F de los
+    últimos orden puntos viven en un anillo NumPy de tamaño fijo, de modo que
+    cada paso agrega una fila sin desplazar la historia. El corrector se itera
+    hasta que el cambio relativo es menor que la tolerancia. Solo se guardan
+    los puntos que pide salida (ver _Muestreo).
+    
+    Returns:
+        Tupla (x, Y de forma (puntos, m), estadísticas)
+    """
+    h = (xf - x0) / n
+    muestreo = _Muestreo(salida, x0, xf, n, F)
+    y = np.array(y0, dtype=float)
+    muestreo.registrar(0, x0, y)
+    
+    inicio = orden - 1
+    anillo = np.empty((orden, len(y0)))
+    anillo[0] = F(x0, y)
+    for i in range(inicio):
+        y = _paso_rk4(F, x0 + i * h, y, h)
+        muestreo.registrar(i + 1, x0 + (i + 1) * h, y)
+        anillo[i + 1] = F(x0 + (i + 1) * h, y)
+    cabeza = inicio
+    
+    pesos_predictor = _pesos_anillo(_ADAMS_BASHFORTH[orden], orden)
+    beta = _ADAMS_MOULTON[orden][0]
+    pesos_corrector = _pesos_anillo(_ADAMS_MOULTON[orden][1:], orden)
+    estadisticas = {'evaluaciones': 4 * inicio + inicio + 1, 'iteraciones_corrector': 0,
+                    'pasos_sin_convergencia': 0}
+    
+    for i in range(inicio, n):
+        x_new = x0 + (i + 1) * h
+        y_new = y + h * (pesos_predictor[cabeza] @ anillo)
+        
+        if corrector:
+            base = y + h * (pesos_corrector[cabeza] @ anillo)
+            for _ in range(max_iteraciones):
+                y_corregido = base + h * beta * F(x_new, y_new)
+                estadisticas['evaluaciones'] += 1
+                estadisticas['iteraciones_corrector'] += 1
+                cambio = float(np.max(np.abs(y_corregido - y_new) / np.maximum(1.0, np.abs(y_corregido))))
+                y_new = y_corregido
+                if cambio <= tolerancia:
+                    break
+            else:
+                estadisticas['pasos_sin_convergencia'] += 1
+        
+        if not np.all(np.isfinite(y_new)):
+            raise ValueError(f"La solución diverge en x = {x_new:.6g}; aumente n para reducir el paso")
+        
+        y = y_new
+        muestreo.registrar(i + 1, x_new, y)
+        cabeza = (cabeza + 1) % orden
+        anillo[cabeza] = F(x_new, y)
+        estadisticas['evaluaciones'] += 1
+    
+    if salida:
+        estadisticas.update(muestreo.detalles())
+    return np.array(muestreo.xs), np.array(muestreo.ys), estadisticas
+
+
+# Pesos de composición de Yoshida sobre el paso de Verlet (órdenes 4 y 6)
+_YOSHIDA_4 = [1 / (2 - 2 ** (1 / 3)), -2 ** (1 / 3) / (2 - 2 ** (1 / 3)), 1 / (2 - 2 ** (1 / 3))]
+_YOSHIDA_6_W = [-1.17767998417887, 0.235573213359357, 0.784513610477560]
+_YOSHIDA_6 = _YOSHIDA_6_W[::-1] + [1 - 2 * sum(_YOSHIDA_6_W)] + _YOSHIDA_6_W
+
+# Esquema base (patada-deriva-patada o deriva-patada-deriva) y pesos de composición
+_SIMPLECTICOS = {
+    'verlet': ('kdk', [1.0], 2),
+    'leapfrog': ('dkd', [1.0], 2),
+    'yoshida4': ('kdk', _YOSHIDA_4, 4),
+    'yoshida6': ('kdk', _YOSHIDA_6, 6)
+}
+
+
+def _separar_hamiltoniano(f_exprs: List[str]):
+    """
+    Compila un sistema separable q' = G(v), v' = A(q) en sus dos mitades.
+    
+    Las primeras m/2 ecuaciones son las derivadas de las posiciones
+    (y1..yd) y solo pueden depender de las velocidades; las últimas m/2 son
+    las derivadas de las velocidades (yd+1..ym) y solo pueden depender de
+    las posiciones. Ambas pueden depender de x.
+    
+    Returns:
+        Tupla (G, A) con G(x, v) y A(x, q) -> ndarray de d componentes
+    """
+    m = len(f_exprs)
+    if m == 0 or m % 2:
+        raise ValueError("Un sistema separable necesita pares posición/velocidad (número par de ecuaciones)")
+    d = m // 2
+    variables = _variables_sistema(m)
+    
+    mitades = []
+    for exprs, prohibidas, nombre in ((f_exprs[:d], variables[1:d + 1], 'posiciones'),
+                                      (f_exprs[d:], variables[d + 1:], 'velocidades')):
+        fuente, _ = _fuente_sistema(exprs, m=m)
+        libres = set()
+        for e in _analizar_expresion(fuente, variables):
+            libres |= {str(simbolo) for simbolo in e.free_symbols}
+        if libres & set(prohibidas):
+            raise ValueError(
+                f"El sistema no es separable: las derivadas de las {nombre} dependen de {sorted(libres & set(prohibidas))}"
+            )
+        mitades.append(_compilar_expresion(fuente, variables))
+    
+    g, a = mitades
+    ceros = np.zeros(d)
+    G = lambda x, v: np.array(g(x, *ceros, *v), dtype=float)
+    A = lambda x, q: np.array(a(x, *q, *ceros), dtype=float)
+    return G, A
+
+
+def _integrar_simplectico(G, A, x0: float, y0: np.ndarray, xf: float, n: int, metodo: str,
+                          salida: dict = None):
+    """
+    Integra q' = G(v), v' = A(q) con un método simpléctico de paso fijo.
+    
+    Verlet de velocidades usa patada-deriva-patada y leapfrog
+    deriva-patada-deriva; Yoshida compone pasos de Verlet con pesos w_j.
+    En las composiciones la última patada de un subpaso y la primera del
+    siguiente usan la misma aceleración, que se evalúa una sola vez. Solo se
+    guardan los puntos que pide salida (ver _Muestreo).
+    
+    Returns:
+        Tupla (x, Y de forma (puntos, m), evaluaciones de A, muestreo)
+    """
+    esquema, pesos, _ = _SIMPLECTICOS[metodo]
+    h = (xf - x0) / n
+    d = len(y0) // 2
+    F = lambda x, y: np.concatenate((G(x, y[d:]), A(x, y[:d])))
+    muestreo = _Muestreo(salida, x0, xf, n, F)
+    muestreo.registrar(0, x0, np.array(y0, dtype=float))
+    
+    q = np.array(y0[:d], dtype=float)
+    v = np.array(y0[d:], dtype=float)
+    evaluaciones = 0
+    
+    if esquema == 'kdk':
+        a = A(x0, q)
+        evaluaciones += 1
+    
+    for i in range(n):
+        xi = x0 + i * h
+        for w in pesos:
+            if esquema == 'kdk':
+                v = v + (w * h / 2) * a
+                q = q + (w * h) * G(xi + w * h / 2, v)
+                xi += w * h
+                a = A(xi, q)
+                v = v + (w * h / 2) * a
+            else:
+                q = q + (w * h / 2) * G(xi, v)
+                v = v + (w * h) * A(xi + w * h / 2, q)
+                xi += w * h
+                q = q + (w * h / 2) * G(xi, v)
+            evaluaciones += 1
+        
+        x_new = x0 + (i + 1) * h
+        if not (np.all(np.isfinite(q)) and np.all(np.isfinite(v))):
+            raise ValueError(f"La solución diverge en x = {x_new:.6g}; aumente n para reducir el paso")
+        muestreo.registrar(i + 1, x_new, np.concatenate((q, v)))
+    
+    return np.array(muestreo.xs), np.array(muestreo.ys), evaluaciones, muestreo
+
+
+# Fórmulas BDF de paso constante: y_{n+1} = sum(alfa_j * y_{n+1-j}) + h * beta * f(x_{n+1}, y_{n+1})
+_BDF_COEFICIENTES = {
+    1: ([1.0], 1.0),
+    2: ([4/3, -1/3], 2/3),
+    3: ([18/11, -9/11, 2/11], 6/11),
+    4: ([48/25, -36/25, 16/25, -3/25], 12/25),
+    5: ([300/137, -300/137, 200/137, -75/137, 12/137], 60/137)
+}
+# Extrapolación polinómica al punto siguiente desde los k últimos valores (predictor)
+_BDF_PREDICTOR = {
+    1: [1.0],
+    2: [2.0, -1.0],
+    3: [3.0, -3.0, 1.0],
+    4: [4.0, -6.0, 4.0, -1.0],
+    5: [5.0, -10.0, 10.0, -5.0, 1.0]
+}
+
+
+def _integrar_bdf(F, J, x0: float, y0: np.ndarray, xf: float, n: int, orden: int,
+                  tolerancia: float = 1e-8, max_iteraciones: int = 7, dFdx=None, salida: dict = None):
+    """
+    Integra dY/dx = F(x, Y) con la fórmula BDF de orden dado y paso fijo.
+    
+    Cada paso resuelve el sistema implícito con Newton simplificado: la
+    matriz I - h*beta*J se factoriza LU una vez y se reutiliza en los pasos
+    siguientes. El jacobiano se reevalúa y se refactoriza solo cuando la
+    iteración deja de converger o su tasa de contracción se degrada.
+    
+    Los orden - 1 valores de arranque se obtienen con Rosenbrock 2(3)
+    adaptativo (L-estable, así que sirve también en problemas rígidos) con
+    tolerancia min(tolerancia, h^(orden+1)), de modo que su error no domine
+    el O(h^orden) de la fórmula. Sin dFdx se arranca con órdenes crecientes
+    al paso h, lo que limita la precisión global a O(h^2).
+    
+    Solo se conservan los últimos orden valores y los puntos que pide salida
+    (ver _Muestreo).
+    
+    Returns:
+        Tupla (x, Y de forma (puntos, m), estadísticas)
+    """
+    h = (xf - x0) / n
+    muestreo = _Muestreo(salida, x0, xf, n, F)
+    # recientes[j] es la solución j pasos atrás
+    recientes = [np.array(y0, dtype=float)]
+    muestreo.registrar(0, x0, recientes[0])
+    
+    jacobiano = None
+    lu = None
+    beta_lu = None
+    estadisticas = {'evaluaciones': 0, 'evaluaciones_jacobiano': 0,
+                    'factorizaciones_lu': 0, 'iteraciones_newton': 0}
+    
+    arranque = min(orden - 1, n) if dFdx is not None else 0
+    tolerancia_arranque = max(1e-13, min(tolerancia, abs(h) ** (orden + 1)))
+    for i in range(arranque):
+        _, Y_paso, estadisticas_paso = _integrar_rosenbrock(F, J, dFdx, x0 + i * h, recientes[0],
+                                                            x0 + (i + 1) * h, tolerancia_arranque)
+        recientes.insert(0, Y_paso[-1])
+        muestreo.registrar(i + 1, x0 + (i + 1) * h, recientes[0])
+        for clave in ('evaluaciones', 'evaluaciones_jacobiano', 'factorizaciones_lu'):
+            estadisticas[clave] += estadisticas_paso[clave]
+    estadisticas['pasos_arranque'] = arranque
+    
+    for i in range(arranque, n):
+        k = min(orden, i + 1)
+        alfas, beta = _BDF_COEFICIENTES[k]
+        psi = sum(a * recientes[j] for j, a in enumerate(alfas))
+        y_pred = sum(c * recientes[j] for j, c in enumerate(_BDF_PREDICTOR[k]))
+        x_new = x0 + (i + 1) * h
+        
+        # Primero Newton simplificado con la LU vigente; si no converge, Newton
+        # completo reevaluando el jacobiano en cada iterado
+        for completo in (False, True):
+            if jacobiano is None:
+                jacobiano = J(x0 + i * h, recientes[0])
+                estadisticas['evaluaciones_jacobiano'] += 1
+                lu = None
+        
+            y = y_pred.copy()
+            norma_previa = None
+            tasa = 0.0
+            convergio = False
+            for _ in range(2 * max_iteraciones if completo else max_iteraciones):
+                if completo:
+                    jacobiano = J(x_new, y)
+                    estadisticas['evaluaciones_jacobiano'] += 1
+                    lu = None
+                if lu is None or beta_lu != beta:
+                    lu = _factorizar_iteracion(jacobiano, h * beta)
+                    beta_lu = beta
+                    estadisticas['factorizaciones_lu'] += 1
+        
+                residuo = y - h * beta * F(x_new, y) - psi
+                dy = lu(-residuo)
+                y += dy
+                estadisticas['evaluaciones'] += 1
+                estadisticas['iteraciones_newton'] += 1
+        
+                norma = float(np.max(np.abs(dy) / np.maximum(1.0, np.abs(y))))
+                if not np.isfinite(norma):
+                    break
+                if norma_previa is not None:
+                    tasa = norma / norma_previa if norma_previa > 0 else 0.0
+                    if tasa >= 1.0 and not completo:
+                        break
+                    if tasa < 1.0 and tasa / (1.0 - tasa) * norma <= tolerancia:
+                        convergio = True
+                        break
+                elif norma <= tolerancia:
+                    convergio = True
+                    break
+                norma_previa = norma
+        
+            if convergio:
+                break
+            jacobiano = None
+        else:
+            raise ValueError(f"Newton no converge en x = {x_new:.6g}; aumente n para reducir el paso")
+        
+        # Convergencia lenta: renovar el jacobiano antes del siguiente paso
+        if tasa > 0.5:
+            jacobiano = None
+        
+        recientes.insert(0, y)
+        del recientes[orden:]
+        muestreo.registrar(i + 1, x_new, y)
+    
+    if salida:
+        estadisticas.update(muestreo.detalles())
+    return np.array(muestreo.xs), np.array(muestreo.ys), estadisticas
+
+
+# Constantes del método de Rosenbrock 2(3) de Shampine y Reichelt (ode23s)
+_ROSENBROCK_D = 1 / (2 + np.sqrt(2))
+_ROSENBROCK_E32 = 6 + np.sqrt(2)
+
+
+def _integrar_rosenbrock(F, J, dFdx, x0: float, y0: np.ndarray, xf: float, tolerancia: float,
+                         x_salida: np.ndarray = None, max_pasos: int = 100000):
+    """
+    Integra dY/dx = F(x, Y) con el método de Rosenbrock 2(3) de paso adaptativo.
+    
+    Es linealmente implícito: cada paso factoriza W = I - h*d*J una sola vez
+    y la reutiliza en sus tres etapas, sin iteración de Newton. Si el paso
+    se rechaza, el jacobiano y F en el punto actual se reutilizan y solo se
+    refactoriza W con el nuevo h. La evaluación de F en el nuevo punto se
+    reutiliza como primera etapa del paso siguiente.
+    
+    Returns:
+        Tupla (x, Y de forma (len(x), m), estadísticas)
+    """
+    if tolerancia <= 0:
+        raise ValueError("La tolerancia debe ser positiva")
+    
+    d = _ROSENBROCK_D
+    direccion = 1.0 if xf >= x0 else -1.0
+    y = np.array(y0, dtype=float)
+    
+    F0 = F(x0, y)
+    jacobiano = J(x0, y)
+    T = dFdx(x0, y)
+    estadisticas = {'pasos_aceptados': 0, 'pasos_rechazados': 0, 'evaluaciones': 1,
+                    'evaluaciones_jacobiano': 1, 'factorizaciones_lu': 0}
+    
+    # Paso inicial a partir de la pendiente escalada (como ode23s)
+    tasa = float(np.max(np.abs(F0) / np.maximum(1.0, np.abs(y))))
+    h = abs(xf - x0)
+    if tasa > 0:
+        h = min(h, tolerancia ** (1 / 3) / (1.25 * tasa))
+    h *= direccion
+    
+    if x_salida is not None:
+        x_salida = np.asarray(x_salida, dtype=float)
+        orden_salida = np.argsort(direccion * x_salida)
+        Y_salida = np.empty((len(x_salida),) + y.shape)
+        siguiente = 0
+        while siguiente < len(x_salida) and direccion * (x_salida[orden_salida[siguiente]] - x0) <= 0:
+            Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+    
+    xs = [x0]
+    Ys = [y.copy()]
+    x = x0
+    error_previo = 1.0
+    
+    while direccion * (xf - x) > 0:
+        if estadisticas['pasos_aceptados'] + estadisticas['pasos_rechazados'] >= max_pasos:
+            raise ValueError(f"Se alcanzó el máximo de {max_pasos} pasos sin llegar a xf")
+        if abs(h) <= 1e-14 * max(1.0, abs(x)):
+            raise ValueError(f"El paso se volvió demasiado pequeño en x = {x:.6g}")
+        
+        if direccion * (x + h - xf) > 0:
+            h = xf - x
+        
+        lu = _factorizar_iteracion(jacobiano, h * d)
+        estadisticas['factorizaciones_lu'] += 1
+        
+        k1 = lu(F0 + h * d * T)
+        F1 = F(x + h / 2, y + h / 2 * k1)
+        k2 = lu(F1 - k1) + k1
+        y_new = y + h * k2
+        F2 = F(x + h, y_new)
+        k3 = lu(F2 - _ROSENBROCK_E32 * (k2 - F1) - 2 * (k1 - F0) + h * d * T)
+        estadisticas['evaluaciones'] += 2
+        
+        error = h / 6 * (k1 - 2 * k2 + k3)
+        escala = tolerancia * np.maximum(1.0, np.maximum(np.abs(y), np.abs(y_new)))
+        error_norm = float(np.max(np.abs(error) / escala))
+        if not np.isfinite(error_norm):
+            error_norm = np.inf
+        
+        if error_norm <= 1.0:
+            x_new = xf if abs(xf - (x + h)) <= 1e-12 * max(1.0, abs(xf)) else x + h
+        
+            if x_salida is not None:
+                # Interpolante continuo de orden 2 del método
+                while siguiente < len(x_salida) and direccion * (x_salida[orden_salida[siguiente]] - x_new) <= 0:
+                    t = (x_salida[orden_salida[siguiente]] - x) / h
+                    Y_salida[orden_salida[siguiente]] = y + h * (t * (1 - t) * k1 + t * (t - 2 * d) * k2) / (1 - 2 * d)
+                    siguiente += 1
+            else:
+                xs.append(x_new)
+                Ys.append(y_new.copy())
+        
+            x = x_new
+            y = y_new
+            F0 = F2
+            jacobiano = J(x, y)
+            T = dFdx(x, y)
+            estadisticas['evaluaciones_jacobiano'] += 1
+            estadisticas['pasos_aceptados'] += 1
+            h *= _factor_paso_pi(error_norm, error_previo, 3)
+            error_previo = max(error_norm, 1e-4)
+        else:
+            estadisticas['pasos_rechazados'] += 1
+            h *= _factor_paso_pi(error_norm, None, 3)
+    
+    if x_salida is not None:
+        while siguiente < len(x_salida):
+            Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+        return x_salida, Y_salida, estadisticas
+    
+    return np.array(xs), np.array(Ys), estadisticas
+
+
+def _integrar_serie_taylor(serie: _SerieTaylorAD, x0: float, y0: np.ndarray, xf: float,
+                           tolerancia: float, orden: int = None, x_salida: np.ndarray = None,
+                           max_pasos: int = 100000):
+    """
+    Integra con la serie de Taylor de la solución, con orden y paso de Jorba y Zou.
+    
+    En cada paso se usa la tolerancia mixta eps = tol * max(1, ||y||); el
+    orden sale de ella (p = ceil(1 - ln(eps) / 2)), salvo que se fije orden,
+    y el paso de los dos últimos coeficientes, de modo que el término
+    despreciado quede por debajo de eps. La serie de cada paso es a la vez
+    la salida densa en todo el paso.
+    
+    Returns:
+        Tupla (x, Y de forma (len(x), m), estadísticas)
+    """
+    if tolerancia <= 0:
+        raise ValueError("La tolerancia debe ser positiva")
+    if orden is not None and orden < 2:
+        raise ValueError("El orden de la serie de Taylor debe ser al menos 2")
+    
+    def orden_paso(epsilon: float) -> int:
+        return orden or max(2, int(np.ceil(1 - 0.5 * np.log(epsilon))))
+    
+    direccion = 1.0 if xf >= x0 else -1.0
+    y = np.array(y0, dtype=float)
+    
+    if x_salida is not None:
+        x_salida = np.asarray(x_salida, dtype=float)
+        orden_salida = np.argsort(direccion * x_salida)
+        Y_salida = np.empty((len(x_salida),) + y.shape)
+        siguiente = 0
+        while siguiente < len(x_salida) and direccion * (x_salida[orden_salida[siguiente]] - x0) <= 0:
+            Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+    
+    xs = [x0]
+    Ys = [y.copy()]
+    x = x0
+    pasos = 0
+    h_min = np.inf
+    h_max = 0.0
+    orden_min = orden_max = orden_paso(tolerancia * max(1.0, np.max(np.abs(y))))
+    
+    while direccion * (xf - x) > 0:
+        if pasos >= max_pasos:
+            raise ValueError(f"Se alcanzó el máximo de {max_pasos} pasos sin llegar a xf")
+        
+        epsilon = tolerancia * max(1.0, np.max(np.abs(y)))
+        p = orden_paso(epsilon)
+        
+        with np.errstate(all='ignore'):
+            C = serie.coeficientes(x, y, p)
+        if not np.all(np.isfinite(C)):
+            raise ValueError(f"La serie de Taylor no es finita en x = {x:.6g}")
+        
+        # Radio de convergencia estimado con los dos últimos coeficientes
+        normas = np.max(np.abs(C), axis=0)
+        radio = np.inf
+        for j in (p - 1, p):
+            if normas[j] > 0:
+                radio = min(radio, (epsilon / normas[j]) ** (1.0 / j))
+        h = min(radio * np.exp(-0.7 / (p - 1)), abs(xf - x))
+        if h <= 1e-14 * max(1.0, abs(x)):
+            raise ValueError(f"El paso se volvió demasiado pequeño en x = {x:.6g} (posible singularidad)")
+        h *= direccion
+        
+        x_new = xf if abs(xf - (x + h)) <= 1e-12 * max(1.0, abs(xf)) else x + h
+        
+        # Horner en t = h (y en los puntos de salida del paso)
+        y_new = C[:, p].copy()
+        for k in range(p - 1, -1, -1):
+            y_new = y_new * h + C[:, k]
+        
+        if x_salida is not None:
+            inicio = siguiente
+            while siguiente < len(x_salida) and direccion * (x_salida[orden_salida[siguiente]] - x_new) <= 0:
+                siguiente += 1
+            if siguiente > inicio:
+                indices = orden_salida[inicio:siguiente]
+                t = (x_salida[indices] - x)[:, np.newaxis]
+                valores = np.broadcast_to(C[:, p], (len(indices), len(y))).copy()
+                for k in range(p - 1, -1, -1):
+                    valores = valores * t + C[:, k]
+                Y_salida[indices] = valores
+        else:
+            xs.append(x_new)
+            Ys.append(y_new.copy())
+        
+        x = x_new
+        y = y_new
+        pasos += 1
+        h_min = min(h_min, abs(h))
+        h_max = max(h_max, abs(h))
+        orden_min = min(orden_min, p)
+        orden_max = max(orden_max, p)
+    
+    estadisticas = {
+        'pasos': pasos,
+        'orden': orden_max,
+        'orden_min': orden_min,
+        'h_min': float(h_min) if pasos else 0.0,
+        'h_max': float(h_max)
+    }
+    
+    if x_salida is not None:
+        while siguiente < len(x_salida):
+            Y_salida[orden_salida[siguiente]] = y
+            siguiente += 1
+        return x_salida, Y_salida, estadisticas
+    
+    return np.array(xs), np.array(Ys), estadisticas
+
+
+# ================== EVENTOS ==================
+
+def _hermite(xa, ya, fa, xb, yb, fb, x):
+    """Interpolante cúbico de Hermite entre (xa, ya) y (xb, yb) con pendientes fa y fb"""
+    h = xb - xa
+    t = (x - xa) / h
+    return ((1 + 2*t) * (1 - t)**2 * ya + t * (1 - t)**2 * h * fa
+            + t**2 * (3 - 2*t) * yb + t**2 * (t - 1) * h * fb)
+
+
+def _raiz_illinois(g, a: float, b: float, ga: float, gb: float,
+                   tolerancia: float = 1e-12, max_iteraciones: int = 100) -> float:
+    """
+    Raíz de g en [a, b] (con g(a) y g(b) de signos opuestos) por el método de Illinois.
+    
+    Es una secante con intervalo garantizado: cuando el mismo extremo se
+    conserva dos veces seguidas, su valor se divide entre dos para evitar
+    la convergencia lenta de la falsa posición.
+    """
+    lado = 0
+    c = b
+    for _ in range(max_iteraciones):
+        c = (a * gb - b * ga) / (gb - ga)
+        gc = g(c)
+        if gc == 0 or abs(b - a) <= tolerancia * max(1.0, abs(c)):
+            return c
+        if gc * gb < 0:
+            a, ga = b, gb
+            if lado == -1:
+                ga /= 2
+            lado = -1
+        else:
+            if lado == 1:
+                ga /= 2
+            lado = 1
+        b, gb = c, gc
+    return c
+
+
+def _illinois_lote(f, a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray,
+                   tolerancia: float = 1e-12, max_iteraciones: int = 100):
+    """
+    Método de Illinois aplicado a muchos intervalos [a, b] a la vez.
+    
+    Cada iteración evalúa f una sola vez sobre los puntos de todos los
+    intervalos que siguen activos; un intervalo se retira cuando su estimación
+    cambia menos que la tolerancia o f se anula en ella.
+    
+    Returns:
+        Tupla (raíces, iteraciones, evaluaciones de f)
+    """
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    fa, fb = np.array(fa, dtype=float), np.array(fb, dtype=float)
+    raices = np.where(np.abs(fa) < np.abs(fb), a, b)
+    lado = np.zeros(len(a), dtype=int)
+    activos = np.arange(len(a))
+    evaluaciones = 0
+    iteracion = 0
+    
+    while len(activos) and iteracion < max_iteraciones:
+        iteracion += 1
+        A, B, FA, FB = a[activos], b[activos], fa[activos], fb[activos]
+        c = (A * FB - B * FA) / (FB - FA)
+        fc = np.broadcast_to(f(c), c.shape).astype(float)
+        evaluaciones += len(c)
+        
+        # Illinois: el extremo que se conserva dos veces seguidas se pondera a la mitad
+        cambia_a = fc * FB < 0
+        nuevo_lado = np.where(cambia_a, -1, 1)
+        repetido = nuevo_lado == lado[activos]
+        FA_nuevo = np.where(cambia_a, FB, FA)
+        FA_nuevo = np.where(repetido, FA_nuevo / 2, FA_nuevo)
+        a[activos] = np.where(cambia_a, B, A)
+        fa[activos] = FA_nuevo
+        b[activos], fb[activos] = c, fc
+        lado[activos] = nuevo_lado
+        
+        convergio = (fc == 0) | (np.abs(c - raices[activos]) <= tolerancia * np.maximum(1.0, np.abs(c)))
+        raices[activos] = c
+        activos = activos[~convergio]
+    
+    return raices, iteracion, evaluaciones
+
+
+class _DetectorEventos:
+    """
+    Detección de eventos g(x, Y) = 0 entre pasos consecutivos de un integrador.
+    
+    Cada evento es un string con g o un diccionario
+    {'expr': g, 'terminal': bool, 'direccion': -1 | 0 | 1}. Un cambio de
+    signo de g entre dos pasos se localiza con Illinois sobre el
+    interpolante de Hermite del paso; direccion 1 solo cuenta cruces de
+    negativo a positivo y -1 los de positivo a negativo. Un evento terminal
+    detiene la integración en el punto del cruce.
+    """
+    
+    def __init__(self, eventos: list, m: int):
+        self.exprs = []
+        self.terminales = []
+        self.direcciones = []
+        for evento in eventos:
+            if isinstance(evento, str):
+                evento = {'expr': evento}
+            if not isinstance(evento, dict) or 'expr' not in evento:
+                raise ValueError("Cada evento debe ser un string o un diccionario con 'expr'")
+            direccion = int(evento.get('direccion', 0))
+            if direccion not in (-1, 0, 1):
+                raise ValueError("La dirección de un evento debe ser -1, 0 o 1")
+            self.exprs.append(str(evento['expr']))
+            self.terminales.append(bool(evento.get('terminal', False)))
+            self.direcciones.append(direccion)
+        
+        fuente, variables = _fuente_sistema(self.exprs, m=m)
+        g = _compilar_expresion(fuente, variables)
+        self._G = lambda x, Y: np.array(np.broadcast_arrays(*g(x, *Y)), dtype=float).reshape(-1)
+        self.registrados = []
+        self.terminado = False
+    
+    def iniciar(self, x0: float, Y0):
+        self._g_previo = self._G(x0, np.atleast_1d(Y0))
+    
+    def revisar(self, F, xa: float, Ya, xb: float, Yb):
+        """
+        Revisa el paso de (xa, Ya) a (xb, Yb) y registra los eventos cruzados.
+        
+        Returns:
+            (x, Y) del evento terminal si lo hubo, o None
+        """
+        Ya = np.atleast_1d(Ya)
+        Yb = np.atleast_1d(Yb)
+        ga = self._g_previo
+        gb = self._G(xb, Yb)
+        self._g_previo = gb
+        
+        cruces = [i for i in range(len(gb))
+                  if (ga[i] * gb[i] < 0 or (gb[i] == 0 and ga[i] != 0))
+                  and self.direcciones[i] * (gb[i] - ga[i]) >= 0]
+        if not cruces:
+            return None
+        
+        fa = F(xa, Ya)
+        fb = F(xb, Yb)
+        encontrados = []
+        for i in cruces:
+            if gb[i] == 0:
+                x_evento = xb
+            else:
+                g_i = lambda x, i=i: self._G(x, _hermite(xa, Ya, fa, xb, Yb, fb, x))[i]
+                x_evento = _raiz_illinois(g_i, xa, xb, ga[i], gb[i])
+            encontrados.append((x_evento, i))
+        
+        for x_evento, i in sorted(encontrados, key=lambda e: (e[0] - xa) / (xb - xa)):
+            Y_evento = Yb if x_evento == xb else _hermite(xa, Ya, fa, xb, Yb, fb, x_evento)
+            self.registrados.append({
+                'evento': i,
+                'expr': self.exprs[i],
+                'x': float(x_evento),
+                'y': [float(v) for v in Y_evento],
+                'direccion': 1 if gb[i] > ga[i] else -1,
+                'terminal': self.terminales[i]
+            })
+            if self.terminales[i]:
+                self.terminado = True
+                return float(x_evento), Y_evento
+        return None
+    
+    def detalles(self) -> dict:
+        return {'eventos': self.registrados, 'terminado_por_evento': self.terminado}
+
+
+# ================== MUESTREO DE LA SALIDA ==================
+
+class _Muestreo:
+    """
+    Decide qué puntos de un integrador de paso fijo se guardan.
+    
+    El integrador avanza con sus n pasos y llama a registrar en cada uno;
+    solo se conservan las muestras pedidas, así que la memoria y el tamaño
+    de la respuesta dependen de la salida y no de n. salida puede ser:
+    
+    - None: todos los pasos
+    - {'cada': k}: uno de cada k pasos (el primero y el último siempre)
+    - {'muestras': N}: N pasos equiespaciados de la malla, incluidos los extremos
+    - {'x_salida': [...]}: los puntos dados, con el interpolante de Hermite
+      del paso que los contiene (F se evalúa solo en esos pasos)
+    """
+    
+    def __init__(self, salida: dict, x0: float, xf: float, n: int, F=None):
+        self.n = n
+        self.xs = []
+        self.ys = []
+        self._cada = 1
+        self._indices = None
+        self._x_salida = None
+        
+        if not salida:
+            return
+        opciones = [clave for clave in ('cada', 'muestras', 'x_salida') if clave in salida]
+        if len(opciones) != 1:
+            raise ValueError("salida debe indicar exactamente una opción: cada, muestras o x_salida")
+        
+        if 'cada' in salida:
+            self._cada = int(salida['cada'])
+            if self._cada < 1:
+                raise ValueError("salida['cada'] debe ser un entero positivo")
+        elif 'muestras' in salida:
+            muestras = int(salida['muestras'])
+            if muestras < 2:
+                raise ValueError("salida['muestras'] debe ser al menos 2")
+            self._indices = set(np.round(np.linspace(0, n, min(muestras, n + 1))).astype(int).tolist())
+        else:
+            direccion = 1.0 if xf >= x0 else -1.0
+            puntos = np.asarray(salida['x_salida'], dtype=float).ravel()
+            if np.any(direccion * (puntos - x0) < 0) or np.any(direccion * (puntos - xf) > 0):
+                raise ValueError("Los puntos de salida deben estar dentro de [x0, xf]")
+            self._x_salida = puntos[np.argsort(direccion * puntos)]
+            self._direccion = direccion
+            self._siguiente = 0
+            self._F = F
+    
+    def registrar(self, i: int, x: float, y):
+        """Registra el estado del paso i (i = 0 para la condición inicial)"""
+        if self._x_salida is not None:
+            self._interpolar(i, x, y)
+        elif i == self.n or (i in self._indices if self._indices is not None else i % self._cada == 0):
+            self.xs.append(x)
+            self.ys.append(y)
+    
+    def _interpolar(self, i: int, x: float, y):
+        puntos = self._x_salida
+        if i > 0:
+            xa, ya = self._previo
+            fa = fb = None
+            while self._siguiente < len(puntos) and self._direccion * (puntos[self._siguiente] - x) < 0:
+                if fa is None:
+                    fa, fb = self._F(xa, ya), self._F(x, y)
+                self.xs.append(float(puntos[self._siguiente]))
+                self.ys.append(_hermite(xa, ya, fa, x, y, fb, puntos[self._siguiente]))
+                self._siguiente += 1
+        while self._siguiente < len(puntos) and puntos[self._siguiente] == x:
+            self.xs.append(float(x))
+            self.ys.append(y)
+            self._siguiente += 1
+        self._previo = (x, y)
+    
+    def terminar(self, x: float, y):
+        """Guarda el punto donde la integración se detuvo antes de xf (evento terminal)"""
+        self.xs.append(x)
+        self.ys.append(y)
+    
+    def detalles(self) -> dict:
+        return {'puntos_guardados': len(self.xs)}
+
+
+_salida_arreglos = threading.local()
+
+
+@contextmanager
+def resultados_como_arreglos(activo: bool = True):
+    """
+    Dentro del bloque, los métodos de EcuacionesDiferenciales que integran
+    sobre arreglos devuelven x e y como ndarrays float64 en lugar de listas.
+    
+    Lo usa la API para las respuestas binarias, que escriben esos buffers
+    directamente; la respuesta JSON sigue recibiendo listas. El estado es
+    por hilo.
+    """
+    previo = getattr(_salida_arreglos, 'activo', False)
+    _salida_arreglos.activo = activo
+    try:
+        yield
+    finally:
+        _salida_arreglos.activo = previo
+
+
+def _como_lista(valores: np.ndarray):
+    """valores.tolist(), o el propio arreglo dentro de resultados_como_arreglos"""
+    return valores if getattr(_salida_arreglos, 'activo', False) else valores.tolist()
+
+
+# ================== ECUACIONES CON RETARDO ==================
+
+def _extraer_retardos(f_exprs: List[str], m: int):
+    """
+    Reemplaza los términos retardados y(x - tau), yk(x - tau) por símbolos.
+    
+    Los retardos deben ser constantes positivas (ej: 'y(x - 1)', 'y2(x - pi/2)').
+    
+    Returns:
+        Tupla (expresiones reescritas, [(componente, tau)] en el orden de los símbolos r1, r2, ...)
+    """
+    import re
+    
+    patron = re.compile(r'\b(y\d*)\s*\(\s*x\s*-\s*([^()]+(?:\([^()]*\)[^()]*)*)\)')
+    retardos = []
+    
+    def reemplazar(coincidencia):
+        nombre = coincidencia.group(1)
+        componente = int(nombre[1:] or 1) - 1
+        if componente >= m:
+            raise ValueError(f"{nombre} no es una variable del sistema")
+        _validar_expresion(coincidencia.group(2), ())
+        try:
+            tau = float(sympify(coincidencia.group(2), locals={'E': E, 'pi': pi}))
+        except (SympifyError, TypeError) as e:
+            raise ValueError(f"El retardo de {coincidencia.group(0)} debe ser una constante: {str(e)}")
+        if tau <= 0:
+            raise ValueError(f"El retardo de {coincidencia.group(0)} debe ser positivo")
+        clave = (componente, tau)
+        if clave not in retardos:
+            retardos.append(clave)
+        return f'r{retardos.index(clave) + 1}'
+    
+    exprs = [patron.sub(reemplazar, str(f_expr)) for f_expr in f_exprs]
+    if not retardos:
+        raise ValueError("La ecuación no tiene términos retardados de la forma y(x - tau)")
+    return exprs, retardos
+
+
+class _HistorialRetardo:
+    """
+    Historia de una integración de paso fijo para consultar y(x - tau).
+    
+    Guarda (y, f) de los últimos 'capacidad' nodos de la malla en arreglos
+    circulares de NumPy, así que la memoria depende del retardo máximo y no
+    de la longitud de la integración. Antes de x0 se usa la función inicial
+    phi.
+    """
+    
+    def __init__(self, x0: float, h: float, capacidad: int, m: int, phi):
+        self.x0 = x0
+        self.h = h
+        self.capacidad = capacidad
+        self.phi = phi
+        self.Y = np.zeros((capacidad, m))
+        self.F = np.zeros((capacidad, m))
+        self.ultimo = -1
+    
+    def agregar(self, i: int, y: np.ndarray, f: np.ndarray):
+        """Guarda el nodo i; sobrescribe el más antiguo"""
+        self.Y[i % self.capacidad] = y
+        self.F[i % self.capacidad] = f
+        self.ultimo = i
+    
+    def consulta(self, tau: float, c: float):
+        """
+        Prepara la lectura de y(x_i + c*h - tau) para cualquier paso i.
+        
+        Con retardo constante y paso fijo el punto retardado cae siempre en
+        el mismo lugar relativo del intervalo [x_j, x_j+1], con j = i + d,
+        así que los pesos del interpolante de Hermite se calculan una vez.
+        
+        Returns:
+            Tupla (d, pesos de (y_j, f_j, y_j+1, f_j+1))
+        """
+        s = c - tau / self.h
+        d = int(np.floor(s + 1e-9))
+        t = min(max(s - d, 0.0), 1.0)
+        pesos = ((1 + 2*t) * (1 - t)**2, t * (1 - t)**2 * self.h, t**2 * (3 - 2*t), t**2 * (t - 1) * self.h)
+        return d, pesos
+    
+    def leer(self, j: int, pesos, componente: int) -> float:
+        """Valor interpolado de la componente en el intervalo [x_j, x_j+1] con pesos de consulta()"""
+        if j <= self.ultimo - self.capacidad or j > self.ultimo:
+            raise ValueError(f"El nodo {j} está fuera de la historia guardada")
+        a = j % self.capacidad
+        b = (j + 1) % self.capacidad if j < self.ultimo else a
+        return (pesos[0] * self.Y[a, componente] + pesos[1] * self.F[a, componente]
+                + pesos[2] * self.Y[b, componente] + pesos[3] * self.F[b, componente])
+
+
+def _integrar_retardo(F, historial: _HistorialRetardo, retardos: List[Tuple[int, float]],
+                      x0: float, y0: np.ndarray, xf: float, n: int, muestreo):
+    """
+    Integra dY/dx = F(x, Y, r1, r2, ...) con RK4 de paso fijo, donde
+    rk = y_componente(x - tau) se toma de la historia.
+    
+    El paso no puede superar el menor retardo, de modo que todos los
+    valores retardados de un paso ya están en la historia.
+    
+    Returns:
+        Número de evaluaciones de F
+    """
+    h = (xf - x0) / n
+    # Consultas precalculadas por etapa: c = 0 (inicio), 1/2 y 1 (fin del paso)
+    consultas = [[(componente, tau) + historial.consulta(tau, c) for componente, tau in retardos]
+                 for c in (0.0, 0.5, 1.0)]
+    
+    def G(etapa, i, x, y):
+        retardados = []
+        for componente, tau, d, pesos in consultas[etapa]:
+            if i + d < 0:
+                retardados.append(historial.phi(x - tau)[componente])
+            else:
+                retardados.append(historial.leer(i + d, pesos, componente))
+        return F(x, y, *retardados)
+    
+    y = np.array(y0, dtype=float)
+    f = G(0, 0, x0, y)
+    historial.agregar(0, y, f)
+    muestreo.registrar(0, x0, y)
+    evaluaciones = 1
+    
+    for i in range(n):
+        xi = x0 + i * h
+        k2 = G(1, i, xi + h/2, y + h/2 * f)
+        k3 = G(1, i, xi + h/2, y + h/2 * k2)
+        k4 = G(2, i, xi + h, y + h * k3)
+        y = y + (h / 6) * (f + 2*k2 + 2*k3 + k4)
+        if not np.all(np.isfinite(y)):
+            raise ValueError(f"La solución diverge en x = {xi + h:.6g}; aumente n para reducir el paso")
+        
+        x_new = x0 + (i + 1) * h
+        f = G(0, i + 1, x_new, y)
+        historial.agregar(i + 1, y, f)
+        muestreo.registrar(i + 1, x_new, y)
+        evaluaciones += 4
+    
+    return evaluaciones
+
+
+_PASOS_FIJOS = {
+    'euler': _paso_euler,
+    'rk3': _paso_rk3,
+    'rk4': _paso_rk4
+}
+
+_ORDENES_TAYLOR = {'taylor_2': 1, 'taylor_3': 2, 'taylor_4': 3}
+
+
+# ================== BARRIDO DE PARÁMETROS ==================
+
+# Problema compilado del proceso actual (uno por proceso del pool)
+_PROBLEMA_BARRIDO = {}
+
+
+def _procesos_disponibles() -> int:
+    """Núcleos que este proceso puede usar"""
+    import os
+    
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _iniciar_barrido(metodo: str, f_expr: Union[str, List[str]], constantes: Tuple[str, ...]):
+    """Compila el problema una sola vez en cada proceso del barrido"""
+    es_sistema = not isinstance(f_expr, str)
+    f = _compilar_sistema(f_expr, constantes) if es_sistema else _compilar_ode(f_expr, constantes)
+    
+    if metodo in _ORDENES_TAYLOR:
+        nucleo = _taylor_ode(f_expr, constantes).nucleo(_ORDENES_TAYLOR[metodo], escalar=True)
+        paso = lambda f_, x, y, h, valores: _paso_taylor(lambda x, y: nucleo(x, y, *valores), x, y, h)
+    else:
+        paso_fijo = _PASOS_FIJOS[metodo]
+        paso = lambda f_, x, y, h, valores: paso_fijo(lambda x, y: f_(x, y, *valores), x, y, h)
+    
+    _PROBLEMA_BARRIDO.update(f=f, paso=paso, constantes=constantes, es_sistema=es_sistema)
+
+
+def _resolver_tarea(tarea: dict) -> dict:
+    """
+    Resuelve una combinación del barrido con el problema ya compilado.
+    
+    Los errores de una tarea se devuelven en su resultado para no detener
+    el resto del barrido.
+    """
+    import time
+    
+    inicio = time.perf_counter()
+    problema = _PROBLEMA_BARRIDO
+    try:
+        x0, xf, n = float(tarea['x0']), float(tarea['xf']), int(tarea['n'])
+        if n < 1:
+            raise ValueError("n debe ser un entero positivo")
+        valores = tuple(float(tarea[c]) for c in problema['constantes'])
+        y0 = np.asarray(tarea['y0'], dtype=float)
+        
+        h = (xf - x0) / n
+        Y = np.empty((n + 1,) + y0.shape)
+        Y[0] = y0
+        with np.errstate(all='ignore'):
+            for i in range(n):
+                Y[i + 1] = problema['paso'](problema['f'], x0 + i * h, Y[i], h, valores)
+        if not np.all(np.isfinite(Y[-1])):
+            raise ValueError(f"La solución diverge antes de x = {xf:.6g}")
+        
+        resultado = {'x_valores': (x0 + h * np.arange(n + 1)).tolist(), 'y_valores': Y.T.tolist()}
+    except (ValueError, TypeError, ArithmeticError) as e:
+        resultado = {'error': str(e)}
+    
+    resultado['tiempo'] = time.perf_counter() - inicio
+    return resultado
 
 
 class DiferenciasFinitas:
     """Métodos de interpolación usando diferencias finitas"""
     
     @staticmethod
-    def diferencias_divididas_adelante(x: List[float], y: List[float], x_eval: float) -> Tuple[float, dict]:
+    def diferencias_divididas_adelante(x: List[float], y: List[float], x_eval: float) -> Tuple[float, dict]:
+        """
+        Interpolación de Newton con diferencias divididas hacia adelante
+        
+        Args:
+            x: Lista de valores x (nodos)
+            y: Lista de valores y (función en los nodos)
+            x_eval: Punto donde se desea evaluar la interpolación
+        
+        Returns:
+            Tupla (valor_interpolado, detalles_cálculo)
+        """
+        n = len(x)
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        
+        # Verificar que los datos sean válidos
+        if n != len(y):
+            raise ValueError("x e y deben tener la misma longitud")
+        if n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos para interpolar")
+        
+        # Calcular tabla de diferencias divididas
+        tabla_diferencias = np.zeros((n, n))
+        tabla_diferencias[:, 0] = y
+        
+        for j in range(1, n):
+            for i in range(n - j):
+                tabla_diferencias[i, j] = (tabla_diferencias[i + 1, j - 1] - tabla_diferencias[i, j - 1]) / (x[i + j] - x[i])
+        
+        # Evaluar el polinomio de Newton
+        resultado = tabla_diferencias[0, 0]
+        termino = 1.0
+        
+        for j in range(1, n):
+            termino *= (x_eval - x[j - 1])
+            resultado += tabla_diferencias[0, j] * termino
+        
+        detalles = {
+            'metodo': 'Diferencias Divididas Hacia Adelante',
+            'nodos_x': [float(val) for val in x.tolist()],
+            'nodos_y': [float(val) for val in y.tolist()],
+            'tabla_diferencias': [[float(val) for val in row] for row in tabla_diferencias.tolist()],
+            'punto_evaluacion': float(x_eval),
+            'resultado': float(resultado)
+        }
+        
+        return resultado, detalles
+    
+    @staticmethod
+    def diferencias_divididas_atras(x: List[float], y: List[float], x_eval: float) -> Tuple[float, dict]:
+        """
+        Interpolación de Newton con diferencias divididas hacia atrás
+        
+        Args:
+            x: Lista de valores x (nodos)
+            y: Lista de valores y (función en los nodos)
+            x_eval: Punto donde se desea evaluar la interpolación
+        
+        Returns:
+            Tupla (valor_interpolado, detalles_cálculo)
+        """
+        n = len(x)
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        
+        # Verificar que los datos sean válidos
+        if n != len(y):
+            raise ValueError("x e y deben tener la misma longitud")
+        if n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos para interpolar")
+        
+        # Invertir los nodos para usar diferencias hacia atrás
+        x_inv = x[::-1]
+        y_inv = y[::-1]
+        
+        # Calcular tabla de diferencias divididas
+        tabla_diferencias = np.zeros((n, n))
+        tabla_diferencias[:, 0] = y_inv
+        
+        for j in range(1, n):
+            for i in range(n - j):
+                tabla_diferencias[i, j] = (tabla_diferencias[i + 1, j - 1] - tabla_diferencias[i, j - 1]) / (x_inv[i + j] - x_inv[i])
+        
+        # Evaluar el polinomio de Newton con diferencias hacia atrás
+        resultado = tabla_diferencias[0, 0]
+        termino = 1.0
+        
+        for j in range(1, n):
+            termino *= (x_eval - x_inv[j - 1])
+            resultado += tabla_diferencias[0, j] * termino
+        
+        detalles = {
+            'metodo': 'Diferencias Divididas Hacia Atrás',
+            'nodos_x': [float(val) for val in x.tolist()],
+            'nodos_y': [float(val) for val in y.tolist()],
+            'nodos_x_invertidos': [float(val) for val in x_inv.tolist()],
+            'nodos_y_invertidos': [float(val) for val in y_inv.tolist()],
+            'tabla_diferencias': [[float(val) for val in row] for row in tabla_diferencias.tolist()],
+            'punto_evaluacion': float(x_eval),
+            'resultado': float(resultado)
+        }
+        
+        return resultado, detalles
+    
+    @staticmethod
+    def neville(x: List[float], y: List[float], x_eval: float) -> Tuple[float, dict]:
+        """
+        Interpolación de Neville
+        
+        Args:
+            x: Lista de valores x (nodos)
+            y: Lista de valores y (función en los nodos)
+            x_eval: Punto donde se desea evaluar la interpolación
+        
+        Returns:
+            Tupla (valor_interpolado, detalles_cálculo)
+        """
+        n = len(x)
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        
+        # Verificar que los datos sean válidos
+        if n != len(y):
+            raise ValueError("x e y deben tener la misma longitud")
+        if n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos para interpolar")
+        
+        # Tabla de Neville
+        tabla_neville = np.zeros((n, n))
+        tabla_neville[:, 0] = y
+        
+        # Llenar la tabla de Neville
+        for j in range(1, n):
+            for i in range(n - j):
+                tabla_neville[i, j] = (
+                    (x_eval - x[i + j]) * tabla_neville[i, j - 1] -
+                    (x_eval - x[i]) * tabla_neville[i + 1, j - 1]
+                ) / (x[i] - x[i + j])
+        
+        resultado = tabla_neville[0, n - 1]
+        
+        detalles = {
+            'metodo': 'Neville',
+            'nodos_x': [float(val) for val in x.tolist()],
+            'nodos_y': [float(val) for val in y.tolist()],
+            'tabla_diferencias': [[float(val) for val in row] for row in tabla_neville.tolist()],
+            'punto_evaluacion': float(x_eval),
+            'resultado': float(resultado)
+        }
+        
+        return resultado, detalles
+
+
+class Derivacion:
+    """Métodos de derivación numérica"""
+    
+    @staticmethod
+    def dos_puntos_adelante(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+        """
+        Derivación con 2 puntos hacia adelante
+        f'(x) ≈ (f(x+h) - f(x)) / h
+        
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
+        
+        Returns:
+            Tupla (derivadas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos")
+        
+        derivadas = []
+        calculos = []
+        
+        for i in range(n):
+            if i == n - 1:
+                # No se puede calcular en el último punto
+                derivada = None
+                calculo = "No calculable (último punto)"
+            else:
+                # Fórmula: f'(x) = (f(x+h) - f(x)) / h
+                derivada = (y[i+1] - y[i]) / h
+                calculo = f"({y[i+1]:.6f} - {y[i]:.6f}) / {h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
+        
+        detalles = {
+            'metodo': 'Derivación 2 Puntos Hacia Adelante',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
+        }
+        
+        return derivadas, detalles
+    
+    @staticmethod
+    def dos_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+        """
+        Derivación con 2 puntos hacia atrás
+        f'(x) ≈ (f(x) - f(x-h)) / h
+        
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
+        
+        Returns:
+            Tupla (derivadas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos")
+        
+        derivadas = []
+        calculos = []
+        
+        for i in range(n):
+            if i == 0:
+                # No se puede calcular en el primer punto
+                derivada = None
+                calculo = "No calculable (primer punto)"
+            else:
+                # Fórmula: f'(x) = (f(x) - f(x-h)) / h
+                derivada = (y[i] - y[i-1]) / h
+                calculo = f"({y[i]:.6f} - {y[i-1]:.6f}) / {h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
+        
+        detalles = {
+            'metodo': 'Derivación 2 Puntos Hacia Atrás',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
+        }
+        
+        return derivadas, detalles
+    
+    @staticmethod
+    def tres_puntos_adelante(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+        """
+        Derivación con 3 puntos hacia adelante
+        f'(x) ≈ (-3f(x) + 4f(x+h) - f(x+2h)) / (2h)
+        
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
+        
+        Returns:
+            Tupla (derivadas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 puntos")
+        
+        derivadas = []
+        calculos = []
+        
+        for i in range(n):
+            if i >= n - 2:
+                # No se puede calcular en los dos últimos puntos
+                derivada = None
+                calculo = "No calculable"
+            else:
+                # Fórmula: f'(x) = (-3f(x) + 4f(x+h) - f(x+2h)) / (2h)
+                derivada = (-3 * y[i] + 4 * y[i+1] - y[i+2]) / (2 * h)
+                calculo = f"(-3*{y[i]:.6f} + 4*{y[i+1]:.6f} - {y[i+2]:.6f}) / {2*h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
+        
+        detalles = {
+            'metodo': 'Derivación 3 Puntos Hacia Adelante',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
+        }
+        
+        return derivadas, detalles
+    
+    @staticmethod
+    def tres_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+        """
+        Derivación con 3 puntos hacia atrás
+        f'(x) ≈ (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
+        
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
+        
+        Returns:
+            Tupla (derivadas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 puntos")
+        
+        derivadas = []
+        calculos = []
+        
+        for i in range(n):
+            if i < 2:
+                # No se puede calcular en los dos primeros puntos
+                derivada = None
+                calculo = "No calculable"
+            else:
+                # Fórmula: f'(x) = (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
+                derivada = (3 * y[i] - 4 * y[i-1] + y[i-2]) / (2 * h)
+                calculo = f"(3*{y[i]:.6f} - 4*{y[i-1]:.6f} + {y[i-2]:.6f}) / {2*h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
+        
+        detalles = {
+            'metodo': 'Derivación 3 Puntos Hacia Atrás',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
+        }
+        
+        return derivadas, detalles
+    
+    @staticmethod
+    def dos_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+        """
+        Derivación con 2 puntos centrada
+        f'(x) ≈ (f(x+h) - f(x-h)) / (2h)
+        
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
+        
+        Returns:
+            Tupla (derivadas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 puntos para derivación centrada")
+        
+        derivadas = []
+        calculos = []
+        
+        for i in range(n):
+            if i == 0 or i == n - 1:
+                # No se puede calcular en los extremos
+                derivada = None
+                calculo = "No calculable (punto extremo)"
+            else:
+                # Fórmula: f'(x) = (f(x+h) - f(x-h)) / (2h)
+                derivada = (y[i+1] - y[i-1]) / (2 * h)
+                calculo = f"({y[i+1]:.6f} - {y[i-1]:.6f}) / {2*h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
+        
+        detalles = {
+            'metodo': 'Derivación 2 Puntos Centrada',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
+        }
+        
+        return derivadas, detalles
+    
+    @staticmethod
+    def tres_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
         """
-        Interpolación de Newton con diferencias divididas hacia adelante
+        Derivación con 3 puntos centrada
+        f'(x) ≈ (-f(x+h) + f(x-h)) / (2h)
         
         Args:
-            x: Lista de valores x (nodos)
-            y: Lista de valores y (función en los nodos)
-            x_eval: Punto donde se desea evaluar la interpolación
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
         
         Returns:
-            Tupla (valor_interpolado, detalles_cálculo)
+            Tupla (derivadas, detalles_cálculo)
         """
-        n = len(x)
         x = np.array(x, dtype=float)
         y = np.array(y, dtype=float)
+        n = len(x)
         
-        # Verificar que los datos sean válidos
-        if n != len(y):
-            raise ValueError("x e y deben tener la misma longitud")
-        if n < 2:
-            raise ValueError("Se necesitan al menos 2 puntos para interpolar")
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 puntos")
         
-        # Calcular tabla de diferencias divididas
-        tabla_diferencias = np.zeros((n, n))
-        tabla_diferencias[:, 0] = y
+        derivadas = []
+        calculos = []
         
-        for j in range(1, n):
-            for i in range(n - j):
-                tabla_diferencias[i, j] = (tabla_diferencias[i + 1, j - 1] - tabla_diferencias[i, j - 1]) / (x[i + j] - x[i])
+        for i in range(n):
+            if i == 0 or i == n - 1:
+                # No se puede calcular en los extremos
+                derivada = None
+                calculo = "No calculable (punto extremo)"
+            else:
+                # Fórmula: f'(x) = (-f(x+h) + f(x-h)) / (2h)
+                derivada = (-y[i+1] + y[i-1]) / (2 * h)
+                calculo = f"(-{y[i+1]:.6f} + {y[i-1]:.6f}) / {2*h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
         
-        # Evaluar el polinomio de Newton
-        resultado = tabla_diferencias[0, 0]
-        termino = 1.0
+        detalles = {
+            'metodo': 'Derivación 3 Puntos Centrada',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
+        }
         
-        for j in range(1, n):
-            termino *= (x_eval - x[j - 1])
-            resultado += tabla_diferencias[0, j] * termino
+        return derivadas, detalles
+    
+    @staticmethod
+    def cinco_puntos_adelante(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+        """
+        Derivación con 5 puntos hacia adelante
+        f'(x) ≈ (-11f(x) + 18f(x+h) - 9f(x+2h) + 2f(x+3h)) / (6h)
+        
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
+        
+        Returns:
+            Tupla (derivadas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if n < 4:
+            raise ValueError("Se necesitan al menos 4 puntos")
+        
+        derivadas = []
+        calculos = []
+        
+        for i in range(n):
+            if i >= n - 3:
+                # No se puede calcular en los últimos 3 puntos
+                derivada = None
+                calculo = "No calculable"
+            else:
+                # Fórmula: f'(x) = (-11f(x) + 18f(x+h) - 9f(x+2h) + 2f(x+3h)) / (6h)
+                derivada = (-11 * y[i] + 18 * y[i+1] - 9 * y[i+2] + 2 * y[i+3]) / (6 * h)
+                calculo = f"(-11*{y[i]:.6f} + 18*{y[i+1]:.6f} - 9*{y[i+2]:.6f} + 2*{y[i+3]:.6f}) / {6*h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
         
         detalles = {
-            'metodo': 'Diferencias Divididas Hacia Adelante',
-            'nodos_x': [float(val) for val in x.tolist()],
-            'nodos_y': [float(val) for val in y.tolist()],
-            'tabla_diferencias': [[float(val) for val in row] for row in tabla_diferencias.tolist()],
-            'punto_evaluacion': float(x_eval),
-            'resultado': float(resultado)
+            'metodo': 'Derivación 5 Puntos Hacia Adelante',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
         }
         
-        return resultado, detalles
+        return derivadas, detalles
     
     @staticmethod
-    def diferencias_divididas_atras(x: List[float], y: List[float], x_eval: float) -> Tuple[float, dict]:
+    def cinco_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
         """
-        Interpolación de Newton con diferencias divididas hacia atrás
+        Derivación con 5 puntos hacia atrás
+        f'(x) ≈ (-2f(x-3h) + 9f(x-2h) - 18f(x-h) + 11f(x)) / (6h)
         
         Args:
-            x: Lista de valores x (nodos)
-            y: Lista de valores y (función en los nodos)
-            x_eval: Punto donde se desea evaluar la interpolación
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
         
         Returns:
-            Tupla (valor_interpolado, detalles_cálculo)
+            Tupla (derivadas, detalles_cálculo)
         """
-        n = len(x)
         x = np.array(x, dtype=float)
         y = np.array(y, dtype=float)
+        n = len(x)
         
-        # Verificar que los datos sean válidos
-        if n != len(y):
-            raise ValueError("x e y deben tener la misma longitud")
-        if n < 2:
-            raise ValueError("Se necesitan al menos 2 puntos para interpolar")
+        if n < 4:
+            raise ValueError("Se necesitan al menos 4 puntos")
         
-        # Invertir los nodos para usar diferencias hacia atrás
-        x_inv = x[::-1]
-        y_inv = y[::-1]
+        derivadas = []
+        calculos = []
         
-        # Calcular tabla de diferencias divididas
-        tabla_diferencias = np.zeros((n, n))
-        tabla_diferencias[:, 0] = y_inv
+        for i in range(n):
+            if i < 3:
+                # No se puede calcular en los primeros 3 puntos
+                derivada = None
+                calculo = "No calculable"
+            else:
+                # Fórmula: f'(x) = (-2f(x-3h) + 9f(x-2h) - 18f(x-h) + 11f(x)) / (6h)
+                derivada = (-2 * y[i-3] + 9 * y[i-2] - 18 * y[i-1] + 11 * y[i]) / (6 * h)
+                calculo = f"(-2*{y[i-3]:.6f} + 9*{y[i-2]:.6f} - 18*{y[i-1]:.6f} + 11*{y[i]:.6f}) / {6*h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
         
-        for j in range(1, n):
-            for i in range(n - j):
-                tabla_diferencias[i, j] = (tabla_diferencias[i + 1, j - 1] - tabla_diferencias[i, j - 1]) / (x_inv[i + j] - x_inv[i])
+        detalles = {
+            'metodo': 'Derivación 5 Puntos Hacia Atrás',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
+        }
         
-        # Evaluar el polinomio de Newton con diferencias hacia atrás
-        resultado = tabla_diferencias[0, 0]
-        termino = 1.0
+        return derivadas, detalles
+    
+    @staticmethod
+    def cinco_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+        """
+        Derivación con 2 puntos hacia atrás
+        f'(x) ≈ (f(x) - f(x-h)) / h
         
-        for j in range(1, n):
-            termino *= (x_eval - x_inv[j - 1])
-            resultado += tabla_diferencias[0, j] * termino
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
+        
+        Returns:
+            Tupla (derivadas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos")
+        
+        derivadas = []
+        calculos = []
+        
+        for i in range(n):
+            if i == 0:
+                # No se puede calcular en el primer punto
+                derivada = None
+                calculo = "No calculable (primer punto)"
+            else:
+                # Fórmula: f'(x) = (f(x) - f(x-h)) / h
+                derivada = (y[i] - y[i-1]) / h
+                calculo = f"({y[i]:.6f} - {y[i-1]:.6f}) / {h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
         
         detalles = {
-            'metodo': 'Diferencias Divididas Hacia Atrás',
-            'nodos_x': [float(val) for val in x.tolist()],
-            'nodos_y': [float(val) for val in y.tolist()],
-            'nodos_x_invertidos': [float(val) for val in x_inv.tolist()],
-            'nodos_y_invertidos': [float(val) for val in y_inv.tolist()],
-            'tabla_diferencias': [[float(val) for val in row] for row in tabla_diferencias.tolist()],
-            'punto_evaluacion': float(x_eval),
-            'resultado': float(resultado)
+            'metodo': 'Derivación 2 Puntos Hacia Atrás',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
         }
         
-        return resultado, detalles
+        return derivadas, detalles
     
     @staticmethod
-    def neville(x: List[float], y: List[float], x_eval: float) -> Tuple[float, dict]:
+    def dos_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
         """
-        Interpolación de Neville
+        Derivación con 2 puntos centrada
+        f'(x) ≈ (f(x+h) - f(x-h)) / (2h)
         
         Args:
-            x: Lista de valores x (nodos)
-            y: Lista de valores y (función en los nodos)
-            x_eval: Punto donde se desea evaluar la interpolación
+            x: Lista de valores x
+            y: Lista de valores y (función en los puntos)
+            h: Tamaño del paso
         
         Returns:
-            Tupla (valor_interpolado, detalles_cálculo)
+            Tupla (derivadas, detalles_cálculo)
         """
-        n = len(x)
         x = np.array(x, dtype=float)
         y = np.array(y, dtype=float)
+        n = len(x)
         
-        # Verificar que los datos sean válidos
-        if n != len(y):
-            raise ValueError("x e y deben tener la misma longitud")
-        if n < 2:
-            raise ValueError("Se necesitan al menos 2 puntos para interpolar")
-        
-        # Tabla de Neville
-        tabla_neville = np.zeros((n, n))
-        tabla_neville[:, 0] = y
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 puntos para derivación centrada")
         
-        # Llenar la tabla de Neville
-        for j in range(1, n):
-            for i in range(n - j):
-                tabla_neville[i, j] = (
-                    (x_eval - x[i + j]) * tabla_neville[i, j - 1] -
-                    (x_eval - x[i]) * tabla_neville[i + 1, j - 1]
-                ) / (x[i] - x[i + j])
+        derivadas = []
+        calculos = []
         
-        resultado = tabla_neville[0, n - 1]
+        for i in range(n):
+            if i == 0 or i == n - 1:
+                # No se puede calcular en los extremos
+                derivada = None
+                calculo = "No calculable (punto extremo)"
+            else:
+                # Fórmula: f'(x) = (f(x+h) - f(x-h)) / (2h)
+                derivada = (y[i+1] - y[i-1]) / (2 * h)
+                calculo = f"({y[i+1]:.6f} - {y[i-1]:.6f}) / {2*h}"
+            
+            derivadas.append(derivada)
+            calculos.append(calculo)
         
         detalles = {
-            'metodo': 'Neville',
-            'nodos_x': [float(val) for val in x.tolist()],
-            'nodos_y': [float(val) for val in y.tolist()],
-            'tabla_diferencias': [[float(val) for val in row] for row in tabla_neville.tolist()],
-            'punto_evaluacion': float(x_eval),
-            'resultado': float(resultado)
+            'metodo': 'Derivación 2 Puntos Centrada',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso': h,
+            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
+            'calculos': calculos
         }
         
-        return resultado, detalles
-
-
-class Derivacion:
-    """Métodos de derivación numérica"""
+        return derivadas, detalles
     
     @staticmethod
-    def dos_puntos_adelante(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def tres_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
         """
-        Derivación con 2 puntos hacia adelante
-        f'(x) ≈ (f(x+h) - f(x)) / h
+        Derivación con 3 puntos hacia atrás
+        f'(x) ≈ (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
         
         Args:
             x: Lista de valores x
@@ -182,27 +2811,27 @@ class Derivacion:
         y = np.array(y, dtype=float)
         n = len(x)
         
-        if n < 2:
-            raise ValueError("Se necesitan al menos 2 puntos")
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 puntos")
         
         derivadas = []
         calculos = []
         
         for i in range(n):
-            if i == n - 1:
-                # No se puede calcular en el último punto
+            if i < 2:
+                # No se puede calcular en los dos primeros puntos
                 derivada = None
-                calculo = "No calculable (último punto)"
+                calculo = "No calculable"
             else:
-                # Fórmula: f'(x) = (f(x+h) - f(x)) / h
-                derivada = (y[i+1] - y[i]) / h
-                calculo = f"({y[i+1]:.6f} - {y[i]:.6f}) / {h}"
+                # Fórmula: f'(x) = (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
+                derivada = (3 * y[i] - 4 * y[i-1] + y[i-2]) / (2 * h)
+                calculo = f"(3*{y[i]:.6f} - 4*{y[i-1]:.6f} + {y[i-2]:.6f}) / {2*h}"
             
             derivadas.append(derivada)
             calculos.append(calculo)
         
         detalles = {
-            'metodo': 'Derivación 2 Puntos Hacia Adelante',
+            'metodo': 'Derivación 3 Puntos Hacia Atrás',
             'nodos_x': x.tolist(),
             'nodos_y': y.tolist(),
             'paso': h,
@@ -213,10 +2842,10 @@ class Derivacion:
         return derivadas, detalles
     
     @staticmethod
-    def dos_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def tres_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
         """
-        Derivación con 2 puntos hacia atrás
-        f'(x) ≈ (f(x) - f(x-h)) / h
+        Derivación con 3 puntos centrada
+        f'(x) ≈ (-f(x+h) + f(x-h)) / (2h)
         
         Args:
             x: Lista de valores x
@@ -230,27 +2859,27 @@ class Derivacion:
         y = np.array(y, dtype=float)
         n = len(x)
         
-        if n < 2:
-            raise ValueError("Se necesitan al menos 2 puntos")
+        if n < 3:
+            raise ValueError("Se necesitan al menos 3 puntos")
         
         derivadas = []
         calculos = []
         
         for i in range(n):
-            if i == 0:
-                # No se puede calcular en el primer punto
+            if i == 0 or i == n - 1:
+                # No se puede calcular en los extremos
                 derivada = None
-                calculo = "No calculable (primer punto)"
+                calculo = "No calculable (punto extremo)"
             else:
-                # Fórmula: f'(x) = (f(x) - f(x-h)) / h
-                derivada = (y[i] - y[i-1]) / h
-                calculo = f"({y[i]:.6f} - {y[i-1]:.6f}) / {h}"
+                # Fórmula: f'(x) = (-f(x+h) + f(x-h)) / (2h)
+                derivada = (-y[i+1] + y[i-1]) / (2 * h)
+                calculo = f"(-{y[i+1]:.6f} + {y[i-1]:.6f}) / {2*h}"
             
             derivadas.append(derivada)
             calculos.append(calculo)
         
         detalles = {
-            'metodo': 'Derivación 2 Puntos Hacia Atrás',
+            'metodo': 'Derivación 3 Puntos Centrada',
             'nodos_x': x.tolist(),
             'nodos_y': y.tolist(),
             'paso': h,
@@ -261,10 +2890,10 @@ class Derivacion:
         return derivadas, detalles
     
     @staticmethod
-    def tres_puntos_adelante(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def cinco_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
         """
-        Derivación con 3 puntos hacia adelante
-        f'(x) ≈ (-3f(x) + 4f(x+h) - f(x+2h)) / (2h)
+        Derivación con 5 puntos centrada
+        f'(x) ≈ (-f(x+2h) + 8f(x+h) - 8f(x-h) + f(x-2h)) / (12h)
         
         Args:
             x: Lista de valores x
@@ -278,27 +2907,27 @@ class Derivacion:
         y = np.array(y, dtype=float)
         n = len(x)
         
-        if n < 3:
-            raise ValueError("Se necesitan al menos 3 puntos")
+        if n < 5:
+            raise ValueError("Se necesitan al menos 5 puntos")
         
         derivadas = []
         calculos = []
         
         for i in range(n):
-            if i >= n - 2:
-                # No se puede calcular en los dos últimos puntos
+            if i < 2 or i >= n - 2:
+                # No se puede calcular en los extremos
                 derivada = None
                 calculo = "No calculable"
             else:
-                # Fórmula: f'(x) = (-3f(x) + 4f(x+h) - f(x+2h)) / (2h)
-                derivada = (-3 * y[i] + 4 * y[i+1] - y[i+2]) / (2 * h)
-                calculo = f"(-3*{y[i]:.6f} + 4*{y[i+1]:.6f} - {y[i+2]:.6f}) / {2*h}"
+                # Fórmula: f'(x) = (-f(x+2h) + 8f(x+h) - 8f(x-h) + f(x-2h)) / (12h)
+                derivada = (-y[i+2] + 8*y[i+1] - 8*y[i-1] + y[i-2]) / (12 * h)
+                calculo = f"(-{y[i+2]:.6f} + 8*{y[i+1]:.6f} - 8*{y[i-1]:.6f} + {y[i-2]:.6f}) / {12*h}"
             
             derivadas.append(derivada)
             calculos.append(calculo)
         
         detalles = {
-            'metodo': 'Derivación 3 Puntos Hacia Adelante',
+            'metodo': 'Derivación 5 Puntos Centrada',
             'nodos_x': x.tolist(),
             'nodos_y': y.tolist(),
             'paso': h,
@@ -306,1779 +2935,2317 @@ class Derivacion:
             'calculos': calculos
         }
         
-        return derivadas, detalles
+        return derivadas, detalles
+    
+    @staticmethod
+    def extrapolacion_richardson(x: List[float], y: List[float], h1: float, h2: float, 
+                                 metodo: str = 'centrada') -> Tuple[List[float], dict]:
+        """
+        Extrapolación de Richardson para mejorar estimaciones de derivadas
+        
+        Args:
+            x: Lista de valores x
+            y: Lista de valores y
+            h1: Primer tamaño de paso
+            h2: Segundo tamaño de paso
+            metodo: 'centrada' o 'atras'
+        
+        Returns:
+            Tupla (derivadas mejoradas, detalles_cálculo)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        n = len(x)
+        
+        if metodo == 'centrada':
+            if n < 3:
+                raise ValueError("Se necesitan al menos 3 puntos")
+            
+            der1 = []
+            der2 = []
+            der_richardson = []
+            calculos = []
+            
+            for i in range(n):
+                if i == 0 or i == n - 1:
+                    der1.append(None)
+                    der2.append(None)
+                    der_richardson.append(None)
+                    calculos.append("No calculable (punto extremo)")
+                else:
+                    d1 = (y[i+1] - y[i-1]) / (2 * h1)
+                    d2 = (y[i+1] - y[i-1]) / (2 * h2)
+                    
+                    # Richardson: D_R = (4*D_h2 - D_h1) / 3
+                    d_r = (4*d2 - d1) / 3
+                    
+                    der1.append(d1)
+                    der2.append(d2)
+                    der_richardson.append(d_r)
+                    calculos.append(f"h1={h1}: {d1:.6f}, h2={h2}: {d2:.6f}, Richardson: {d_r:.6f}")
+            
+        else:  # atras
+            if n < 2:
+                raise ValueError("Se necesitan al menos 2 puntos")
+            
+            der1 = []
+            der2 = []
+            der_richardson = []
+            calculos = []
+            
+            for i in range(n):
+                if i == 0:
+                    der1.append(None)
+                    der2.append(None)
+                    der_richardson.append(None)
+                    calculos.append("No calculable (primer punto)")
+                else:
+                    d1 = (y[i] - y[i-1]) / h1
+                    d2 = (y[i] - y[i-1]) / h2
+                    
+                    # Richardson
+                    d_r = (4*d2 - d1) / 3
+                    
+                    der1.append(d1)
+                    der2.append(d2)
+                    der_richardson.append(d_r)
+                    calculos.append(f"h1={h1}: {d1:.6f}, h2={h2}: {d2:.6f}, Richardson: {d_r:.6f}")
+        
+        detalles = {
+            'metodo': f'Extrapolación Richardson ({metodo})',
+            'nodos_x': x.tolist(),
+            'nodos_y': y.tolist(),
+            'paso_1': h1,
+            'paso_2': h2,
+            'derivadas_h1': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in der1],
+            'derivadas_h2': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in der2],
+            'derivadas_richardson': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in der_richardson],
+            'calculos': calculos
+        }
+        
+        return der_richardson, detalles
+
+class Integracion:
+    """Métodos de integración numérica"""
+    
+    @staticmethod
+    def trapecio(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
+        """
+        Regla del Trapecio
+        
+        Args:
+            a: Límite inferior
+            b: Límite superior
+            n: Número de subintervalos
+            f_values: Valores de la función en los puntos
+        
+        Returns:
+            Tupla (valor_integral, detalles_cálculo)
+        """
+        h = (b - a) / n
+        suma = f_values[0] + f_values[-1]
+        
+        for i in range(1, n):
+            suma += 2 * f_values[i]
+        
+        integral = (h / 2) * suma
+        
+        detalles = {
+            'metodo': 'Trapecio',
+            'a': a,
+            'b': b,
+            'n': n,
+            'h': h,
+            'suma': suma,
+            'integral': integral
+        }
+        
+        return integral, detalles
     
     @staticmethod
-    def tres_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def simpson_1_3(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
         """
-        Derivación con 3 puntos hacia atrás
-        f'(x) ≈ (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
+        Regla de Simpson 1/3
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            a: Límite inferior
+            b: Límite superior
+            n: Número de subintervalos (debe ser par)
+            f_values: Valores de la función en los puntos
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Tupla (valor_integral, detalles_cálculo)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
-        
-        if n < 3:
-            raise ValueError("Se necesitan al menos 3 puntos")
+        if n % 2 != 0:
+            raise ValueError("Para Simpson 1/3, n debe ser par")
         
-        derivadas = []
-        calculos = []
+        h = (b - a) / n
+        suma_impar = sum(f_values[i] for i in range(1, n, 2))
+        suma_par = sum(f_values[i] for i in range(2, n-1, 2))
         
-        for i in range(n):
-            if i < 2:
-                # No se puede calcular en los dos primeros puntos
-                derivada = None
-                calculo = "No calculable"
-            else:
-                # Fórmula: f'(x) = (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
-                derivada = (3 * y[i] - 4 * y[i-1] + y[i-2]) / (2 * h)
-                calculo = f"(3*{y[i]:.6f} - 4*{y[i-1]:.6f} + {y[i-2]:.6f}) / {2*h}"
-            
-            derivadas.append(derivada)
-            calculos.append(calculo)
+        integral = (h / 3) * (f_values[0] + 4*suma_impar + 2*suma_par + f_values[-1])
         
         detalles = {
-            'metodo': 'Derivación 3 Puntos Hacia Atrás',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Simpson 1/3',
+            'a': a,
+            'b': b,
+            'n': n,
+            'h': h,
+            'suma_impar': suma_impar,
+            'suma_par': suma_par,
+            'integral': integral
         }
         
-        return derivadas, detalles
+        return integral, detalles
     
     @staticmethod
-    def dos_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def simpson_3_8(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
         """
-        Derivación con 2 puntos centrada
-        f'(x) ≈ (f(x+h) - f(x-h)) / (2h)
+        Regla de Simpson 3/8
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            a: Límite inferior
+            b: Límite superior
+            n: Número de subintervalos (debe ser múltiplo de 3)
+            f_values: Valores de la función en los puntos
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Tupla (valor_integral, detalles_cálculo)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
-        
-        if n < 3:
-            raise ValueError("Se necesitan al menos 3 puntos para derivación centrada")
+        if n % 3 != 0:
+            raise ValueError("Para Simpson 3/8, n debe ser múltiplo de 3")
         
-        derivadas = []
-        calculos = []
+        h = (b - a) / n
+        suma1 = sum(f_values[i] for i in range(1, n, 3))
+        suma2 = sum(f_values[i] for i in range(2, n, 3))
+        suma3 = sum(f_values[i] for i in range(3, n, 3))
         
-        for i in range(n):
-            if i == 0 or i == n - 1:
-                # No se puede calcular en los extremos
-                derivada = None
-                calculo = "No calculable (punto extremo)"
-            else:
-                # Fórmula: f'(x) = (f(x+h) - f(x-h)) / (2h)
-                derivada = (y[i+1] - y[i-1]) / (2 * h)
-                calculo = f"({y[i+1]:.6f} - {y[i-1]:.6f}) / {2*h}"
-            
-            derivadas.append(derivada)
-            calculos.append(calculo)
+        integral = (3*h / 8) * (f_values[0] + 3*suma1 + 3*suma2 + 2*suma3 + f_values[-1])
         
         detalles = {
-            'metodo': 'Derivación 2 Puntos Centrada',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Simpson 3/8',
+            'a': a,
+            'b': b,
+            'n': n,
+            'h': h,
+            'integral': integral
         }
         
-        return derivadas, detalles
+        return integral, detalles
     
     @staticmethod
-    def tres_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def cuadratura_gaussiana(a: float, b: float, f_values: List[float], n_points: int = 2) -> Tuple[float, dict]:
         """
-        Derivación con 3 puntos centrada
-        f'(x) ≈ (-f(x+h) + f(x-h)) / (2h)
+        Cuadratura Gaussiana (Gauss-Legendre)
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            a: Límite inferior
+            b: Límite superior
+            f_values: Valores de la función en los puntos
+            n_points: Número de puntos de Gauss
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Tupla (valor_integral, detalles_cálculo)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
-        
-        if n < 3:
-            raise ValueError("Se necesitan al menos 3 puntos")
+        # Puntos y pesos de Gauss-Legendre para 2 y 3 puntos
+        if n_points == 2:
+            x = [-1/np.sqrt(3), 1/np.sqrt(3)]
+            w = [1, 1]
+        elif n_points == 3:
+            x = [-np.sqrt(3/5), 0, np.sqrt(3/5)]
+            w = [5/9, 8/9, 5/9]
+        else:
+            raise ValueError("Solo soporta 2 o 3 puntos de Gauss")
         
-        derivadas = []
-        calculos = []
+        # Transformar al intervalo [a, b]
+        integral = 0
+        for i in range(n_points):
+            t = ((b - a) * x[i] + (a + b)) / 2
+            integral += w[i] * f_values[i]
         
-        for i in range(n):
-            if i == 0 or i == n - 1:
-                # No se puede calcular en los extremos
-                derivada = None
-                calculo = "No calculable (punto extremo)"
-            else:
-                # Fórmula: f'(x) = (-f(x+h) + f(x-h)) / (2h)
-                derivada = (-y[i+1] + y[i-1]) / (2 * h)
-                calculo = f"(-{y[i+1]:.6f} + {y[i-1]:.6f}) / {2*h}"
-            
-            derivadas.append(derivada)
-            calculos.append(calculo)
+        integral *= (b - a) / 2
         
         detalles = {
-            'metodo': 'Derivación 3 Puntos Centrada',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': f'Cuadratura Gaussiana ({n_points} puntos)',
+            'a': a,
+            'b': b,
+            'n_points': n_points,
+            'integral': integral
         }
         
-        return derivadas, detalles
+        return integral, detalles
     
     @staticmethod
-    def cinco_puntos_adelante(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def trapecio_multiple(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
         """
-        Derivación con 5 puntos hacia adelante
-        f'(x) ≈ (-11f(x) + 18f(x+h) - 9f(x+2h) + 2f(x+3h)) / (6h)
+        Integración múltiple con Trapecio (2D)
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            a: Límite inferior
+            b: Límite superior
+            n: Número de subintervalos
+            f_values: Matriz de valores de la función
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Tupla (valor_integral, detalles_cálculo)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
+        h = (b - a) / n
+        integral = Integracion.trapecio(a, b, n, f_values)[0]
         
-        if n < 4:
-            raise ValueError("Se necesitan al menos 4 puntos")
+        detalles = {
+            'metodo': 'Trapecio Múltiple',
+            'a': a,
+            'b': b,
+            'n': n,
+            'h': h,
+            'integral': integral
+        }
         
-        derivadas = []
-        calculos = []
+        return integral, detalles
+    
+    @staticmethod
+    def simpson_1_3_multiple(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
+        """
+        Integración múltiple con Simpson 1/3 (2D)
         
-        for i in range(n):
-            if i >= n - 3:
-                # No se puede calcular en los últimos 3 puntos
-                derivada = None
-                calculo = "No calculable"
-            else:
-                # Fórmula: f'(x) = (-11f(x) + 18f(x+h) - 9f(x+2h) + 2f(x+3h)) / (6h)
-                derivada = (-11 * y[i] + 18 * y[i+1] - 9 * y[i+2] + 2 * y[i+3]) / (6 * h)
-                calculo = f"(-11*{y[i]:.6f} + 18*{y[i+1]:.6f} - 9*{y[i+2]:.6f} + 2*{y[i+3]:.6f}) / {6*h}"
-            
-            derivadas.append(derivada)
-            calculos.append(calculo)
+        Args:
+            a: Límite inferior
+            b: Límite superior
+            n: Número de subintervalos (debe ser par)
+            f_values: Matriz de valores de la función
+        
+        Returns:
+            Tupla (valor_integral, detalles_cálculo)
+        """
+        if n % 2 != 0:
+            raise ValueError("Para Simpson 1/3 múltiple, n debe ser par")
+        
+        integral = Integracion.simpson_1_3(a, b, n, f_values)[0]
         
         detalles = {
-            'metodo': 'Derivación 5 Puntos Hacia Adelante',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Simpson 1/3 Múltiple',
+            'a': a,
+            'b': b,
+            'n': n,
+            'integral': integral
         }
         
-        return derivadas, detalles
+        return integral, detalles
     
     @staticmethod
-    def cinco_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def extrapolacion_richardson_integracion(a: float, b: float, n1: int, n2: int, f_values_n1: List[float], f_values_n2: List[float]) -> Tuple[float, dict]:
         """
-        Derivación con 5 puntos hacia atrás
-        f'(x) ≈ (-2f(x-3h) + 9f(x-2h) - 18f(x-h) + 11f(x)) / (6h)
+        Extrapolación de Richardson para integración
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            a: Límite inferior
+            b: Límite superior
+            n1: Primer número de subintervalos
+            n2: Segundo número de subintervalos
+            f_values_n1: Valores con n1 intervalos
+            f_values_n2: Valores con n2 intervalos
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Tupla (valor_integral, detalles_cálculo)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
-        
-        if n < 4:
-            raise ValueError("Se necesitan al menos 4 puntos")
-        
-        derivadas = []
-        calculos = []
+        I_n1, _ = Integracion.trapecio(a, b, n1, f_values_n1)
+        I_n2, _ = Integracion.trapecio(a, b, n2, f_values_n2)
         
-        for i in range(n):
-            if i < 3:
-                # No se puede calcular en los primeros 3 puntos
-                derivada = None
-                calculo = "No calculable"
-            else:
-                # Fórmula: f'(x) = (-2f(x-3h) + 9f(x-2h) - 18f(x-h) + 11f(x)) / (6h)
-                derivada = (-2 * y[i-3] + 9 * y[i-2] - 18 * y[i-1] + 11 * y[i]) / (6 * h)
-                calculo = f"(-2*{y[i-3]:.6f} + 9*{y[i-2]:.6f} - 18*{y[i-1]:.6f} + 11*{y[i]:.6f}) / {6*h}"
-            
-            derivadas.append(derivada)
-            calculos.append(calculo)
+        # Extrapolación de Richardson para trapecio: p = 2
+        integral = (4 * I_n2 - I_n1) / 3
         
         detalles = {
-            'metodo': 'Derivación 5 Puntos Hacia Atrás',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Extrapolación Richardson (Integración)',
+            'a': a,
+            'b': b,
+            'n1': n1,
+            'n2': n2,
+            'I_n1': I_n1,
+            'I_n2': I_n2,
+            'integral': integral
         }
         
-        return derivadas, detalles
+        return integral, detalles
     
     @staticmethod
-    def cinco_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def valores_funcion(f_expr: str, a: float, b: float, n: int) -> List[float]:
         """
-        Derivación con 2 puntos hacia atrás
-        f'(x) ≈ (f(x) - f(x-h)) / h
+        Evalúa f(x) en los n + 1 puntos equiespaciados de [a, b]
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            f_expr: Expresión de la función como string
+            a: Límite inferior
+            b: Límite superior
+            n: Número de subintervalos
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Lista con los valores f(x_i)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
+        f_func = _compilar_expresion(f_expr, ('x',))
+        x_points = np.linspace(a, b, n + 1)
+        valores = np.broadcast_to(np.asarray(f_func(x_points), dtype=float), x_points.shape)
+        return valores.tolist()
+    
+    @staticmethod
+    def cuadratura_adaptiva(f_expr: str, a: float, b: float, tolerancia: float = 1e-6, max_profundidad: int = 50) -> Tuple[float, dict]:
+        """
+        Cuadratura Adaptiva (Integración Adaptativa)
         
-        if n < 2:
-            raise ValueError("Se necesitan al menos 2 puntos")
+        Utiliza el método Simpson recursivo con división adaptativa de intervalos
         
-        derivadas = []
-        calculos = []
+        Args:
+            f_expr: Expresión de la función como string
+            a: Límite inferior
+            b: Límite superior
+            tolerancia: Tolerancia de error deseada
+            max_profundidad: Profundidad máxima de recursión
         
-        for i in range(n):
-            if i == 0:
-                # No se puede calcular en el primer punto
-                derivada = None
-                calculo = "No calculable (primer punto)"
-            else:
-                # Fórmula: f'(x) = (f(x) - f(x-h)) / h
-                derivada = (y[i] - y[i-1]) / h
-                calculo = f"({y[i]:.6f} - {y[i-1]:.6f}) / {h}"
+        Returns:
+            Tupla (valor_integral, detalles_cálculo)
+        """
+        # Compilar la función (reemplazar y por x si es necesario)
+        f_func = _compilar_expresion(f_expr.replace('y', 'x'), ('x',))
+        
+        # Función auxiliar para Simpson simple en un intervalo
+        def simpson_simple(a, b, f):
+            c = (a + b) / 2
+            h = (b - a) / 6
+            return h * (f(a) + 4*f(c) + f(b))
+        
+        # Función recursiva para integración adaptativa
+        def adaptativa_recursiva(a, b, tol, profundidad, detalles):
+            if profundidad > max_profundidad:
+                raise ValueError(f"Profundidad máxima de recursión ({max_profundidad}) alcanzada")
             
-            derivadas.append(derivada)
-            calculos.append(calculo)
+            c = (a + b) / 2
+            
+            # Integrar todo el intervalo
+            I = simpson_simple(a, b, f_func)
+            
+            # Integrar los dos subintervalos
+            I_left = simpson_simple(a, c, f_func)
+            I_right = simpson_simple(c, b, f_func)
+            I_sum = I_left + I_right
+            
+            # Estimar el error
+            error = abs(I_sum - I) / 15  # Factor de error para Simpson
+            
+            # Si el error es menor que la tolerancia, retornar
+            if error < tol or profundidad >= max_profundidad:
+                detalles['evaluaciones'] = detalles.get('evaluaciones', 0) + 4
+                return I_sum
+            
+            # Si no, recursivamente subdividir
+            detalles['evaluaciones'] = detalles.get('evaluaciones', 0) + 4
+            mid_left = adaptativa_recursiva(a, c, tol / 2, profundidad + 1, detalles)
+            mid_right = adaptativa_recursiva(c, b, tol / 2, profundidad + 1, detalles)
+            
+            return mid_left + mid_right
         
         detalles = {
-            'metodo': 'Derivación 2 Puntos Hacia Atrás',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Cuadratura Adaptiva (Simpson Adaptativo)',
+            'a': a,
+            'b': b,
+            'f_expr': f_expr,
+            'tolerancia': tolerancia,
+            'evaluaciones': 0
         }
         
-        return derivadas, detalles
+        integral = adaptativa_recursiva(a, b, tolerancia, 0, detalles)
+        detalles['integral'] = integral
+        
+        return integral, detalles
+
+
+class SistemasLineales:
+    """Métodos para resolver sistemas de ecuaciones lineales"""
     
     @staticmethod
-    def dos_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def eliminacion_gaussiana_simple(A: List[List[float]], b: List[float]) -> Tuple[List[float], dict]:
         """
-        Derivación con 2 puntos centrada
-        f'(x) ≈ (f(x+h) - f(x-h)) / (2h)
+        Eliminación Gaussiana simple sin pivoteo
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            A: Matriz de coeficientes (n x n)
+            b: Vector de términos independientes
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Tupla (solución, detalles)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
+        n = len(b)
         
-        if n < 3:
-            raise ValueError("Se necesitan al menos 3 puntos para derivación centrada")
+        # Crear matriz aumentada
+        M = np.column_stack([A, b])
         
-        derivadas = []
-        calculos = []
+        # Eliminación hacia adelante
+        for k in range(n - 1):
+            for i in range(k + 1, n):
+                if abs(M[k, k]) < 1e-10:
+                    raise ValueError(f"Matriz singular o mal condicionada (pivote cercano a cero en posición {k}, {k})")
+                factor = M[i, k] / M[k, k]
+                M[i, k:] = M[i, k:] - factor * M[k, k:]
         
-        for i in range(n):
-            if i == 0 or i == n - 1:
-                # No se puede calcular en los extremos
-                derivada = None
-                calculo = "No calculable (punto extremo)"
-            else:
-                # Fórmula: f'(x) = (f(x+h) - f(x-h)) / (2h)
-                derivada = (y[i+1] - y[i-1]) / (2 * h)
-                calculo = f"({y[i+1]:.6f} - {y[i-1]:.6f}) / {2*h}"
-            
-            derivadas.append(derivada)
-            calculos.append(calculo)
+        # Sustitución hacia atrás
+        x = np.zeros(n)
+        for i in range(n - 1, -1, -1):
+            x[i] = (M[i, -1] - np.dot(M[i, i+1:n], x[i+1:n])) / M[i, i]
         
         detalles = {
-            'metodo': 'Derivación 2 Puntos Centrada',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Eliminación Gaussiana Simple',
+            'matriz_original': [[float(val) for val in row] for row in A],
+            'vector_b': [float(val) for val in b],
+            'matriz_escalonada': [[float(val) for val in row] for row in M[:, :-1]],
+            'determinante': float(np.linalg.det(A)),
+            'numero_condicion': float(np.linalg.cond(A))
         }
         
-        return derivadas, detalles
+        return [float(val) for val in x], detalles
     
     @staticmethod
-    def tres_puntos_atras(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def eliminacion_gaussiana_pivoteo_parcial(A: List[List[float]], b: List[float]) -> Tuple[List[float], dict]:
         """
-        Derivación con 3 puntos hacia atrás
-        f'(x) ≈ (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
+        Eliminación Gaussiana con pivoteo parcial
         
         Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
+            A: Matriz de coeficientes
+            b: Vector de términos independientes
         
         Returns:
-            Tupla (derivadas, detalles_cálculo)
+            Tupla (solución, detalles)
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
-        
-        if n < 3:
-            raise ValueError("Se necesitan al menos 3 puntos")
-        
-        derivadas = []
-        calculos = []
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
+        n = len(b)
         
-        for i in range(n):
-            if i < 2:
-                # No se puede calcular en los dos primeros puntos
-                derivada = None
-                calculo = "No calculable"
-            else:
-                # Fórmula: f'(x) = (3f(x) - 4f(x-h) + f(x-2h)) / (2h)
-                derivada = (3 * y[i] - 4 * y[i-1] + y[i-2]) / (2 * h)
-                calculo = f"(3*{y[i]:.6f} - 4*{y[i-1]:.6f} + {y[i-2]:.6f}) / {2*h}"
+        # Crear matriz aumentada
+        M = np.column_stack([A, b])
+        permutaciones = list(range(n))
+        
+        # Eliminación hacia adelante con pivoteo parcial
+        for k in range(n - 1):
+            # Encontrar pivote máximo
+            max_idx = k + np.argmax(np.abs(M[k:n, k]))
             
-            derivadas.append(derivada)
-            calculos.append(calculo)
+            # Intercambiar filas
+            M[[k, max_idx]] = M[[max_idx, k]]
+            permutaciones[k], permutaciones[max_idx] = permutaciones[max_idx], permutaciones[k]
+            
+            if abs(M[k, k]) < 1e-10:
+                raise ValueError("Matriz singular o mal condicionada")
+            
+            # Eliminación
+            for i in range(k + 1, n):
+                factor = M[i, k] / M[k, k]
+                M[i, k:] = M[i, k:] - factor * M[k, k:]
+        
+        # Sustitución hacia atrás
+        x = np.zeros(n)
+        for i in range(n - 1, -1, -1):
+            x[i] = (M[i, -1] - np.dot(M[i, i+1:n], x[i+1:n])) / M[i, i]
         
         detalles = {
-            'metodo': 'Derivación 3 Puntos Hacia Atrás',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Eliminación Gaussiana con Pivoteo Parcial',
+            'permutaciones': [int(p) for p in permutaciones],
+            'matriz_escalonada': [[float(val) for val in row] for row in M[:, :-1]]
         }
         
-        return derivadas, detalles
+        return [float(val) for val in x], detalles
     
     @staticmethod
-    def tres_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def eliminacion_gaussiana_pivoteo_total(A: List[List[float]], b: List[float]) -> Tuple[List[float], dict]:
         """
-        Derivación con 3 puntos centrada
-        f'(x) ≈ (-f(x+h) + f(x-h)) / (2h)
-        
-        Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
-        
-        Returns:
-            Tupla (derivadas, detalles_cálculo)
+        Eliminación Gaussiana con pivoteo total
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
+        n = len(b)
         
-        if n < 3:
-            raise ValueError("Se necesitan al menos 3 puntos")
+        M = np.column_stack([A, b])
+        perm_filas = list(range(n))
+        perm_cols = list(range(n))
         
-        derivadas = []
-        calculos = []
+        for k in range(n - 1):
+            # Encontrar pivote máximo en toda la submatriz
+            max_val = 0
+            max_i, max_j = k, k
+            for i in range(k, n):
+                for j in range(k, n):
+                    if abs(M[i, j]) > abs(M[max_i, max_j]):
+                        max_i, max_j = i, j
+            
+            # Intercambiar filas
+            M[[k, max_i]] = M[[max_i, k]]
+            perm_filas[k], perm_filas[max_i] = perm_filas[max_i], perm_filas[k]
+            
+            # Intercambiar columnas
+            M[:, [k, max_j]] = M[:, [max_j, k]]
+            perm_cols[k], perm_cols[max_j] = perm_cols[max_j], perm_cols[k]
+            
+            if abs(M[k, k]) < 1e-10:
+                raise ValueError("Matriz singular")
+            
+            for i in range(k + 1, n):
+                factor = M[i, k] / M[k, k]
+                M[i, k:] = M[i, k:] - factor * M[k, k:]
+        
+        # Sustitución hacia atrás
+        x = np.zeros(n)
+        for i in range(n - 1, -1, -1):
+            x[i] = (M[i, -1] - np.dot(M[i, i+1:n], x[i+1:n])) / M[i, i]
         
+        # Reordenar solución según permutación de columnas
+        x_reordenada = np.zeros(n)
         for i in range(n):
-            if i == 0 or i == n - 1:
-                # No se puede calcular en los extremos
-                derivada = None
-                calculo = "No calculable (punto extremo)"
-            else:
-                # Fórmula: f'(x) = (-f(x+h) + f(x-h)) / (2h)
-                derivada = (-y[i+1] + y[i-1]) / (2 * h)
-                calculo = f"(-{y[i+1]:.6f} + {y[i-1]:.6f}) / {2*h}"
-            
-            derivadas.append(derivada)
-            calculos.append(calculo)
+            x_reordenada[perm_cols[i]] = x[i]
         
         detalles = {
-            'metodo': 'Derivación 3 Puntos Centrada',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Eliminación Gaussiana con Pivoteo Total',
+            'permutaciones_filas': [int(p) for p in perm_filas],
+            'permutaciones_columnas': [int(p) for p in perm_cols]
         }
         
-        return derivadas, detalles
+        return [float(val) for val in x_reordenada], detalles
     
     @staticmethod
-    def cinco_puntos_centrada(x: List[float], y: List[float], h: float) -> Tuple[List[float], dict]:
+    def factorizacion_lu(A: List[List[float]]) -> Tuple[List[List[float]], List[List[float]], dict]:
         """
-        Derivación con 5 puntos centrada
-        f'(x) ≈ (-f(x+2h) + 8f(x+h) - 8f(x-h) + f(x-2h)) / (12h)
-        
-        Args:
-            x: Lista de valores x
-            y: Lista de valores y (función en los puntos)
-            h: Tamaño del paso
-        
-        Returns:
-            Tupla (derivadas, detalles_cálculo)
+        Factorización LU
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
-        
-        if n < 5:
-            raise ValueError("Se necesitan al menos 5 puntos")
+        A = np.array(A, dtype=float)
+        n = len(A)
         
-        derivadas = []
-        calculos = []
+        L = np.eye(n)
+        U = np.copy(A)
         
-        for i in range(n):
-            if i < 2 or i >= n - 2:
-                # No se puede calcular en los extremos
-                derivada = None
-                calculo = "No calculable"
-            else:
-                # Fórmula: f'(x) = (-f(x+2h) + 8f(x+h) - 8f(x-h) + f(x-2h)) / (12h)
-                derivada = (-y[i+2] + 8*y[i+1] - 8*y[i-1] + y[i-2]) / (12 * h)
-                calculo = f"(-{y[i+2]:.6f} + 8*{y[i+1]:.6f} - 8*{y[i-1]:.6f} + {y[i-2]:.6f}) / {12*h}"
+        for k in range(n - 1):
+            if abs(U[k, k]) < 1e-10:
+                raise ValueError("Factorización LU no es posible sin pivoteo")
             
-            derivadas.append(derivada)
-            calculos.append(calculo)
+            for i in range(k + 1, n):
+                L[i, k] = U[i, k] / U[k, k]
+                U[i, k:] = U[i, k:] - L[i, k] * U[k, k:]
+                U[i, k] = 0
         
         detalles = {
-            'metodo': 'Derivación 5 Puntos Centrada',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso': h,
-            'derivadas': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in derivadas],
-            'calculos': calculos
+            'metodo': 'Factorización LU',
+            'matriz_L': [[float(val) for val in row] for row in L],
+            'matriz_U': [[float(val) for val in row] for row in U],
+            'verificacion': bool(np.allclose(np.dot(L, U), A))
         }
         
-        return derivadas, detalles
+        return [[float(val) for val in row] for row in L], [[float(val) for val in row] for row in U], detalles
     
     @staticmethod
-    def extrapolacion_richardson(x: List[float], y: List[float], h1: float, h2: float, 
-                                 metodo: str = 'centrada') -> Tuple[List[float], dict]:
+    def factorizacion_plu(A: List[List[float]]) -> Tuple[List[List[float]], List[List[float]], List[List[float]], dict]:
         """
-        Extrapolación de Richardson para mejorar estimaciones de derivadas
-        
-        Args:
-            x: Lista de valores x
-            y: Lista de valores y
-            h1: Primer tamaño de paso
-            h2: Segundo tamaño de paso
-            metodo: 'centrada' o 'atras'
-        
-        Returns:
-            Tupla (derivadas mejoradas, detalles_cálculo)
+        Factorización PLU con pivoteo parcial
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
-        n = len(x)
+        A = np.array(A, dtype=float)
+        n = len(A)
         
-        if metodo == 'centrada':
-            if n < 3:
-                raise ValueError("Se necesitan al menos 3 puntos")
+        P = np.eye(n)
+        L = np.eye(n)
+        U = np.copy(A)
+        
+        for k in range(n - 1):
+            # Encontrar pivote
+            max_idx = k + np.argmax(np.abs(U[k:n, k]))
             
-            der1 = []
-            der2 = []
-            der_richardson = []
-            calculos = []
+            # Intercambiar filas en U
+            U[[k, max_idx]] = U[[max_idx, k]]
             
-            for i in range(n):
-                if i == 0 or i == n - 1:
-                    der1.append(None)
-                    der2.append(None)
-                    der_richardson.append(None)
-                    calculos.append("No calculable (punto extremo)")
-                else:
-                    d1 = (y[i+1] - y[i-1]) / (2 * h1)
-                    d2 = (y[i+1] - y[i-1]) / (2 * h2)
-                    
-                    # Richardson: D_R = (4*D_h2 - D_h1) / 3
-                    d_r = (4*d2 - d1) / 3
-                    
-                    der1.append(d1)
-                    der2.append(d2)
-                    der_richardson.append(d_r)
-                    calculos.append(f"h1={h1}: {d1:.6f}, h2={h2}: {d2:.6f}, Richardson: {d_r:.6f}")
+            # Intercambiar filas en L (excluyendo diagonal)
+            L[[k, max_idx], :k] = L[[max_idx, k], :k]
             
-        else:  # atras
-            if n < 2:
-                raise ValueError("Se necesitan al menos 2 puntos")
+            # Actualizar P
+            P[[k, max_idx]] = P[[max_idx, k]]
             
-            der1 = []
-            der2 = []
-            der_richardson = []
-            calculos = []
+            if abs(U[k, k]) < 1e-10:
+                raise ValueError("Matriz singular")
             
-            for i in range(n):
-                if i == 0:
-                    der1.append(None)
-                    der2.append(None)
-                    der_richardson.append(None)
-                    calculos.append("No calculable (primer punto)")
-                else:
-                    d1 = (y[i] - y[i-1]) / h1
-                    d2 = (y[i] - y[i-1]) / h2
-                    
-                    # Richardson
-                    d_r = (4*d2 - d1) / 3
-                    
-                    der1.append(d1)
-                    der2.append(d2)
-                    der_richardson.append(d_r)
-                    calculos.append(f"h1={h1}: {d1:.6f}, h2={h2}: {d2:.6f}, Richardson: {d_r:.6f}")
+            for i in range(k + 1, n):
+                L[i, k] = U[i, k] / U[k, k]
+                U[i, k:] = U[i, k:] - L[i, k] * U[k, k:]
+                U[i, k] = 0
         
         detalles = {
-            'metodo': f'Extrapolación Richardson ({metodo})',
-            'nodos_x': x.tolist(),
-            'nodos_y': y.tolist(),
-            'paso_1': h1,
-            'paso_2': h2,
-            'derivadas_h1': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in der1],
-            'derivadas_h2': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in der2],
-            'derivadas_richardson': [d.tolist() if isinstance(d, (np.ndarray, float)) and d is not None else d for d in der_richardson],
-            'calculos': calculos
+            'metodo': 'Factorización PLU',
+            'verificacion': bool(np.allclose(np.dot(P, np.dot(L, U)), A))
         }
         
-        return der_richardson, detalles
-
-class Integracion:
-    """Métodos de integración numérica"""
+        return [[float(val) for val in row] for row in P], [[float(val) for val in row] for row in L], [[float(val) for val in row] for row in U], detalles
     
     @staticmethod
-    def trapecio(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
+    def factorizacion_llt(A: List[List[float]]) -> Tuple[List[List[float]], dict]:
         """
-        Regla del Trapecio
-        
-        Args:
-            a: Límite inferior
-            b: Límite superior
-            n: Número de subintervalos
-            f_values: Valores de la función en los puntos
-        
-        Returns:
-            Tupla (valor_integral, detalles_cálculo)
+        Factorización LLT (Cholesky) - para matrices simétricas positivas definidas
         """
-        h = (b - a) / n
-        suma = f_values[0] + f_values[-1]
+        A = np.array(A, dtype=float)
+        n = len(A)
         
-        for i in range(1, n):
-            suma += 2 * f_values[i]
+        # Verificar que sea simétrica
+        if not np.allclose(A, A.T):
+            raise ValueError("La matriz debe ser simétrica")
         
-        integral = (h / 2) * suma
+        L = np.zeros((n, n))
+        
+        for i in range(n):
+            for j in range(i + 1):
+                suma = np.sum(L[i, :j] * L[j, :j])
+                if i == j:
+                    val = A[i, i] - suma
+                    if val <= 0:
+                        raise ValueError("La matriz no es positiva definida")
+                    L[i, j] = np.sqrt(val)
+                else:
+                    L[i, j] = (A[i, j] - suma) / L[j, j]
         
         detalles = {
-            'metodo': 'Trapecio',
-            'a': a,
-            'b': b,
-            'n': n,
-            'h': h,
-            'suma': suma,
-            'integral': integral
+            'metodo': 'Factorización LLT (Cholesky)',
+            'matriz_L': [[float(val) for val in row] for row in L],
+            'verificacion': bool(np.allclose(np.dot(L, L.T), A))
         }
         
-        return integral, detalles
+        return [[float(val) for val in row] for row in L], detalles
     
     @staticmethod
-    def simpson_1_3(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
+    def tridiagonal(a: List[float], b: List[float], c: List[float], d: List[float]) -> Tuple[List[float], dict]:
         """
-        Regla de Simpson 1/3
+        Algoritmo de Thomas para sistemas tridiagonales
+        
+        Resuelve el sistema en O(n) operaciones y memoria, sin formar la matriz.
         
         Args:
-            a: Límite inferior
-            b: Límite superior
-            n: Número de subintervalos (debe ser par)
-            f_values: Valores de la función en los puntos
+            a: Subdiagonal (n - 1 valores)
+            b: Diagonal principal (n valores)
+            c: Superdiagonal (n - 1 valores)
+            d: Vector de términos independientes (n valores)
         
         Returns:
-            Tupla (valor_integral, detalles_cálculo)
+            Tupla (solución, detalles)
         """
-        if n % 2 != 0:
-            raise ValueError("Para Simpson 1/3, n debe ser par")
+        a, b, c, d = (np.asarray(v, dtype=float) for v in (a, b, c, d))
+        n = len(b)
+        if n == 0 or len(d) != n or len(a) != n - 1 or len(c) != n - 1:
+            raise ValueError("Se requieren n valores en b y d y n - 1 en a y c")
         
-        h = (b - a) / n
-        suma_impar = sum(f_values[i] for i in range(1, n, 2))
-        suma_par = sum(f_values[i] for i in range(2, n-1, 2))
+        x = _thomas(a, b, c, d)
         
-        integral = (h / 3) * (f_values[0] + 4*suma_impar + 2*suma_par + f_values[-1])
+        residuo = b * x - d
+        residuo[1:] += a * x[:-1]
+        residuo[:-1] += c * x[1:]
+        dominante = np.abs(b) >= np.abs(np.concatenate(([0.0], a))) + np.abs(np.concatenate((c, [0.0])))
         
         detalles = {
-            'metodo': 'Simpson 1/3',
-            'a': a,
-            'b': b,
+            'metodo': 'Algoritmo de Thomas (Tridiagonal)',
             'n': n,
-            'h': h,
-            'suma_impar': suma_impar,
-            'suma_par': suma_par,
-            'integral': integral
+            'diagonalmente_dominante': bool(np.all(dominante)),
+            'residuo': float(np.max(np.abs(residuo)))
         }
         
-        return integral, detalles
+        return x.tolist(), detalles
+
+
+class EcuacionesDiferenciales:
+    """Métodos para resolver ecuaciones diferenciales ordinarias"""
     
     @staticmethod
-    def simpson_3_8(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
+    def euler(x0: float, y0: float, xf: float, n: int, f_expr: str,
+              eventos: list = None, salida: dict = None) -> Tuple[List, List, dict]:
         """
-        Regla de Simpson 3/8
+        Método de Euler
         
         Args:
-            a: Límite inferior
-            b: Límite superior
-            n: Número de subintervalos (debe ser múltiplo de 3)
-            f_values: Valores de la función en los puntos
+            x0: Condición inicial x
+            y0: Condición inicial y
+            xf: Valor final de x
+            n: Número de pasos
+            f_expr: Función como string (ej: 'x + y')
+            eventos: Funciones de evento g(x, y) (ver _DetectorEventos); un
+                     evento terminal detiene la integración en su cruce por cero
+            salida: Muestreo de la salida (ver _Muestreo); por defecto todos los pasos
         
         Returns:
-            Tupla (valor_integral, detalles_cálculo)
+            Tupla (x_valores, y_valores, detalles)
         """
-        if n % 3 != 0:
-            raise ValueError("Para Simpson 3/8, n debe ser múltiplo de 3")
+        h = (xf - x0) / n
+        f = _compilar_ode(f_expr)
         
-        h = (b - a) / n
-        suma1 = sum(f_values[i] for i in range(1, n, 3))
-        suma2 = sum(f_values[i] for i in range(2, n, 3))
-        suma3 = sum(f_values[i] for i in range(3, n, 3))
+        muestreo = _Muestreo(salida, x0, xf, n, f)
+        detector = _DetectorEventos(eventos, 1) if eventos else None
+        if detector is not None:
+            detector.iniciar(x0, y0)
+            F = lambda xi, Y: np.array([f(xi, Y[0])], dtype=float)
         
-        integral = (3*h / 8) * (f_values[0] + 3*suma1 + 3*suma2 + 2*suma3 + f_values[-1])
+        xi, yi = x0, y0
+        muestreo.registrar(0, xi, yi)
+        
+        for i in range(n):
+            # Evaluar f(x, y)
+            f_val = float(f(xi, yi))
+            
+            yi_new = yi + h * f_val
+            xi_new = x0 + (i + 1) * h
+            
+            if detector is not None:
+                evento = detector.revisar(F, xi, yi, xi_new, yi_new)
+                if evento is not None:
+                    muestreo.terminar(evento[0], float(evento[1][0]))
+                    break
+        
+            muestreo.registrar(i + 1, xi_new, yi_new)
+            xi, yi = xi_new, yi_new
         
         detalles = {
-            'metodo': 'Simpson 3/8',
-            'a': a,
-            'b': b,
+            'metodo': 'Euler',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
             'n': n,
             'h': h,
-            'integral': integral
+            'funcion': f_expr
         }
+        if detector is not None:
+            detalles.update(detector.detalles())
+        if salida:
+            detalles.update(muestreo.detalles())
         
-        return integral, detalles
+        return muestreo.xs, muestreo.ys, detalles
     
     @staticmethod
-    def cuadratura_gaussiana(a: float, b: float, f_values: List[float], n_points: int = 2) -> Tuple[float, dict]:
+    def _taylor_derivatives(f_expr: str, order: int, constantes: Tuple[str, ...] = ()) -> List[str]:
         """
-        Cuadratura Gaussiana (Gauss-Legendre)
+        Calcula simbólicamente f, f', f'', f''' como strings usando derivada total.
+        
+        Para una EDO dy/dx = f(x,y):
+        - f(x,y)
+        - f'(x,y) = ∂f/∂x + ∂f/∂y * f
+        - f''(x,y) = ∂f'/∂x + ∂f'/∂y * f
+        - f'''(x,y) = ∂f''/∂x + ∂f''/∂y * f
         
         Args:
-            a: Límite inferior
-            b: Límite superior
-            f_values: Valores de la función en los puntos
-            n_points: Número de puntos de Gauss
+            f_expr: Expresión de la función f(x,y)
+            order: Número de derivadas a calcular (1, 2 o 3)
+            constantes: Nombres de parámetros que pueden aparecer en f (ej: ('p',))
         
         Returns:
-            Tupla (valor_integral, detalles_cálculo)
+            Lista de strings [f, f', f'', f'''] hasta el orden especificado
         """
-        # Puntos y pesos de Gauss-Legendre para 2 y 3 puntos
-        if n_points == 2:
-            x = [-1/np.sqrt(3), 1/np.sqrt(3)]
-            w = [1, 1]
-        elif n_points == 3:
-            x = [-np.sqrt(3/5), 0, np.sqrt(3/5)]
-            w = [5/9, 8/9, 5/9]
-        else:
-            raise ValueError("Solo soporta 2 o 3 puntos de Gauss")
+        return [str(d) for d in _taylor_ode(f_expr, constantes).derivadas(order)]
+    
+    @staticmethod
+    def _integrar_taylor(x0: float, y0: float, xf: float, n: int, f_expr: str, orden: int,
+                         salida: dict = None):
+        """
+        Integra con el método de Taylor de orden + 1 usando el núcleo fusionado.
         
-        # Transformar al intervalo [a, b]
-        integral = 0
-        for i in range(n_points):
-            t = ((b - a) * x[i] + (a + b)) / 2
-            integral += w[i] * f_values[i]
+        Returns:
+            Tupla (x_valores, y_valores, h, [f, f', ...] como strings, muestreo)
+        """
+        h = (xf - x0) / n
+        serie = _taylor_ode(f_expr)
+        nucleo = serie.nucleo(orden, escalar=True)
         
-        integral *= (b - a) / 2
+        muestreo = _Muestreo(salida, x0, xf, n, lambda x, y: nucleo(x, y)[0])
+        xi, yi = float(x0), float(y0)
+        muestreo.registrar(0, xi, yi)
+        try:
+            for i in range(n):
+                yi = _paso_taylor(nucleo, xi, yi, h)
+                xi = x0 + (i + 1) * h
+                muestreo.registrar(i + 1, xi, yi)
+        except (ValueError, OverflowError, ZeroDivisionError) as e:
+            raise ValueError(f"No se pudo evaluar la serie de Taylor en x = {xi:.6g}: {str(e)}")
+        
+        return muestreo.xs, muestreo.ys, h, [str(d) for d in serie.derivadas(orden)], muestreo
+    
+    @staticmethod
+    def taylor_orden_2(x0: float, y0: float, xf: float, n: int, f_expr: str,
+                        salida: dict = None) -> Tuple[List, List, dict]:
+        """
+        Método de Taylor orden 2.
+        Calcula automáticamente la derivada f' usando derivada total.
+        """
+        x, y, h, derivs, muestreo = EcuacionesDiferenciales._integrar_taylor(x0, y0, xf, n, f_expr, 1, salida)
         
         detalles = {
-            'metodo': f'Cuadratura Gaussiana ({n_points} puntos)',
-            'a': a,
-            'b': b,
-            'n_points': n_points,
-            'integral': integral
+            'metodo': 'Taylor Orden 2',
+            'x0': x0,
+            'y0': y0,
+            'h': h,
+            'n': n,
+            'f_expr': derivs[0],
+            'df_expr': derivs[1]
         }
         
-        return integral, detalles
+        if salida:
+            detalles.update(muestreo.detalles())
+        
+        return x, y, detalles
     
     @staticmethod
-    def trapecio_multiple(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
+    def taylor_orden_3(x0: float, y0: float, xf: float, n: int, f_expr: str,
+                        salida: dict = None) -> Tuple[List, List, dict]:
         """
-        Integración múltiple con Trapecio (2D)
+        Método de Taylor orden 3.
+        Calcula automáticamente las derivadas f' y f'' usando derivada total.
+        """
+        x, y, h, derivs, muestreo = EcuacionesDiferenciales._integrar_taylor(x0, y0, xf, n, f_expr, 2, salida)
         
-        Args:
-            a: Límite inferior
-            b: Límite superior
-            n: Número de subintervalos
-            f_values: Matriz de valores de la función
+        detalles = {
+            'metodo': 'Taylor Orden 3',
+            'x0': x0,
+            'y0': y0,
+            'h': h,
+            'n': n,
+            'f_expr': derivs[0],
+            'df_expr': derivs[1],
+            'ddf_expr': derivs[2]
+        }
         
-        Returns:
-            Tupla (valor_integral, detalles_cálculo)
+        if salida:
+            detalles.update(muestreo.detalles())
+        
+        return x, y, detalles
+    
+    @staticmethod
+    def taylor_orden_4(x0: float, y0: float, xf: float, n: int, f_expr: str,
+                        salida: dict = None) -> Tuple[List, List, dict]:
         """
-        h = (b - a) / n
-        integral = Integracion.trapecio(a, b, n, f_values)[0]
+        Método de Taylor orden 4.
+        Calcula automáticamente las derivadas f', f'' y f''' usando derivada total.
+        """
+        x, y, h, derivs, muestreo = EcuacionesDiferenciales._integrar_taylor(x0, y0, xf, n, f_expr, 3, salida)
         
         detalles = {
-            'metodo': 'Trapecio Múltiple',
-            'a': a,
-            'b': b,
-            'n': n,
+            'metodo': 'Taylor Orden 4',
+            'x0': x0,
+            'y0': y0,
             'h': h,
-            'integral': integral
+            'n': n,
+            'f_expr': derivs[0],
+            'df_expr': derivs[1],
+            'ddf_expr': derivs[2],
+            'dddf_expr': derivs[3]
         }
         
-        return integral, detalles
+        if salida:
+            detalles.update(muestreo.detalles())
+        
+        return x, y, detalles
     
     @staticmethod
-    def simpson_1_3_multiple(a: float, b: float, n: int, f_values: List[float]) -> Tuple[float, dict]:
+    def taylor_serie(x0: float, y0: float, xf: float, n: int, f_expr: str, tolerancia: float = 1e-12,
+                     orden: int = None, x_salida: List[float] = None,
+                     max_pasos: int = 100000) -> Tuple[List, List, dict]:
         """
-        Integración múltiple con Simpson 1/3 (2D)
+        Método de Taylor de orden alto con diferenciación automática
+        
+        Los coeficientes de la serie se obtienen con recurrencias sobre series
+        truncadas, sin derivadas simbólicas, así que el orden puede ser de 20
+        o más. Orden y paso se eligen según la tolerancia (Jorba y Zou). Como
+        en dormand_prince, n solo fija los puntos de salida, que se evalúan
+        con la serie de cada paso (0 para devolver los pasos).
         
         Args:
-            a: Límite inferior
-            b: Límite superior
-            n: Número de subintervalos (debe ser par)
-            f_values: Matriz de valores de la función
+            x0: Condición inicial x
+            y0: Condición inicial y
+            xf: Valor final de x
+            n: Número de intervalos de salida
+            f_expr: Función como string
+            tolerancia: Tolerancia del error local
+            orden: Orden de la serie (automático según la tolerancia si es None)
+            x_salida: Puntos de salida explícitos (reemplaza a n)
+            max_pasos: Máximo de pasos
+        
+        Returns:
+            Tupla (x_valores, y_valores, detalles)
+        """
+        expr_str = _process_implicit_multiplication_metodos(f_expr.replace('y1', 'y'))
+        serie = _compilar_serie_taylor([expr_str])
+        
+        if x_salida is None and n:
+            x_salida = np.linspace(x0, xf, n + 1)
+        
+        x, Y, estadisticas = _integrar_serie_taylor(serie, x0, np.array([y0], dtype=float), xf,
+                                                    tolerancia, orden, x_salida, max_pasos)
+        
+        detalles = {
+            'metodo': f'Taylor por Diferenciación Automática (Orden {estadisticas["orden"]})',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': len(x) - 1,
+            'tolerancia': tolerancia,
+            'salida_densa': x_salida is not None,
+            'funcion': f_expr
+        }
+        detalles.update(estadisticas)
+        
+        return _como_lista(x), _como_lista(Y[:, 0]), detalles
+    
+    @staticmethod
+    def runge_kutta_3(x0: float, y0: float, xf: float, n: int, f_expr: str,
+                      salida: dict = None) -> Tuple[List, List, dict]:
+        """
+        Método de Runge-Kutta orden 3
         
-        Returns:
-            Tupla (valor_integral, detalles_cálculo)
+        Acepta salida como euler.
         """
-        if n % 2 != 0:
-            raise ValueError("Para Simpson 1/3 múltiple, n debe ser par")
+        h = (xf - x0) / n
+        f = _compilar_ode(f_expr)
         
-        integral = Integracion.simpson_1_3(a, b, n, f_values)[0]
+        muestreo = _Muestreo(salida, x0, xf, n, f)
+        xi, yi = x0, y0
+        muestreo.registrar(0, xi, yi)
+        
+        for i in range(n):
+            k1 = float(f(xi, yi))
+            k2 = float(f(xi + h/2, yi + h/2 * k1))
+            k3 = float(f(xi + h, yi - h * k1 + 2 * h * k2))
+            
+            yi = yi + (h / 6) * (k1 + 4 * k2 + k3)
+            xi = x0 + (i + 1) * h
+            
+            muestreo.registrar(i + 1, xi, yi)
         
         detalles = {
-            'metodo': 'Simpson 1/3 Múltiple',
-            'a': a,
-            'b': b,
-            'n': n,
-            'integral': integral
+            'metodo': 'Runge-Kutta Orden 3',
+            'h': h,
+            'n': n
         }
+        if salida:
+            detalles.update(muestreo.detalles())
         
-        return integral, detalles
+        return muestreo.xs, muestreo.ys, detalles
     
     @staticmethod
-    def extrapolacion_richardson_integracion(a: float, b: float, n1: int, n2: int, f_values_n1: List[float], f_values_n2: List[float]) -> Tuple[float, dict]:
+    def runge_kutta_4(x0: float, y0: float, xf: float, n: int, f_expr: str,
+                      eventos: list = None, salida: dict = None) -> Tuple[List, List, dict]:
         """
-        Extrapolación de Richardson para integración
-        
-        Args:
-            a: Límite inferior
-            b: Límite superior
-            n1: Primer número de subintervalos
-            n2: Segundo número de subintervalos
-            f_values_n1: Valores con n1 intervalos
-            f_values_n2: Valores con n2 intervalos
+        Método de Runge-Kutta orden 4
         
-        Returns:
-            Tupla (valor_integral, detalles_cálculo)
+        Acepta eventos y salida como euler.
         """
-        I_n1, _ = Integracion.trapecio(a, b, n1, f_values_n1)
-        I_n2, _ = Integracion.trapecio(a, b, n2, f_values_n2)
+        h = (xf - x0) / n
+        f = _compilar_ode(f_expr)
         
-        # Extrapolación de Richardson para trapecio: p = 2
-        integral = (4 * I_n2 - I_n1) / 3
+        muestreo = _Muestreo(salida, x0, xf, n, f)
+        detector = _DetectorEventos(eventos, 1) if eventos else None
+        if detector is not None:
+            detector.iniciar(x0, y0)
+            F = lambda xi, Y: np.array([f(xi, Y[0])], dtype=float)
+        
+        xi, yi = x0, y0
+        muestreo.registrar(0, xi, yi)
+        
+        for i in range(n):
+            k1 = float(f(xi, yi))
+            k2 = float(f(xi + h/2, yi + h/2 * k1))
+            k3 = float(f(xi + h/2, yi + h/2 * k2))
+            k4 = float(f(xi + h, yi + h * k3))
+            
+            yi_new = yi + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
+            xi_new = x0 + (i + 1) * h
+            
+            if detector is not None:
+                evento = detector.revisar(F, xi, yi, xi_new, yi_new)
+                if evento is not None:
+                    muestreo.terminar(evento[0], float(evento[1][0]))
+                    break
+        
+            muestreo.registrar(i + 1, xi_new, yi_new)
+            xi, yi = xi_new, yi_new
         
         detalles = {
-            'metodo': 'Extrapolación Richardson (Integración)',
-            'a': a,
-            'b': b,
-            'n1': n1,
-            'n2': n2,
-            'I_n1': I_n1,
-            'I_n2': I_n2,
-            'integral': integral
+            'metodo': 'Runge-Kutta Orden 4',
+            'h': h,
+            'n': n,
+            'funcion': f_expr
         }
+        if detector is not None:
+            detalles.update(detector.detalles())
+        if salida:
+            detalles.update(muestreo.detalles())
         
-        return integral, detalles
+        return muestreo.xs, muestreo.ys, detalles
     
     @staticmethod
-    def cuadratura_adaptiva(f_expr: str, a: float, b: float, tolerancia: float = 1e-6, max_profundidad: int = 50) -> Tuple[float, dict]:
+    def runge_kutta_fehlberg(x0: float, y0: float, xf: float, n: int, f_expr: str,
+                             tolerancia: float = None, max_pasos: int = 100000,
+                             salida: dict = None) -> Tuple[List, List, dict]:
         """
-        Cuadratura Adaptiva (Integración Adaptativa)
+        Método de Runge-Kutta-Fehlberg (4-5)
         
-        Utiliza el método Simpson recursivo con división adaptativa de intervalos
+        Sin tolerancia usa n pasos fijos. Con tolerancia el paso es adaptativo:
+        la diferencia entre las soluciones de orden 4 y 5 estima el error local,
+        los pasos con error mayor a la tolerancia se rechazan y el siguiente
+        paso se elige con un controlador PI. En ese modo n solo define el
+        paso inicial (xf - x0) / n.
         
         Args:
-            f_expr: Expresión de la función como string
-            a: Límite inferior
-            b: Límite superior
-            tolerancia: Tolerancia de error deseada
-            max_profundidad: Profundidad máxima de recursión
+            x0: Condición inicial x
+            y0: Condición inicial y
+            xf: Valor final de x
+            n: Número de pasos (o paso inicial en modo adaptativo)
+            f_expr: Función como string
+            tolerancia: Tolerancia del error local (mixta absoluta/relativa)
+            max_pasos: Máximo de pasos intentados en modo adaptativo
+            salida: Muestreo de la salida en modo de paso fijo (ver _Muestreo); con
+                salida los errores locales se resumen en su máximo
         
         Returns:
-            Tupla (valor_integral, detalles_cálculo)
+            Tupla (x_valores, y_valores, detalles)
         """
-        from sympy import lambdify
+        h = (xf - x0) / n
+        x = [x0]
+        y = [y0]
+        f = _compilar_ode(f_expr)
+        errores = []
+        
+        if tolerancia is None:
+            muestreo = _Muestreo(salida, x0, xf, n, f)
+            xi, yi = x0, y0
+            muestreo.registrar(0, xi, yi)
+            error_max = 0.0
+            for i in range(n):
+                yi, error = _paso_rkf45(f, xi, yi, h)
+                xi = x0 + (i + 1) * h
+                muestreo.registrar(i + 1, xi, yi)
+                if salida:
+                    error_max = max(error_max, abs(error))
+                else:
+                    errores.append(abs(error))
+        
+            detalles = {
+                'metodo': 'Runge-Kutta-Fehlberg (4-5)',
+                'h': h,
+                'n': n,
+                'evaluaciones': 6 * n
+            }
+            if salida:
+                detalles['error_local_max'] = error_max
+                detalles.update(muestreo.detalles())
+            else:
+                detalles['errores_locales'] = errores
+            return muestreo.xs, muestreo.ys, detalles
         
-        # Compilar la función
-        x = symbols('x')
-        f_sym = sympify(f_expr.replace('y', 'x'))  # Reemplazar y por x si es necesario
-        f_func = lambdify(x, f_sym, 'numpy')
+        if salida:
+            raise ValueError("salida solo se aplica a runge_kutta_fehlberg de paso fijo (sin tolerancia); "
+                             "use dopri con x_salida para salida densa adaptativa")
+        if tolerancia <= 0:
+            raise ValueError("La tolerancia debe ser positiva")
         
-        # Función auxiliar para Simpson simple en un intervalo
-        def simpson_simple(a, b, f):
-            c = (a + b) / 2
-            h = (b - a) / 6
-            return h * (f(a) + 4*f(c) + f(b))
+        aceptados = 0
+        rechazados = 0
+        error_previo = 1.0
         
-        # Función recursiva para integración adaptativa
-        def adaptativa_recursiva(a, b, tol, profundidad, detalles):
-            if profundidad > max_profundidad:
-                raise ValueError(f"Profundidad máxima de recursión ({max_profundidad}) alcanzada")
-            
-            c = (a + b) / 2
-            
-            # Integrar todo el intervalo
-            I = simpson_simple(a, b, f_func)
-            
-            # Integrar los dos subintervalos
-            I_left = simpson_simple(a, c, f_func)
-            I_right = simpson_simple(c, b, f_func)
-            I_sum = I_left + I_right
-            
-            # Estimar el error
-            error = abs(I_sum - I) / 15  # Factor de error para Simpson
+        while (xf - x[-1]) * h > 0:
+            if aceptados + rechazados >= max_pasos:
+                raise ValueError(f"Se alcanzó el máximo de {max_pasos} pasos sin llegar a xf")
+        
+            xi = x[-1]
+            yi = y[-1]
             
-            # Si el error es menor que la tolerancia, retornar
-            if error < tol or profundidad >= max_profundidad:
-                detalles['evaluaciones'] = detalles.get('evaluaciones', 0) + 4
-                return I_sum
+            # No pasarse de xf
+            if abs(h) > abs(xf - xi):
+                h = xf - xi
             
-            # Si no, recursivamente subdividir
-            detalles['evaluaciones'] = detalles.get('evaluaciones', 0) + 4
-            mid_left = adaptativa_recursiva(a, c, tol / 2, profundidad + 1, detalles)
-            mid_right = adaptativa_recursiva(c, b, tol / 2, profundidad + 1, detalles)
+            yi_new, error = _paso_rkf45(f, xi, yi, h)
+            escala = tolerancia * max(1.0, abs(yi), abs(yi_new))
+            error_norm = abs(error) / escala
             
-            return mid_left + mid_right
+            if error_norm <= 1.0:
+                aceptados += 1
+                x.append(xf if abs(xf - (xi + h)) < 1e-12 * max(1.0, abs(xf)) else xi + h)
+                y.append(yi_new)
+                errores.append(abs(error))
+                h *= _factor_paso_pi(error_norm, error_previo, 5)
+                error_previo = max(error_norm, 1e-4)
+            else:
+                rechazados += 1
+                h *= _factor_paso_pi(error_norm, None, 5)
         
         detalles = {
-            'metodo': 'Cuadratura Adaptiva (Simpson Adaptativo)',
-            'a': a,
-            'b': b,
-            'f_expr': f_expr,
+            'metodo': 'Runge-Kutta-Fehlberg (4-5) Adaptativo',
             'tolerancia': tolerancia,
-            'evaluaciones': 0
+            'n': aceptados,
+            'pasos_aceptados': aceptados,
+            'pasos_rechazados': rechazados,
+            'evaluaciones': 6 * (aceptados + rechazados),
+            'errores_locales': errores,
+            'h_min': float(np.min(np.diff(x))) if aceptados else 0.0,
+            'h_max': float(np.max(np.diff(x))) if aceptados else 0.0
         }
         
-        integral = adaptativa_recursiva(a, b, tolerancia, 0, detalles)
-        detalles['integral'] = integral
-        
-        return integral, detalles
-
-
-class SistemasLineales:
-    """Métodos para resolver sistemas de ecuaciones lineales"""
+        return x, y, detalles
     
     @staticmethod
-    def eliminacion_gaussiana_simple(A: List[List[float]], b: List[float]) -> Tuple[List[float], dict]:
+    def dormand_prince(x0: float, y0: float, xf: float, n: int, f_expr: str, tolerancia: float = 1e-6,
+                       x_salida: List[float] = None, max_pasos: int = 100000) -> Tuple[List, List, dict]:
         """
-        Eliminación Gaussiana simple sin pivoteo
+        Método de Dormand-Prince 5(4) con paso adaptativo y salida densa
+        
+        La precisión la controla la tolerancia; n solo fija la densidad de la
+        salida: la solución se devuelve en n + 1 puntos equiespaciados,
+        interpolados dentro de cada paso. Con n = 0 se devuelven los puntos
+        de los pasos aceptados.
         
         Args:
-            A: Matriz de coeficientes (n x n)
-            b: Vector de términos independientes
+            x0: Condición inicial x
+            y0: Condición inicial y
+            xf: Valor final de x
+            n: Número de intervalos de salida (0 para los pasos del integrador)
+            f_expr: Función como string
+            tolerancia: Tolerancia del error local
+            x_salida: Puntos de salida explícitos (reemplaza a n)
+            max_pasos: Máximo de pasos intentados
         
         Returns:
-            Tupla (solución, detalles)
+            Tupla (x_valores, y_valores, detalles)
         """
-        A = np.array(A, dtype=float)
-        b = np.array(b, dtype=float)
-        n = len(b)
-        
-        # Crear matriz aumentada
-        M = np.column_stack([A, b])
+        f = _compilar_ode(f_expr)
+        F = lambda x, Y: np.asarray(f(x, Y[0]), dtype=float).reshape(1)
         
-        # Eliminación hacia adelante
-        for k in range(n - 1):
-            for i in range(k + 1, n):
-                if abs(M[k, k]) < 1e-10:
-                    raise ValueError(f"Matriz singular o mal condicionada (pivote cercano a cero en posición {k}, {k})")
-                factor = M[i, k] / M[k, k]
-                M[i, k:] = M[i, k:] - factor * M[k, k:]
+        if x_salida is None and n:
+            x_salida = np.linspace(x0, xf, n + 1)
         
-        # Sustitución hacia atrás
-        x = np.zeros(n)
-        for i in range(n - 1, -1, -1):
-            x[i] = (M[i, -1] - np.dot(M[i, i+1:n], x[i+1:n])) / M[i, i]
+        x, Y, estadisticas = _integrar_dormand_prince(F, x0, np.array([y0], dtype=float), xf,
+                                                      tolerancia, x_salida, max_pasos)
         
         detalles = {
-            'metodo': 'Eliminación Gaussiana Simple',
-            'matriz_original': [[float(val) for val in row] for row in A],
-            'vector_b': [float(val) for val in b],
-            'matriz_escalonada': [[float(val) for val in row] for row in M[:, :-1]],
-            'determinante': float(np.linalg.det(A)),
-            'numero_condicion': float(np.linalg.cond(A))
+            'metodo': 'Dormand-Prince 5(4)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': len(x) - 1,
+            'tolerancia': tolerancia,
+            'salida_densa': x_salida is not None,
+            'funcion': f_expr
         }
+        detalles.update(estadisticas)
         
-        return [float(val) for val in x], detalles
+        return _como_lista(x), _como_lista(Y[:, 0]), detalles
     
     @staticmethod
-    def eliminacion_gaussiana_pivoteo_parcial(A: List[List[float]], b: List[float]) -> Tuple[List[float], dict]:
+    def bulirsch_stoer(x0: float, y0: float, xf: float, n: int, f_expr: str, tolerancia: float = 1e-10,
+                       x_salida: List[float] = None, max_pasos: int = 100000) -> Tuple[List, List, dict]:
         """
-        Eliminación Gaussiana con pivoteo parcial
+        Método de Bulirsch-Stoer con orden y paso adaptativos
+        
+        Extrapola la regla del punto medio modificada; para problemas suaves
+        alcanza tolerancias muy pequeñas con pocas evaluaciones de f. Como en
+        dormand_prince, n solo fija la cantidad de puntos de salida (0 para
+        devolver los pasos del integrador).
         
         Args:
-            A: Matriz de coeficientes
-            b: Vector de términos independientes
+            x0: Condición inicial x
+            y0: Condición inicial y
+            xf: Valor final de x
+            n: Número de intervalos de salida (0 para los pasos del integrador)
+            f_expr: Función como string
+            tolerancia: Tolerancia del error local
+            x_salida: Puntos de salida explícitos (reemplaza a n)
+            max_pasos: Máximo de pasos intentados
         
         Returns:
-            Tupla (solución, detalles)
+            Tupla (x_valores, y_valores, detalles)
         """
-        A = np.array(A, dtype=float)
-        b = np.array(b, dtype=float)
-        n = len(b)
-        
-        # Crear matriz aumentada
-        M = np.column_stack([A, b])
-        permutaciones = list(range(n))
-        
-        # Eliminación hacia adelante con pivoteo parcial
-        for k in range(n - 1):
-            # Encontrar pivote máximo
-            max_idx = k + np.argmax(np.abs(M[k:n, k]))
-            
-            # Intercambiar filas
-            M[[k, max_idx]] = M[[max_idx, k]]
-            permutaciones[k], permutaciones[max_idx] = permutaciones[max_idx], permutaciones[k]
-            
-            if abs(M[k, k]) < 1e-10:
-                raise ValueError("Matriz singular o mal condicionada")
-            
-            # Eliminación
-            for i in range(k + 1, n):
-                factor = M[i, k] / M[k, k]
-                M[i, k:] = M[i, k:] - factor * M[k, k:]
-        
-        # Sustitución hacia atrás
-        x = np.zeros(n)
-        for i in range(n - 1, -1, -1):
-            x[i] = (M[i, -1] - np.dot(M[i, i+1:n], x[i+1:n])) / M[i, i]
-        
-        detalles = {
-            'metodo': 'Eliminación Gaussiana con Pivoteo Parcial',
-            'permutaciones': [int(p) for p in permutaciones],
-            'matriz_escalonada': [[float(val) for val in row] for row in M[:, :-1]]
-        }
+        x, Y, detalles = EcuacionesDiferenciales.bulirsch_stoer_sistema(
+            x0, [y0], xf, n, [f_expr], tolerancia, x_salida, max_pasos
+        )
+        detalles.update({'metodo': 'Bulirsch-Stoer', 'y0': y0, 'funcion': f_expr})
+        del detalles['funciones']
         
-        return [float(val) for val in x], detalles
+        return x, Y[0], detalles
     
     @staticmethod
-    def eliminacion_gaussiana_pivoteo_total(A: List[List[float]], b: List[float]) -> Tuple[List[float], dict]:
-        """
-        Eliminación Gaussiana con pivoteo total
+    def retardo(x0: float, y0: float, xf: float, n: int, f_expr: str, historia: str = None,
+                salida: dict = None) -> Tuple[List, List, dict]:
         """
-        A = np.array(A, dtype=float)
-        b = np.array(b, dtype=float)
-        n = len(b)
+        Ecuación diferencial con retardos constantes, ej: y' = -y(x - 1)
         
-        M = np.column_stack([A, b])
-        perm_filas = list(range(n))
-        perm_cols = list(range(n))
-        
-        for k in range(n - 1):
-            # Encontrar pivote máximo en toda la submatriz
-            max_val = 0
-            max_i, max_j = k, k
-            for i in range(k, n):
-                for j in range(k, n):
-                    if abs(M[i, j]) > abs(M[max_i, max_j]):
-                        max_i, max_j = i, j
-            
-            # Intercambiar filas
-            M[[k, max_i]] = M[[max_i, k]]
-            perm_filas[k], perm_filas[max_i] = perm_filas[max_i], perm_filas[k]
-            
-            # Intercambiar columnas
-            M[:, [k, max_j]] = M[:, [max_j, k]]
-            perm_cols[k], perm_cols[max_j] = perm_cols[max_j], perm_cols[k]
-            
-            if abs(M[k, k]) < 1e-10:
-                raise ValueError("Matriz singular")
-            
-            for i in range(k + 1, n):
-                factor = M[i, k] / M[k, k]
-                M[i, k:] = M[i, k:] - factor * M[k, k:]
-        
-        # Sustitución hacia atrás
-        x = np.zeros(n)
-        for i in range(n - 1, -1, -1):
-            x[i] = (M[i, -1] - np.dot(M[i, i+1:n], x[i+1:n])) / M[i, i]
+        Igual que retardo_sistema para una sola ecuación; historia es la
+        función inicial phi(x) para x <= x0 (por defecto, y0 constante).
+        """
+        x, Y, detalles = EcuacionesDiferenciales.retardo_sistema(
+            x0, [y0], xf, n, [f_expr], None if historia is None else [historia], salida
+        )
+        detalles.update({'metodo': 'Runge-Kutta 4 con retardo', 'y0': y0, 'funcion': f_expr})
+        del detalles['funciones']
         
-        # Reordenar solución según permutación de columnas
-        x_reordenada = np.zeros(n)
-        for i in range(n):
-            x_reordenada[perm_cols[i]] = x[i]
+        return x, Y[0], detalles
+    
+    @staticmethod
+    def adams_bashforth(x0: float, y0: float, xf: float, n: int, f_expr: str,
+                        orden: int = 4, salida: dict = None) -> Tuple[List, List, dict]:
+        """
+        Método de Adams-Bashforth (multi-paso explícito) de orden 1 a 6.
+        Los primeros orden - 1 pasos se calculan con RK4, así que requiere n >= orden.
+        Acepta salida como euler.
+        """
+        x, Y, estadisticas = EcuacionesDiferenciales._adams(x0, [y0], xf, n, [f_expr], orden, False,
+                                                            salida=salida)
         
         detalles = {
-            'metodo': 'Eliminación Gaussiana con Pivoteo Total',
-            'permutaciones_filas': [int(p) for p in perm_filas],
-            'permutaciones_columnas': [int(p) for p in perm_cols]
+            'metodo': 'Adams-Bashforth',
+            'h': (xf - x0) / n,
+            'n': n,
+            'orden': orden
         }
+        detalles.update(estadisticas)
         
-        return [float(val) for val in x_reordenada], detalles
+        return _como_lista(x), _como_lista(Y[:, 0]), detalles
     
     @staticmethod
-    def factorizacion_lu(A: List[List[float]]) -> Tuple[List[List[float]], List[List[float]], dict]:
+    def adams_moulton(x0: float, y0: float, xf: float, n: int, f_expr: str, orden: int = 4,
+                      tolerancia: float = 1e-10, max_iteraciones: int = 10,
+                      salida: dict = None) -> Tuple[List, List, dict]:
         """
-        Factorización LU
+        Método de Adams-Moulton (predictor-corrector) de orden 1 a 6.
+        Predice con Adams-Bashforth e itera el corrector hasta la tolerancia;
+        requiere n >= orden. Acepta salida como euler.
         """
-        A = np.array(A, dtype=float)
-        n = len(A)
-        
-        L = np.eye(n)
-        U = np.copy(A)
-        
-        for k in range(n - 1):
-            if abs(U[k, k]) < 1e-10:
-                raise ValueError("Factorización LU no es posible sin pivoteo")
-            
-            for i in range(k + 1, n):
-                L[i, k] = U[i, k] / U[k, k]
-                U[i, k:] = U[i, k:] - L[i, k] * U[k, k:]
-                U[i, k] = 0
+        x, Y, estadisticas = EcuacionesDiferenciales._adams(
+            x0, [y0], xf, n, [f_expr], orden, True, tolerancia, max_iteraciones, salida
+        )
         
         detalles = {
-            'metodo': 'Factorización LU',
-            'matriz_L': [[float(val) for val in row] for row in L],
-            'matriz_U': [[float(val) for val in row] for row in U],
-            'verificacion': bool(np.allclose(np.dot(L, U), A))
+            'metodo': 'Adams-Moulton',
+            'h': (xf - x0) / n,
+            'n': n,
+            'orden': orden,
+            'tolerancia': tolerancia
         }
+        detalles.update(estadisticas)
         
-        return [[float(val) for val in row] for row in L], [[float(val) for val in row] for row in U], detalles
+        return _como_lista(x), _como_lista(Y[:, 0]), detalles
     
     @staticmethod
-    def factorizacion_plu(A: List[List[float]]) -> Tuple[List[List[float]], List[List[float]], List[List[float]], dict]:
+    def _adams(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str], orden: int,
+               corrector: bool, tolerancia: float = 1e-10, max_iteraciones: int = 10, salida: dict = None):
+        """Valida los datos y llama a _integrar_adams con el sistema compilado"""
+        if orden not in _ADAMS_BASHFORTH:
+            raise ValueError("El orden de Adams debe estar entre 1 y 6")
+        if n < orden:
+            raise ValueError(f"Adams de orden {orden} requiere al menos {orden} pasos (n >= {orden})")
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
+        
+        F = _compilar_sistema(f_exprs)
+        return _integrar_adams(F, x0, np.array(y0, dtype=float), xf, n, orden,
+                               corrector, tolerancia, max_iteraciones, salida)
+    
+    @staticmethod
+    def generar_pasos(metodo: str, x0: float, y0, xf: float, n: int, f_expr: Union[str, List[str]],
+                      cada: int = 1):
         """
-        Factorización PLU con pivoteo parcial
+        Integra paso a paso como generador, sin acumular la solución.
+        
+        La expresión se compila y los datos se validan al llamar a este
+        método; la integración avanza a medida que se consume el generador,
+        con memoria constante sin importar n.
+        
+        Args:
+            metodo: 'euler', 'rk3', 'rk4', 'taylor_2', 'taylor_3' o 'taylor_4'
+            x0: Condición inicial x
+            y0: Condición inicial (número) o condiciones iniciales del sistema (lista)
+            xf: Valor final de x
+            n: Número de pasos
+            f_expr: Función como string (ecuación única) o lista de funciones (sistema)
+            cada: Entregar solo uno de cada 'cada' pasos (el primero y el último siempre)
+        
+        Returns:
+            Generador de tuplas (x, y); y es un float para una ecuación única
+            y una lista [y1, y2, ...] para sistemas
         """
-        A = np.array(A, dtype=float)
-        n = len(A)
+        es_sistema = not isinstance(f_expr, str)
+        
+        if metodo not in _PASOS_FIJOS and metodo not in _ORDENES_TAYLOR:
+            raise ValueError(f"Método no válido para generar pasos: {metodo}")
+        if es_sistema and metodo in _ORDENES_TAYLOR:
+            raise ValueError("Los métodos de Taylor solo están disponibles para ecuaciones únicas")
+        if n < 1 or cada < 1:
+            raise ValueError("n y cada deben ser enteros positivos")
+        
+        if es_sistema:
+            if len(f_expr) != len(y0):
+                raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
+            f = _compilar_sistema(f_expr)
+            y = np.array(y0, dtype=float)
+            salida = lambda y: y.tolist()
+        else:
+            f = _compilar_ode(f_expr)
+            y = float(y0)
+            salida = float
         
-        P = np.eye(n)
-        L = np.eye(n)
-        U = np.copy(A)
+        if metodo in _ORDENES_TAYLOR:
+            nucleo = _taylor_ode(f_expr).nucleo(_ORDENES_TAYLOR[metodo], escalar=True)
+            paso = lambda f_, x, y, h: _paso_taylor(nucleo, x, y, h)
+        else:
+            paso = _PASOS_FIJOS[metodo]
         
-        for k in range(n - 1):
-            # Encontrar pivote
-            max_idx = k + np.argmax(np.abs(U[k:n, k]))
-            
-            # Intercambiar filas en U
-            U[[k, max_idx]] = U[[max_idx, k]]
-            
-            # Intercambiar filas en L (excluyendo diagonal)
-            L[[k, max_idx], :k] = L[[max_idx, k], :k]
-            
-            # Actualizar P
-            P[[k, max_idx]] = P[[max_idx, k]]
-            
-            if abs(U[k, k]) < 1e-10:
-                raise ValueError("Matriz singular")
-            
-            for i in range(k + 1, n):
-                L[i, k] = U[i, k] / U[k, k]
-                U[i, k:] = U[i, k:] - L[i, k] * U[k, k:]
-                U[i, k] = 0
+        h = (xf - x0) / n
         
-        detalles = {
-            'metodo': 'Factorización PLU',
-            'verificacion': bool(np.allclose(np.dot(P, np.dot(L, U)), A))
-        }
+        def pasos(y):
+            yield x0, salida(y)
+            for i in range(1, n + 1):
+                y = paso(f, x0 + (i - 1) * h, y, h)
+                if i % cada == 0 or i == n:
+                    yield x0 + i * h, salida(y)
         
-        return [[float(val) for val in row] for row in P], [[float(val) for val in row] for row in L], [[float(val) for val in row] for row in U], detalles
+        return pasos(y)
     
     @staticmethod
-    def factorizacion_llt(A: List[List[float]]) -> Tuple[List[List[float]], dict]:
+    def resolver_lote(metodo: str, x0: float, y0, xf: float, n: int, f_expr: Union[str, List[str]],
+                      parametros: List[float] = None) -> Tuple[List, List, dict]:
         """
-        Factorización LLT (Cholesky) - para matrices simétricas positivas definidas
+        Resuelve el mismo problema de valor inicial para muchas condiciones
+        iniciales (y, opcionalmente, valores de un parámetro p) a la vez.
+        
+        Todas las trayectorias avanzan juntas: cada etapa del método es una
+        sola evaluación vectorizada de f sobre el arreglo de estados.
+        
+        Args:
+            metodo: 'euler', 'rk3', 'rk4', 'taylor_2', 'taylor_3' o 'taylor_4'
+            x0: Condición inicial x
+            y0: Ecuación única: vector (k,) de valores iniciales.
+                Sistema: matriz (k, m) o un vector (m,) común a todas las trayectorias
+            xf: Valor final de x
+            n: Número de pasos
+            f_expr: Función como string (ecuación única) o lista de funciones (sistema);
+                    puede usar el parámetro 'p'
+            parametros: Vector (k,) con el valor de p para cada trayectoria
+        
+        Returns:
+            Tupla (x_valores, trayectorias, detalles). Para una ecuación única cada
+            trayectoria es la lista de y; para sistemas es [[y1_vals], [y2_vals], ...]
         """
-        A = np.array(A, dtype=float)
-        n = len(A)
+        es_sistema = not isinstance(f_expr, str)
+        constantes = ('p',) if parametros is not None else ()
+        
+        if metodo not in _PASOS_FIJOS and metodo not in _ORDENES_TAYLOR:
+            raise ValueError(f"Método no válido para lote: {metodo}")
+        if es_sistema and metodo in _ORDENES_TAYLOR:
+            raise ValueError("Los métodos de Taylor solo están disponibles para ecuaciones únicas")
+        
+        y0 = np.asarray(y0, dtype=float)
+        p = None if parametros is None else np.asarray(parametros, dtype=float).ravel()
+        
+        if es_sistema:
+            m = len(f_expr)
+            if y0.ndim == 1:
+                y0 = y0[np.newaxis, :]
+            if y0.ndim != 2 or y0.shape[1] != m:
+                raise ValueError(f"y0 debe ser una matriz (k, {m}) o un vector de {m} valores")
+            estado = y0.T                      # (m, k): una trayectoria por columna
+        else:
+            estado = np.atleast_1d(y0)
+            if estado.ndim != 1:
+                raise ValueError("y0 debe ser un vector de valores iniciales")
+        
+        k = estado.shape[-1]
+        if p is not None:
+            if k == 1 and len(p) > 1:
+                estado = np.repeat(estado, len(p), axis=-1)
+                k = len(p)
+            elif len(p) != k:
+                raise ValueError("parametros debe tener un valor por cada condición inicial")
+        
+        # Compilar f (y sus derivadas para Taylor) una sola vez
+        if es_sistema:
+            F = _compilar_sistema(f_expr, constantes)
+        else:
+            F = _compilar_ode(f_expr, constantes)
         
-        # Verificar que sea simétrica
-        if not np.allclose(A, A.T):
-            raise ValueError("La matriz debe ser simétrica")
+        if p is not None:
+            f = lambda x, y: F(x, y, p)
+        else:
+            f = F
         
-        L = np.zeros((n, n))
+        if metodo in _ORDENES_TAYLOR:
+            nucleo = _taylor_ode(f_expr, constantes).nucleo(_ORDENES_TAYLOR[metodo])
+            if p is not None:
+                nucleo_lote = lambda x, y: nucleo(x, y, p)
+            else:
+                nucleo_lote = nucleo
+            paso = lambda f_, x, y, h: _paso_taylor(nucleo_lote, x, y, h)
+        else:
+            paso = _PASOS_FIJOS[metodo]
+        
+        h = (xf - x0) / n
+        x = x0 + h * np.arange(n + 1)
+        Y = np.empty((n + 1,) + estado.shape)
+        Y[0] = estado
         
         for i in range(n):
-            for j in range(i + 1):
-                suma = np.sum(L[i, :j] * L[j, :j])
-                if i == j:
-                    val = A[i, i] - suma
-                    if val <= 0:
-                        raise ValueError("La matriz no es positiva definida")
-                    L[i, j] = np.sqrt(val)
-                else:
-                    L[i, j] = (A[i, j] - suma) / L[j, j]
+            Y[i + 1] = paso(f, x[i], Y[i], h)
+        
+        if es_sistema:
+            trayectorias = _como_lista(Y.transpose(2, 1, 0))   # (k, m, n+1)
+        else:
+            trayectorias = _como_lista(Y.T)                    # (k, n+1)
         
         detalles = {
-            'metodo': 'Factorización LLT (Cholesky)',
-            'matriz_L': [[float(val) for val in row] for row in L],
-            'verificacion': bool(np.allclose(np.dot(L, L.T), A))
+            'metodo': f'{metodo} (Lote)',
+            'x0': x0,
+            'xf': xf,
+            'n': n,
+            'h': h,
+            'num_trayectorias': k,
+            'funcion': f_expr,
+            'parametros': None if p is None else p.tolist()
         }
         
-        return [[float(val) for val in row] for row in L], detalles
-
-
-class EcuacionesDiferenciales:
-    """Métodos para resolver ecuaciones diferenciales ordinarias"""
+        return _como_lista(x), trayectorias, detalles
     
     @staticmethod
-    def _eval_function(f_expr: str, x: float, y_values: List[float]) -> float:
+    def barrido_parametros(metodo: str, f_expr: Union[str, List[str]], x0: float, y0, xf: float, n: int,
+                           malla: dict, procesos: int = None,
+                           max_tareas: int = 10000) -> Tuple[List[dict], dict]:
         """
-        Evalúa una función con las variables x, y1, y2, y3, ... (para sistemas)
+        Resuelve el mismo problema para todas las combinaciones de una malla
+        de parámetros, repartiendo las tareas en un pool de procesos.
+        
+        Cada proceso compila la expresión una sola vez al iniciar y luego
+        resuelve las tareas que le tocan; los resultados vuelven en el orden
+        de la malla.
+        
+        Args:
+            metodo: 'euler', 'rk3', 'rk4', 'taylor_2', 'taylor_3' o 'taylor_4'
+            f_expr: Función como string (ecuación única) o lista de funciones (sistema)
+            x0, y0, xf, n: Valores base del problema de valor inicial
+            malla: Diccionario nombre -> lista de valores. Las claves x0, y0, xf
+                   y n reemplazan los valores base; las demás son constantes
+                   de f_expr (ej: {'k': [0.1, 0.2], 'y0': [1, 2]})
+            procesos: Procesos del pool (por defecto, los núcleos disponibles)
+            max_tareas: Máximo de combinaciones permitidas
+        
+        Returns:
+            Tupla (resultados, detalles). Cada resultado tiene 'parametros',
+            'x_valores', 'y_valores' y 'tiempo' (segundos), o 'error' si esa
+            tarea falló
         """
-        # Reemplazar x
-        expr = f_expr.replace('x', str(x))
-        # Reemplazar y1, y2, y3, etc.
-        for i, y_val in enumerate(y_values, 1):
-            expr = expr.replace(f'y{i}', str(y_val))
-        # Para compatibilidad con código antiguo, si no hay y1, reemplazar y con el primer valor
-        if 'y' in expr and len(y_values) > 0:
-            expr = expr.replace('y', str(y_values[0]))
-        return eval(expr)
+        import itertools
+        import time
+        from concurrent.futures import ProcessPoolExecutor
+        
+        es_sistema = not isinstance(f_expr, str)
+        if metodo not in _PASOS_FIJOS and metodo not in _ORDENES_TAYLOR:
+            raise ValueError(f"Método no válido para barrido: {metodo}")
+        if es_sistema and metodo in _ORDENES_TAYLOR:
+            raise ValueError("Los métodos de Taylor solo están disponibles para ecuaciones únicas")
+        if not malla:
+            raise ValueError("Se requiere una malla con al menos un parámetro")
+        
+        nombres = list(malla)
+        valores = [v if isinstance(v, list) else [v] for v in malla.values()]
+        total = int(np.prod([len(v) for v in valores]))
+        if total == 0:
+            raise ValueError("Cada parámetro de la malla debe tener al menos un valor")
+        if total > max_tareas:
+            raise ValueError(f"La malla genera {total} tareas; el máximo es {max_tareas}")
+        
+        base = {'x0': x0, 'y0': y0, 'xf': xf, 'n': n}
+        constantes = tuple(nombre for nombre in nombres if nombre not in base)
+        reservadas = set(_variables_sistema(len(f_expr) if es_sistema else 1)) | {'y'}
+        if reservadas & set(constantes):
+            raise ValueError(f"Las constantes no pueden llamarse como las variables: {sorted(reservadas)}")
+        
+        tareas = [dict(base, **dict(zip(nombres, combinacion))) for combinacion in itertools.product(*valores)]
+        m = len(f_expr) if es_sistema else 1
+        for tarea in tareas:
+            if np.size(tarea['y0']) != m:
+                raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
+        
+        # Compilar aquí primero valida la expresión antes de crear el pool
+        _iniciar_barrido(metodo, f_expr, constantes)
+        procesos = max(1, min(procesos or _procesos_disponibles(), total))
+        
+        inicio = time.perf_counter()
+        if procesos == 1:
+            resultados = [_resolver_tarea(tarea) for tarea in tareas]
+        else:
+            bloque = max(1, total // (4 * procesos))
+            with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_barrido,
+                                     initargs=(metodo, f_expr, constantes)) as pool:
+                resultados = list(pool.map(_resolver_tarea, tareas, chunksize=bloque))
+        tiempo_total = time.perf_counter() - inicio
+        
+        for tarea, resultado in zip(tareas, resultados):
+            resultado['parametros'] = {nombre: tarea[nombre] for nombre in nombres}
+        
+        detalles = {
+            'metodo': f'{metodo} (Barrido)',
+            'funcion': f_expr,
+            'num_tareas': total,
+            'procesos': procesos,
+            'constantes': list(constantes),
+            'errores': sum(1 for r in resultados if 'error' in r),
+            'tiempo_total': tiempo_total,
+            'tiempo_tareas': sum(r['tiempo'] for r in resultados)
+        }
+        
+        return resultados, detalles
+    
+    # ================== MÉTODOS PARA SISTEMAS DE ECUACIONES ==================
     
     @staticmethod
-    def euler(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def euler_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                      salida: dict = None) -> Tuple[List, List[List], dict]:
         """
-        Método de Euler
+        Método de Euler para sistemas de ecuaciones diferenciales
         
         Args:
             x0: Condición inicial x
-            y0: Condición inicial y
+            y0: Condiciones iniciales [y1_0, y2_0, ...]
             xf: Valor final de x
             n: Número de pasos
-            f_expr: Función como string (ej: 'x + y')
+            f_exprs: Lista de funciones como strings (ej: ['y2', '-y1'])
+            salida: Muestreo de la salida (ver _Muestreo); por defecto todos los pasos
         
         Returns:
-            Tupla (x_valores, y_valores, detalles)
+            Tupla (x_valores, [[y1_vals], [y2_vals], ...], detalles)
         """
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
+        
         h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        F = _compilar_sistema(f_exprs)
+        
+        muestreo = _Muestreo(salida, x0, xf, n, F)
+        yi = np.array(y0, dtype=float)
+        muestreo.registrar(0, x0, yi)
         
         for i in range(n):
-            xi = x[-1]
-            yi = y[-1]
-            
-            # Evaluar f(x, y)
-            f_val = eval(f_expr.replace('x', str(xi)).replace('y', str(yi)))
-            
-            yi_new = yi + h * f_val
-            xi_new = xi + h
-            
-            x.append(xi_new)
-            y.append(yi_new)
+            yi = yi + h * F(x0 + i * h, yi)
+            muestreo.registrar(i + 1, x0 + (i + 1) * h, yi)
         
         detalles = {
-            'metodo': 'Euler',
+            'metodo': 'Euler (Sistema)',
             'x0': x0,
             'y0': y0,
             'xf': xf,
             'n': n,
             'h': h,
-            'funcion': f_expr
+            'funciones': f_exprs
         }
+        if salida:
+            detalles.update(muestreo.detalles())
         
-        return x, y, detalles
+        return muestreo.xs, _como_lista(np.array(muestreo.ys).T), detalles
     
     @staticmethod
-    def _taylor_derivatives(f_expr: str, order: int) -> List[str]:
+    def runge_kutta_4_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                              eventos: list = None, salida: dict = None) -> Tuple[List, List[List], dict]:
         """
-        Calcula simbólicamente f, f', f'', f''' como strings usando derivada total.
-        
-        Para una EDO dy/dx = f(x,y):
-        - f(x,y)
-        - f'(x,y) = ∂f/∂x + ∂f/∂y * f
-        - f''(x,y) = ∂f'/∂x + ∂f'/∂y * f'
-        - f'''(x,y) = ∂f''/∂x + ∂f''/∂y * f''
-        
-        Args:
-            f_expr: Expresión de la función f(x,y)
-            order: Número de derivadas a calcular (1, 2 o 3)
+        Método de Runge-Kutta orden 4 para sistemas de ecuaciones diferenciales
         
-        Returns:
-            Lista de strings [f, f', f'', f'''] hasta el orden especificado
+        Acepta eventos g(x, y1, ..., ym) y salida como euler; con un evento
+        terminal la solución termina en el cruce.
         """
-        import re
-        
-        x, y = symbols('x y')
-        # Reemplazar y1 por y para compatibilidad
-        expr_str = f_expr.replace('y1', 'y')
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
         
-        # Procesar la expresión para agregar multiplicación implícita
-        expr_str = _process_implicit_multiplication_metodos(expr_str)
+        h = (xf - x0) / n
+        F = _compilar_sistema(f_exprs)
         
-        f = sympify(expr_str)
+        muestreo = _Muestreo(salida, x0, xf, n, F)
+        yi = np.array(y0, dtype=float)
+        muestreo.registrar(0, x0, yi)
         
-        # f (la función original)
-        derivs = [f]
+        detector = _DetectorEventos(eventos, len(y0)) if eventos else None
+        if detector is not None:
+            detector.iniciar(x0, yi)
         
-        # f' (primera derivada total)
-        f_prime = diff(f, x) + diff(f, y) * f
+        for i in range(n):
+            xi = x0 + i * h
+            
+            k1 = F(xi, yi)
+            k2 = F(xi + h/2, yi + h/2 * k1)
+            k3 = F(xi + h/2, yi + h/2 * k2)
+            k4 = F(xi + h, yi + h * k3)
         
-        if order >= 1:
-            derivs.append(f_prime)
+            y_new = yi + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
+            x_new = x0 + (i + 1) * h
         
-        if order >= 2:
-            # f'' (segunda derivada total de f')
-            # f''(x,y) = ∂f'/∂x + ∂f'/∂y * f'
-            f_double_prime = diff(f_prime, x) + diff(f_prime, y) * f_prime
-            derivs.append(f_double_prime)
+            if detector is not None:
+                evento = detector.revisar(F, xi, yi, x_new, y_new)
+                if evento is not None:
+                    muestreo.terminar(*evento)
+                    break
         
-        if order >= 3:
-            # f''' (tercera derivada total de f'')
-            # f'''(x,y) = ∂f''/∂x + ∂f''/∂y * f''
-            f_triple_prime = diff(f_double_prime, x) + diff(f_double_prime, y) * f_double_prime
-            derivs.append(f_triple_prime)
+            muestreo.registrar(i + 1, x_new, y_new)
+            yi = y_new
         
-        # Simplificar y convertir a strings
-        simplified = []
-        for d in derivs:
-            # Expandir para obtener forma más clara
-            d_expanded = expand(d)
-            simplified.append(str(d_expanded))
+        detalles = {
+            'metodo': 'Runge-Kutta Orden 4 (Sistema)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': n,
+            'h': h,
+            'funciones': f_exprs
+        }
+        if detector is not None:
+            detalles.update(detector.detalles())
+        if salida:
+            detalles.update(muestreo.detalles())
         
-        return simplified
+        return muestreo.xs, _como_lista(np.array(muestreo.ys).T), detalles
     
     @staticmethod
-    def taylor_orden_2(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def dormand_prince_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                               tolerancia: float = 1e-6, x_salida: List[float] = None,
+                               max_pasos: int = 100000) -> Tuple[List, List[List], dict]:
         """
-        Método de Taylor orden 2.
-        Calcula automáticamente la derivada f' usando derivada total.
+        Método de Dormand-Prince 5(4) con paso adaptativo y salida densa para sistemas
+        
+        Igual que dormand_prince: n solo fija la cantidad de puntos de salida.
         """
-        from sympy import lambdify
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
         
-        h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        F = _compilar_sistema(f_exprs)
         
-        # Calcular derivadas simbólicamente
-        derivs = EcuacionesDiferenciales._taylor_derivatives(f_expr, 1)
-        f_str, df_str = str(derivs[0]), str(derivs[1])
+        if x_salida is None and n:
+            x_salida = np.linspace(x0, xf, n + 1)
         
-        # Crear funciones numéricas compiladas
-        x_sym, y_sym = symbols('x y')
-        f_expr_sym = sympify(f_expr.replace('y1', 'y'))
-        df_expr_sym = sympify(df_str)
+        x, Y, estadisticas = _integrar_dormand_prince(F, x0, np.array(y0, dtype=float), xf,
+                                                      tolerancia, x_salida, max_pasos)
         
-        f_func = lambdify((x_sym, y_sym), f_expr_sym, 'numpy')
-        df_func = lambdify((x_sym, y_sym), df_expr_sym, 'numpy')
+        detalles = {
+            'metodo': 'Dormand-Prince 5(4) (Sistema)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': len(x) - 1,
+            'tolerancia': tolerancia,
+            'salida_densa': x_salida is not None,
+            'funciones': f_exprs
+        }
+        detalles.update(estadisticas)
         
-        for i in range(n):
-            xi = x[-1]
-            yi = y[-1]
-            
-            f_val = float(f_func(xi, yi))
-            df_val = float(df_func(xi, yi))
-            
-            yi_new = yi + h * f_val + (h**2 / 2) * df_val
-            
-            x.append(xi + h)
-            y.append(yi_new)
+        return _como_lista(x), _como_lista(Y.T), detalles
+    
+    @staticmethod
+    def bulirsch_stoer_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                               tolerancia: float = 1e-10, x_salida: List[float] = None,
+                               max_pasos: int = 100000) -> Tuple[List, List[List], dict]:
+        """
+        Método de Bulirsch-Stoer con orden y paso adaptativos para sistemas
+        
+        Igual que bulirsch_stoer: n solo fija la cantidad de puntos de salida.
+        """
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
+        
+        F = _compilar_sistema(f_exprs)
+        
+        if x_salida is None and n:
+            x_salida = np.linspace(x0, xf, n + 1)
+        
+        x, Y, estadisticas = _integrar_bulirsch_stoer(F, x0, np.array(y0, dtype=float), xf,
+                                                      tolerancia, x_salida, max_pasos)
         
         detalles = {
-            'metodo': 'Taylor Orden 2',
+            'metodo': 'Bulirsch-Stoer (Sistema)',
             'x0': x0,
             'y0': y0,
-            'h': h,
-            'n': n,
-            'f_expr': f_str,
-            'df_expr': df_str
+            'xf': xf,
+            'n': len(x) - 1,
+            'tolerancia': tolerancia,
+            'funciones': f_exprs
         }
+        detalles.update(estadisticas)
         
-        return x, y, detalles
+        return _como_lista(x), _como_lista(Y.T), detalles
     
     @staticmethod
-    def taylor_orden_3(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def taylor_serie_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                             tolerancia: float = 1e-12, orden: int = None, x_salida: List[float] = None,
+                             max_pasos: int = 100000) -> Tuple[List, List[List], dict]:
         """
-        Método de Taylor orden 3.
-        Calcula automáticamente las derivadas f' y f'' usando derivada total.
+        Método de Taylor de orden alto con diferenciación automática para sistemas
+        
+        Igual que taylor_serie: n solo fija la cantidad de puntos de salida.
         """
-        from sympy import lambdify
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
         
-        h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        serie = _compilar_serie_taylor(f_exprs)
+        
+        if x_salida is None and n:
+            x_salida = np.linspace(x0, xf, n + 1)
+        
+        x, Y, estadisticas = _integrar_serie_taylor(serie, x0, np.array(y0, dtype=float), xf,
+                                                    tolerancia, orden, x_salida, max_pasos)
         
-        # Calcular derivadas simbólicamente
-        derivs = EcuacionesDiferenciales._taylor_derivatives(f_expr, 2)
-        f_str, df_str, ddf_str = str(derivs[0]), str(derivs[1]), str(derivs[2])
+        detalles = {
+            'metodo': f'Taylor por Diferenciación Automática (Orden {estadisticas["orden"]}, Sistema)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': len(x) - 1,
+            'tolerancia': tolerancia,
+            'salida_densa': x_salida is not None,
+            'funciones': f_exprs
+        }
+        detalles.update(estadisticas)
         
-        # Crear funciones numéricas compiladas
-        x_sym, y_sym = symbols('x y')
-        f_expr_sym = sympify(f_expr.replace('y1', 'y'))
-        df_expr_sym = sympify(df_str)
-        ddf_expr_sym = sympify(ddf_str)
+        return _como_lista(x), _como_lista(Y.T), detalles
+    
+    @staticmethod
+    def adams_bashforth_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                                orden: int = 4, salida: dict = None) -> Tuple[List, List[List], dict]:
+        """
+        Método de Adams-Bashforth de orden 1 a 6 para sistemas
         
-        f_func = lambdify((x_sym, y_sym), f_expr_sym, 'numpy')
-        df_func = lambdify((x_sym, y_sym), df_expr_sym, 'numpy')
-        ddf_func = lambdify((x_sym, y_sym), ddf_expr_sym, 'numpy')
+        Una evaluación de F por paso, lo que lo hace barato para
+        integraciones largas de sistemas no rígidos.
         
-        for i in range(n):
-            xi = x[-1]
-            yi = y[-1]
-            
-            f_val = float(f_func(xi, yi))
-            df_val = float(df_func(xi, yi))
-            ddf_val = float(ddf_func(xi, yi))
-            
-            yi_new = yi + h * f_val + (h**2 / 2) * df_val + (h**3 / 6) * ddf_val
-            
-            x.append(xi + h)
-            y.append(yi_new)
+        Args:
+            x0: Condición inicial x
+            y0: Condiciones iniciales [y1_0, y2_0, ...]
+            xf: Valor final de x
+            n: Número de pasos (n >= orden)
+            f_exprs: Lista de funciones como strings
+            orden: Orden del método (1 a 6)
+            salida: Muestreo de la salida (ver _Muestreo); por defecto todos los pasos
+        
+        Returns:
+            Tupla (x_valores, [[y1_vals], [y2_vals], ...], detalles)
+        """
+        x, Y, estadisticas = EcuacionesDiferenciales._adams(x0, y0, xf, n, f_exprs, orden, False,
+                                                            salida=salida)
         
         detalles = {
-            'metodo': 'Taylor Orden 3',
+            'metodo': f'Adams-Bashforth Orden {orden} (Sistema)',
             'x0': x0,
             'y0': y0,
-            'h': h,
+            'xf': xf,
             'n': n,
-            'f_expr': f_str,
-            'df_expr': df_str,
-            'ddf_expr': ddf_str
+            'h': (xf - x0) / n,
+            'orden': orden,
+            'funciones': f_exprs
         }
+        detalles.update(estadisticas)
         
-        return x, y, detalles
+        return _como_lista(x), _como_lista(Y.T), detalles
     
     @staticmethod
-    def taylor_orden_4(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
-        """
-        Método de Taylor orden 4.
-        Calcula automáticamente las derivadas f', f'' y f''' usando derivada total.
+    def adams_moulton_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                              orden: int = 4, tolerancia: float = 1e-10,
+                              max_iteraciones: int = 10, salida: dict = None) -> Tuple[List, List[List], dict]:
         """
-        from sympy import lambdify
-        
-        h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
-        
-        # Calcular derivadas simbólicamente
-        derivs = EcuacionesDiferenciales._taylor_derivatives(f_expr, 3)
-        f_str, df_str, ddf_str, dddf_str = str(derivs[0]), str(derivs[1]), str(derivs[2]), str(derivs[3])
-        
-        # Crear funciones numéricas compiladas
-        x_sym, y_sym = symbols('x y')
-        f_expr_sym = sympify(f_expr.replace('y1', 'y'))
-        df_expr_sym = sympify(df_str)
-        ddf_expr_sym = sympify(ddf_str)
-        dddf_expr_sym = sympify(dddf_str)
-        
-        f_func = lambdify((x_sym, y_sym), f_expr_sym, 'numpy')
-        df_func = lambdify((x_sym, y_sym), df_expr_sym, 'numpy')
-        ddf_func = lambdify((x_sym, y_sym), ddf_expr_sym, 'numpy')
-        dddf_func = lambdify((x_sym, y_sym), dddf_expr_sym, 'numpy')
+        Predictor-corrector Adams-Bashforth-Moulton de orden 1 a 6 para sistemas
         
-        for i in range(n):
-            xi = x[-1]
-            yi = y[-1]
-            
-            f_val = float(f_func(xi, yi))
-            df_val = float(df_func(xi, yi))
-            ddf_val = float(ddf_func(xi, yi))
-            dddf_val = float(dddf_func(xi, yi))
-            
-            yi_new = yi + h * f_val + (h**2 / 2) * df_val + (h**3 / 6) * ddf_val + (h**4 / 24) * dddf_val
-            
-            x.append(xi + h)
-            y.append(yi_new)
+        Acepta los mismos argumentos que adams_bashforth_sistema; el corrector
+        se itera hasta que el cambio relativo es menor que tolerancia o se
+        alcanzan max_iteraciones.
+        """
+        x, Y, estadisticas = EcuacionesDiferenciales._adams(
+            x0, y0, xf, n, f_exprs, orden, True, tolerancia, max_iteraciones, salida
+        )
         
         detalles = {
-            'metodo': 'Taylor Orden 4',
+            'metodo': f'Adams-Moulton Orden {orden} (Sistema)',
             'x0': x0,
             'y0': y0,
-            'h': h,
+            'xf': xf,
             'n': n,
-            'f_expr': f_str,
-            'df_expr': df_str,
-            'ddf_expr': ddf_str,
-            'dddf_expr': dddf_str
+            'h': (xf - x0) / n,
+            'orden': orden,
+            'tolerancia': tolerancia,
+            'funciones': f_exprs
         }
+        detalles.update(estadisticas)
         
-        return x, y, detalles
+        return _como_lista(x), _como_lista(Y.T), detalles
     
     @staticmethod
-    def runge_kutta_3(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def simplectico_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                            metodo: str = 'verlet', energia: str = None,
+                            salida: dict = None) -> Tuple[List, List[List], dict]:
         """
-        Método de Runge-Kutta orden 3
+        Integradores simplécticos para sistemas hamiltonianos separables
+        
+        El sistema se da como en runge_kutta_4_sistema, con las posiciones
+        primero y las velocidades después: para d grados de libertad,
+        y1..yd son posiciones, yd+1..y2d velocidades, las primeras d
+        ecuaciones solo dependen de las velocidades y las últimas d solo de
+        las posiciones (ej: ['y2', '-y1'] para el oscilador armónico). La
+        energía no deriva con el tiempo, así que se pueden usar pasos grandes
+        en integraciones muy largas.
+        
+        Args:
+            x0: Condición inicial x
+            y0: Condiciones iniciales [q1_0, ..., qd_0, v1_0, ..., vd_0]
+            xf: Valor final de x
+            n: Número de pasos
+            f_exprs: Lista de 2d funciones como strings
+            metodo: 'verlet' (velocidades), 'leapfrog', 'yoshida4' o 'yoshida6'
+            energia: Expresión opcional de la energía en y1..y2d para medir su deriva
+                (en los puntos guardados)
+            salida: Muestreo de la salida (ver _Muestreo); por defecto todos los pasos
+        
+        Returns:
+            Tupla (x_valores, [[y1_vals], [y2_vals], ...], detalles)
         """
-        h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        if metodo not in _SIMPLECTICOS:
+            raise ValueError(f"Método simpléctico no válido: {metodo}. Use {', '.join(_SIMPLECTICOS)}")
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
         
-        for i in range(n):
-            xi = x[-1]
-            yi = y[-1]
-            
-            k1 = eval(f_expr.replace('x', str(xi)).replace('y', str(yi)))
-            k2 = eval(f_expr.replace('x', str(xi + h/2)).replace('y', str(yi + h/2 * k1)))
-            k3 = eval(f_expr.replace('x', str(xi + h)).replace('y', str(yi - h * k1 + 2 * h * k2)))
-            
-            yi_new = yi + (h / 6) * (k1 + 4 * k2 + k3)
-            
-            x.append(xi + h)
-            y.append(yi_new)
+        G, A = _separar_hamiltoniano(f_exprs)
+        x, Y, evaluaciones, muestreo = _integrar_simplectico(G, A, x0, np.array(y0, dtype=float), xf, n,
+                                                             metodo, salida)
         
         detalles = {
-            'metodo': 'Runge-Kutta Orden 3',
-            'h': h,
-            'n': n
+            'metodo': f'Simpléctico {metodo} (Sistema)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': n,
+            'h': (xf - x0) / n,
+            'orden': _SIMPLECTICOS[metodo][2],
+            'evaluaciones': evaluaciones,
+            'funciones': f_exprs
         }
         
-        return x, y, detalles
+        if salida:
+            detalles.update(muestreo.detalles())
+        
+        if energia:
+            fuente, variables = _fuente_sistema([energia], m=len(y0))
+            energia_f = _compilar_expresion(fuente, variables)
+            H0 = float(energia_f(x0, *np.array(y0, dtype=float))[0])
+            H = np.broadcast_to(energia_f(x, *Y.T)[0], x.shape)
+            deriva = np.abs(H - H0) / max(1.0, abs(H0))
+            detalles.update({
+                'energia_inicial': H0,
+                'energia_final': float(H[-1]),
+                'deriva_energia_max': float(np.max(deriva))
+            })
+        
+        return _como_lista(x), _como_lista(Y.T), detalles
     
     @staticmethod
-    def runge_kutta_4(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def retardo_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                        historia: List[str] = None, salida: dict = None) -> Tuple[List, List[List], dict]:
         """
-        Método de Runge-Kutta orden 4
+        Ecuaciones diferenciales con retardos constantes (RK4 de paso fijo)
+        
+        Los términos retardados se escriben como llamadas, por ejemplo
+        'y1(x - 1)' o 'y(x - pi/2)'. La historia guarda solo los nodos que
+        cubren el mayor retardo y los valores intermedios se interpolan con
+        Hermite; con salida (ver _Muestreo) la memoria queda acotada aun en
+        integraciones muy largas.
+        
+        Args:
+            x0: Condición inicial x
+            y0: Condiciones iniciales [y1_0, y2_0, ...]
+            xf: Valor final de x
+            n: Número de pasos (h = (xf - x0)/n no puede superar el menor retardo)
+            f_exprs: Lista de funciones como strings, con términos yk(x - tau)
+            historia: Funciones iniciales phi_k(x) para x <= x0 (por defecto, y0 constante)
+            salida: Muestreo de la salida; por defecto todos los pasos
+        
+        Returns:
+            Tupla (x_valores, [[y1_vals], [y2_vals], ...], detalles)
         """
+        m = len(f_exprs)
+        if m != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
+        if historia is not None and len(historia) != m:
+            raise ValueError("Se requiere una función de historia por cada ecuación del sistema")
+        if xf <= x0 or n < 1:
+            raise ValueError("Se requiere xf > x0 y n >= 1")
+        
+        exprs, retardos = _extraer_retardos(f_exprs, m)
         h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        tau_min = min(tau for _, tau in retardos)
+        tau_max = max(tau for _, tau in retardos)
+        if h > tau_min:
+            raise ValueError(f"El paso h = {h:.6g} supera el menor retardo ({tau_min:.6g}); aumente n")
+        
+        F = _compilar_sistema(exprs, tuple(f'r{k + 1}' for k in range(len(retardos))))
+        if historia is None:
+            valores_iniciales = np.array(y0, dtype=float)
+            phi = lambda t: valores_iniciales
+        else:
+            fuente, variables = _fuente_sistema(historia, m=0)
+            g = _compilar_expresion(fuente, variables)
+            phi = lambda t: np.array(g(t), dtype=float)
         
-        for i in range(n):
-            xi = x[-1]
-            yi = y[-1]
-            
-            k1 = eval(f_expr.replace('x', str(xi)).replace('y', str(yi)))
-            k2 = eval(f_expr.replace('x', str(xi + h/2)).replace('y', str(yi + h/2 * k1)))
-            k3 = eval(f_expr.replace('x', str(xi + h/2)).replace('y', str(yi + h/2 * k2)))
-            k4 = eval(f_expr.replace('x', str(xi + h)).replace('y', str(yi + h * k3)))
-            
-            yi_new = yi + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
-            
-            x.append(xi + h)
-            y.append(yi_new)
+        historial = _HistorialRetardo(x0, h, int(np.ceil(tau_max / h)) + 2, m, phi)
+        # Las pendientes de los nodos ya están en la historia: x_salida no evalúa F de nuevo
+        nodo = lambda x: int(round((x - x0) / h)) % historial.capacidad
+        muestreo = _Muestreo(salida, x0, xf, n, lambda x, y: historial.F[nodo(x)])
+        evaluaciones = _integrar_retardo(F, historial, retardos, x0, y0, xf, n, muestreo)
         
         detalles = {
-            'metodo': 'Runge-Kutta Orden 4',
-            'h': h,
+            'metodo': 'Runge-Kutta 4 con retardo (Sistema)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
             'n': n,
-            'funcion': f_expr
+            'h': h,
+            'retardos': [{'variable': f'y{k + 1}', 'tau': tau} for k, tau in retardos],
+            'nodos_en_historia': historial.capacidad,
+            'evaluaciones': evaluaciones,
+            'funciones': f_exprs
         }
+        if salida:
+            detalles.update(muestreo.detalles())
         
-        return x, y, detalles
+        return muestreo.xs, _como_lista(np.array(muestreo.ys).T), detalles
+    
+    # ================== MÉTODOS IMPLÍCITOS PARA SISTEMAS RÍGIDOS ==================
     
     @staticmethod
-    def runge_kutta_fehlberg(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def bdf_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                    orden: int = 2, tolerancia: float = 1e-8, salida: dict = None) -> Tuple[List, List[List], dict]:
         """
-        Método de Runge-Kutta-Fehlberg (4-5)
+        Fórmulas BDF (diferencias hacia atrás) de orden 1 a 5 para sistemas rígidos
+        
+        Método implícito de paso fijo con jacobiano simbólico y Newton
+        simplificado. Los órdenes 1 y 2 son A-estables; los órdenes 3 a 5 son
+        más precisos pero solo estables cerca del eje real negativo, como en
+        los sistemas de cinética química.
+        
+        Args:
+            x0: Condición inicial x
+            y0: Condiciones iniciales [y1_0, y2_0, ...]
+            xf: Valor final de x
+            n: Número de pasos
+            f_exprs: Lista de funciones como strings
+            orden: Orden de la fórmula BDF (1 a 5)
+            tolerancia: Tolerancia de la iteración de Newton
+            salida: Muestreo de la salida (ver _Muestreo); por defecto todos los pasos
+        
+        Returns:
+            Tupla (x_valores, [[y1_vals], [y2_vals], ...], detalles)
         """
-        h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
+        if orden not in _BDF_COEFICIENTES:
+            raise ValueError("El orden de BDF debe estar entre 1 y 5")
         
-        c = [0, 1/4, 3/8, 12/13, 1, 1/2]
-        a = [[0], [1/4], [3/32, 9/32], [1932/2197, -7200/2197, 7296/2197],
-             [439/216, -8, 3680/513, -845/4104], [-8/27, 2, -3544/2565, 1859/4104, -11/40]]
-        b = [16/135, 0, 6656/12825, 28561/56430, -9/50, 2/55]
+        F = _compilar_sistema(f_exprs)
+        J = compilar_jacobiano(f_exprs)
         
-        for i in range(n):
-            xi = x[-1]
-            yi = y[-1]
-            
-            K = [0] * 6
-            for j in range(6):
-                suma = sum(a[j][k] * K[k] for k in range(j))
-                y_temp = yi + h * suma
-                x_temp = xi + c[j] * h
-                K[j] = eval(f_expr.replace('x', str(x_temp)).replace('y', str(y_temp)))
-            
-            yi_new = yi + h * sum(b[j] * K[j] for j in range(6))
-            
-            x.append(xi + h)
-            y.append(yi_new)
+        x, Y, estadisticas = _integrar_bdf(F, J.dispersa if J.conviene_dispersa else J, x0, np.array(y0, dtype=float), xf, n,
+                                           orden, tolerancia, dFdx=J.derivada_x, salida=salida)
         
         detalles = {
-            'metodo': 'Runge-Kutta-Fehlberg (4-5)',
-            'h': h,
-            'n': n
+            'metodo': f'BDF Orden {orden} (Sistema)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': n,
+            'h': (xf - x0) / n,
+            'orden': orden,
+            'tolerancia': tolerancia,
+            'funciones': f_exprs
         }
+        detalles.update(estadisticas)
         
-        return x, y, detalles
+        return _como_lista(x), _como_lista(Y.T), detalles
     
     @staticmethod
-    def adams_bashforth(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def rosenbrock_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str],
+                           tolerancia: float = 1e-6, x_salida: List[float] = None,
+                           max_pasos: int = 100000) -> Tuple[List, List[List], dict]:
         """
-        Método de Adams-Bashforth (multi-paso) de 4 pasos.
-        Requiere al menos n >= 4 para usar el método de Adams.
-        Si n < 4, se usa solo RK4.
-        """
-        if n < 4:
-            raise ValueError("Adams-Bashforth requiere al menos 4 pasos (n >= 4)")
+        Método de Rosenbrock 2(3) con paso adaptativo para sistemas rígidos
         
-        h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        Usa el jacobiano simbólico y una factorización LU por paso. Como en
+        dormand_prince, n solo fija la cantidad de puntos de salida (0 para
+        devolver los pasos del integrador).
         
-        # Usar RK4 para los primeros 3 pasos (genera 4 puntos incluyendo el inicial)
-        for i in range(3):
-            xi = x[-1]
-            yi = y[-1]
-            
-            k1 = eval(f_expr.replace('x', str(xi)).replace('y', str(yi)))
-            k2 = eval(f_expr.replace('x', str(xi + h/2)).replace('y', str(yi + h/2 * k1)))
-            k3 = eval(f_expr.replace('x', str(xi + h/2)).replace('y', str(yi + h/2 * k2)))
-            k4 = eval(f_expr.replace('x', str(xi + h)).replace('y', str(yi + h * k3)))
-            
-            yi_new = yi + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
-            x.append(xi + h)
-            y.append(yi_new)
+        Args:
+            x0: Condición inicial x
+            y0: Condiciones iniciales [y1_0, y2_0, ...]
+            xf: Valor final de x
+            n: Número de intervalos de salida
+            f_exprs: Lista de funciones como strings
+            tolerancia: Tolerancia del error local
+            x_salida: Puntos de salida explícitos (reemplaza a n)
+            max_pasos: Máximo de pasos intentados
         
-        # Calcular valores de f para los 4 puntos iniciales
-        f_vals = []
-        for xi, yi in zip(x, y):
-            f_vals.append(eval(f_expr.replace('x', str(xi)).replace('y', str(yi))))
+        Returns:
+            Tupla (x_valores, [[y1_vals], [y2_vals], ...], detalles)
+        """
+        if len(f_exprs) != len(y0):
+            raise ValueError("Se requiere una condición inicial por cada ecuación del sistema")
         
-        # Adams-Bashforth de 4 pasos para los pasos restantes (n - 3 pasos más)
-        for i in range(n - 3):
-            yi_new = y[-1] + (h/24) * (55*f_vals[-1] - 59*f_vals[-2] + 37*f_vals[-3] - 9*f_vals[-4])
-            xi_new = x[-1] + h
-            
-            x.append(xi_new)
-            y.append(yi_new)
-            
-            f_new = eval(f_expr.replace('x', str(xi_new)).replace('y', str(yi_new)))
-            f_vals.append(f_new)
-            f_vals.pop(0)
+        F = _compilar_sistema(f_exprs)
+        J = compilar_jacobiano(f_exprs)
+        
+        if x_salida is None and n:
+            x_salida = np.linspace(x0, xf, n + 1)
+        
+        x, Y, estadisticas = _integrar_rosenbrock(F, J.dispersa if J.conviene_dispersa else J, J.derivada_x, x0, np.array(y0, dtype=float), xf,
+                                                  tolerancia, x_salida, max_pasos)
         
         detalles = {
-            'metodo': 'Adams-Bashforth',
-            'h': h,
-            'n': n
+            'metodo': 'Rosenbrock 2(3) (Sistema)',
+            'x0': x0,
+            'y0': y0,
+            'xf': xf,
+            'n': len(x) - 1,
+            'tolerancia': tolerancia,
+            'salida_densa': x_salida is not None,
+            'funciones': f_exprs
         }
+        detalles.update(estadisticas)
         
-        return x, y, detalles
+        return _como_lista(x), _como_lista(Y.T), detalles
     
     @staticmethod
-    def adams_moulton(x0: float, y0: float, xf: float, n: int, f_expr: str) -> Tuple[List, List, dict]:
+    def jacobiano(f_exprs: List[str], x: float, y: List[float]) -> Tuple[List[List[float]], dict]:
         """
-        Método de Adams-Moulton (predictor-corrector) de 4 pasos.
-        Requiere al menos n >= 4 para usar el método de Adams.
-        Si n < 4, se usa solo RK4.
-        """
-        if n < 4:
-            raise ValueError("Adams-Moulton requiere al menos 4 pasos (n >= 4)")
+        Evalúa el jacobiano simbólico de un sistema en un punto (x, Y)
         
-        h = (xf - x0) / n
-        x = [x0]
-        y = [y0]
+        Además del valor, informa el patrón de dispersión y los autovalores,
+        útiles para diagnosticar la rigidez: una razón grande entre la mayor
+        y la menor parte real negativa indica que conviene un método implícito.
         
-        # Usar RK4 para los primeros 3 pasos (genera 4 puntos incluyendo el inicial)
-        for i in range(3):
-            xi = x[-1]
-            yi = y[-1]
-            
-            k1 = eval(f_expr.replace('x', str(xi)).replace('y', str(yi)))
-            k2 = eval(f_expr.replace('x', str(xi + h/2)).replace('y', str(yi + h/2 * k1)))
-            k3 = eval(f_expr.replace('x', str(xi + h/2)).replace('y', str(yi + h/2 * k2)))
-            k4 = eval(f_expr.replace('x', str(xi + h)).replace('y', str(yi + h * k3)))
-            
-            yi_new = yi + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
-            x.append(xi + h)
-            y.append(yi_new)
+        Args:
+            f_exprs: Lista de funciones como strings
+            x: Valor de x
+            y: Valores [y1, y2, ...]
         
-        # Calcular valores de f para los 4 puntos iniciales
-        f_vals = []
-        for xi, yi in zip(x, y):
-            f_vals.append(eval(f_expr.replace('x', str(xi)).replace('y', str(yi))))
+        Returns:
+            Tupla (matriz jacobiana, detalles)
+        """
+        if len(f_exprs) != len(y):
+            raise ValueError("Se requiere un valor de y por cada ecuación del sistema")
         
-        # Adams-Moulton (predictor-corrector) para los pasos restantes (n - 3 pasos más)
-        for i in range(n - 3):
-            # Predictor: Adams-Bashforth
-            y_pred = y[-1] + (h/24) * (55*f_vals[-1] - 59*f_vals[-2] + 37*f_vals[-3] - 9*f_vals[-4])
-            x_new = x[-1] + h
-            
-            # Corrector: iteración de punto fijo
-            y_corr = y_pred
-            for _ in range(3):  # Iteraciones de corrección
-                f_pred = eval(f_expr.replace('x', str(x_new)).replace('y', str(y_corr)))
-                y_corr = y[-1] + (h/24) * (9*f_pred + 19*f_vals[-1] - 5*f_vals[-2] + f_vals[-3])
-            
-            x.append(x_new)
-            y.append(y_corr)
-            
-            f_new = eval(f_expr.replace('x', str(x_new)).replace('y', str(y_corr)))
-            f_vals.append(f_new)
-            f_vals.pop(0)
+        J = compilar_jacobiano(f_exprs)
+        matriz = J(x, np.array(y, dtype=float))
+        
+        autovalores = np.linalg.eigvals(matriz)
+        partes_reales = np.abs(autovalores.real[autovalores.real < 0])
+        razon_rigidez = float(partes_reales.max() / partes_reales.min()) if len(partes_reales) else None
         
         detalles = {
-            'metodo': 'Adams-Moulton',
-            'h': h,
-            'n': n
+            'x': x,
+            'y': y,
+            'expresiones': J.expresiones,
+            'patron': J.patron.astype(int).tolist(),
+            'densidad': J.densidad,
+            'autovalores_real': autovalores.real.tolist(),
+            'autovalores_imag': autovalores.imag.tolist(),
+            'razon_rigidez': razon_rigidez,
+            'funciones': f_exprs
         }
         
-        return x, y, detalles
+        return matriz.tolist(), detalles
+
+
+def _process_implicit_multiplication_metodos(expr: str) -> str:
+    """
+    Procesa una expresión para agregar multiplicación explícita donde sea necesario.
+    Por ejemplo: '2y' -> '2*y', 'xy' -> 'x*y', '2(x+1)' -> '2*(x+1)', etc.
+    """
+    import re
     
-    # ================== MÉTODOS PARA SISTEMAS DE ECUACIONES ==================
+    result = expr
+    
+    # Agregar * entre número y variable: 2y -> 2*y, 3x -> 3*x
+    result = re.sub(r'(\d)([xy])', r'\1*\2', result)
+    
+    # Agregar * entre variable y variable: xy -> x*y, yx -> y*x (pero no en exponentes)
+    result = re.sub(r'([xy])([xy])', r'\1*\2', result)
+    
+    # Agregar * entre número y paréntesis: 2(...) -> 2*(...)
+    result = re.sub(r'(\d)\(', r'\1*(', result)
+    
+    # Agregar * entre variable y paréntesis: x(...) -> x*(...)
+    result = re.sub(r'([xy])\(', r'\1*(', result)
+    
+    # Agregar * entre paréntesis y número: (...)2 -> (...)*2
+    result = re.sub(r'\)(\d)', r')*\1', result)
+    
+    # Agregar * entre paréntesis y variable: (...)x -> (...)*x
+    result = re.sub(r'\)([xy])', r')*\1', result)
+    
+    return result
+
+
+# ================== PROBLEMAS DE VALOR EN LA FRONTERA ==================
+
+class ProblemasFrontera:
+    """
+    Problemas de frontera de segundo orden y'' = f(x, y, y'), y(a) = alfa, y(b) = beta.
+    
+    f se escribe con y1 = y (o simplemente y) e y2 = y', como el sistema
+    equivalente [y2, f] de EcuacionesDiferenciales.
+    """
+    
+    @staticmethod
+    def _validar(a: float, b: float, n: int):
+        if n < 2:
+            raise ValueError("Se requieren al menos 2 subintervalos (n >= 2)")
+        if a == b:
+            raise ValueError("Los extremos a y b deben ser distintos")
     
     @staticmethod
-    def euler_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str]) -> Tuple[List, List[List], dict]:
+    def disparo(a: float, b: float, alfa: float, beta: float, n: int, f_expr: str,
+                tolerancia: float = 1e-10, max_iteraciones: int = 50) -> Tuple[List, List, dict]:
         """
-        Método de Euler para sistemas de ecuaciones diferenciales
+        Método del disparo no lineal
+        
+        Busca la pendiente inicial s = y'(a) tal que la solución del problema
+        de valor inicial con RK4 cumpla y(b) = beta. Cada disparo integra el
+        sistema [y2, f] compilado una sola vez y s se ajusta con la secante
+        sobre el residuo y(b) - beta (un solo ajuste si f es lineal).
         
         Args:
-            x0: Condición inicial x
-            y0: Condiciones iniciales [y1_0, y2_0, ...]
-            xf: Valor final de x
-            n: Número de pasos
-            f_exprs: Lista de funciones como strings (ej: ['y2', '-y1'])
+            a, b: Extremos del intervalo
+            alfa, beta: Condiciones de frontera y(a) y y(b)
+            n: Número de pasos de RK4 por disparo
+            f_expr: y'' como función de x, y1 (= y) e y2 (= y')
+            tolerancia: Tolerancia sobre |y(b) - beta|
+            max_iteraciones: Máximo de disparos
         
         Returns:
-            Tupla (x_valores, [[y1_vals], [y2_vals], ...], detalles)
+            Tupla (x_valores, y_valores, detalles)
         """
-        h = (xf - x0) / n
-        x = [x0]
-        num_vars = len(y0)
-        y_vals = [[y0[i]] for i in range(num_vars)]  # Inicializar para cada variable
+        ProblemasFrontera._validar(a, b, n)
+        F = _compilar_sistema(['y2', f_expr])
+        h = (b - a) / n
+        x = a + h * np.arange(n + 1)
+        historial = []
         
-        for step in range(n):
-            xi = x[-1]
-            yi = [y_vals[i][-1] for i in range(num_vars)]  # Obtener últimos valores
-            
-            # Calcular pendientes para cada ecuación
-            slopes = []
-            for f_expr in f_exprs:
-                slope = EcuacionesDiferenciales._eval_function(f_expr, xi, yi)
-                slopes.append(slope)
-            
-            # Actualizar valores
-            for i in range(num_vars):
-                y_new = yi[i] + h * slopes[i]
-                y_vals[i].append(y_new)
-            
-            x.append(xi + h)
+        def disparar(s: float) -> np.ndarray:
+            Y = np.empty((n + 1, 2))
+            Y[0] = (alfa, s)
+            with np.errstate(all='ignore'):
+                for i in range(n):
+                    Y[i + 1] = _paso_rk4(F, x[i], Y[i], h)
+            residuo = Y[-1, 0] - beta
+            historial.append({'pendiente': float(s), 'residuo': float(residuo)})
+            if not np.isfinite(residuo):
+                raise ValueError(f"El disparo con pendiente {s:.6g} diverge; pruebe con otra estimación o más pasos")
+            return Y
+        
+        s0 = (beta - alfa) / (b - a)
+        s1 = s0 + 1.0
+        Y0 = disparar(s0)
+        r0 = Y0[-1, 0] - beta
+        Y, s, r = Y0, s0, r0
+        
+        if abs(r0) > tolerancia:
+            Y1 = disparar(s1)
+            r1 = Y1[-1, 0] - beta
+            Y, s, r = Y1, s1, r1
+            while abs(r) > tolerancia and len(historial) < max_iteraciones:
+                if r1 == r0:
+                    raise ValueError("El disparo no es sensible a la pendiente inicial; no se puede ajustar")
+                s0, r0, s1 = s1, r1, s1 - r1 * (s1 - s0) / (r1 - r0)
+                Y1 = disparar(s1)
+                r1 = Y1[-1, 0] - beta
+                Y, s, r = Y1, s1, r1
+        
+        if abs(r) > tolerancia:
+            raise ValueError(f"El disparo no convergió en {max_iteraciones} iteraciones (residuo {abs(r):.3e})")
         
         detalles = {
-            'metodo': 'Euler (Sistema)',
-            'x0': x0,
-            'y0': y0,
-            'xf': xf,
+            'metodo': 'Disparo (RK4 + secante)',
+            'a': a,
+            'b': b,
+            'alfa': alfa,
+            'beta': beta,
             'n': n,
             'h': h,
-            'funciones': f_exprs
+            'pendiente_inicial': float(s),
+            'residuo': float(abs(r)),
+            'disparos': len(historial),
+            'historial': historial,
+            'funcion': f_expr
         }
         
-        return x, y_vals, detalles
+        return x.tolist(), Y[:, 0].tolist(), detalles
     
     @staticmethod
-    def runge_kutta_4_sistema(x0: float, y0: List[float], xf: float, n: int, f_exprs: List[str]) -> Tuple[List, List[List], dict]:
+    def diferencias_finitas(a: float, b: float, alfa: float, beta: float, n: int, f_expr: str,
+                            tolerancia: float = 1e-10, max_iteraciones: int = 50) -> Tuple[List, List, dict]:
         """
-        Método de Runge-Kutta orden 4 para sistemas de ecuaciones diferenciales
+        Diferencias finitas centradas con Newton para y'' = f(x, y, y')
+        
+        En los n - 1 nodos interiores se impone
+        (w[i-1] - 2 w[i] + w[i+1]) / h^2 = f(x[i], w[i], (w[i+1] - w[i-1]) / 2h).
+        El jacobiano de Newton es tridiagonal: f y sus derivadas parciales
+        respecto de y e y' (simbólicas) se evalúan en toda la malla a la vez y
+        cada iteración se resuelve con el algoritmo de Thomas, así que el costo
+        crece linealmente con n. Si f es lineal en y e y', Newton converge en
+        una iteración.
+        
+        Args:
+            a, b: Extremos del intervalo
+            alfa, beta: Condiciones de frontera y(a) y y(b)
+            n: Número de subintervalos
+            f_expr: y'' como función de x, y1 (= y) e y2 (= y')
+            tolerancia: Tolerancia sobre la corrección de Newton
+            max_iteraciones: Máximo de iteraciones de Newton
+        
+        Returns:
+            Tupla (x_valores, y_valores, detalles)
         """
-        h = (xf - x0) / n
-        x = [x0]
-        num_vars = len(y0)
-        y_vals = [[y0[i]] for i in range(num_vars)]
+        ProblemasFrontera._validar(a, b, n)
+        fuente, variables = _fuente_sistema([f_expr], m=2)
+        f = _compilar_expresion(fuente, variables)
+        parciales = _cache_parciales_frontera.obtener(fuente, variables)
         
-        for step in range(n):
-            xi = x[-1]
-            yi = [y_vals[i][-1] for i in range(num_vars)]
-            
-            # Calcular k1
-            k1 = []
-            for f_expr in f_exprs:
-                k1.append(EcuacionesDiferenciales._eval_function(f_expr, xi, yi))
-            
-            # Calcular k2
-            yi_k2 = [yi[i] + h/2 * k1[i] for i in range(num_vars)]
-            k2 = []
-            for f_expr in f_exprs:
-                k2.append(EcuacionesDiferenciales._eval_function(f_expr, xi + h/2, yi_k2))
-            
-            # Calcular k3
-            yi_k3 = [yi[i] + h/2 * k2[i] for i in range(num_vars)]
-            k3 = []
-            for f_expr in f_exprs:
-                k3.append(EcuacionesDiferenciales._eval_function(f_expr, xi + h/2, yi_k3))
-            
-            # Calcular k4
-            yi_k4 = [yi[i] + h * k3[i] for i in range(num_vars)]
-            k4 = []
-            for f_expr in f_exprs:
-                k4.append(EcuacionesDiferenciales._eval_function(f_expr, xi + h, yi_k4))
-            
-            # Actualizar valores
-            for i in range(num_vars):
-                y_new = yi[i] + (h / 6) * (k1[i] + 2*k2[i] + 2*k3[i] + k4[i])
-                y_vals[i].append(y_new)
-            
-            x.append(xi + h)
+        h = (b - a) / n
+        x = a + h * np.arange(n + 1)
+        w = alfa + (beta - alfa) * (x - a) / (b - a)
+        xi = x[1:-1]
+        forma = xi.shape
+        
+        for iteracion in range(1, max_iteraciones + 1):
+            derivada = (w[2:] - w[:-2]) / (2 * h)
+            argumentos = (xi, w[1:-1], derivada)
+            residuo = (w[:-2] - 2 * w[1:-1] + w[2:]) / h**2 - np.broadcast_to(f(*argumentos)[0], forma)
+            f_y, f_yp = parciales(*argumentos)
+            p = np.broadcast_to(f_yp, forma)
+            q = np.broadcast_to(f_y, forma)
+            if not (np.all(np.isfinite(residuo)) and np.all(np.isfinite(p)) and np.all(np.isfinite(q))):
+                raise ValueError("No se pudo evaluar f en la malla; revise la función o la estimación inicial")
+        
+            correccion = _thomas(1 / h**2 + p[1:] / (2 * h), -2 / h**2 - q, 1 / h**2 - p[:-1] / (2 * h), -residuo)
+            w[1:-1] += correccion
+            cambio = float(np.max(np.abs(correccion))) if len(correccion) else 0.0
+            if cambio <= tolerancia * max(1.0, float(np.max(np.abs(w)))):
+                break
+        else:
+            raise ValueError(f"Newton no convergió en {max_iteraciones} iteraciones (corrección {cambio:.3e})")
         
         detalles = {
-            'metodo': 'Runge-Kutta Orden 4 (Sistema)',
-            'x0': x0,
-            'y0': y0,
-            'xf': xf,
+            'metodo': 'Diferencias finitas (Newton + Thomas)',
+            'a': a,
+            'b': b,
+            'alfa': alfa,
+            'beta': beta,
             'n': n,
             'h': h,
-            'funciones': f_exprs
+            'iteraciones': iteracion,
+            'correccion_final': cambio,
+            'funcion': f_expr
         }
         
-        return x, y_vals, detalles
-
-
-def _process_implicit_multiplication_metodos(expr: str) -> str:
-    """
-    Procesa una expresión para agregar multiplicación explícita donde sea necesario.
-    Por ejemplo: '2y' -> '2*y', 'xy' -> 'x*y', '2(x+1)' -> '2*(x+1)', etc.
-    """
-    import re
-    
-    result = expr
-    
-    # Agregar * entre número y variable: 2y -> 2*y, 3x -> 3*x
-    result = re.sub(r'(\d)([xy])', r'\1*\2', result)
-    
-    # Agregar * entre variable y variable: xy -> x*y, yx -> y*x (pero no en exponentes)
-    result = re.sub(r'([xy])([xy])', r'\1*\2', result)
-    
-    # Agregar * entre número y paréntesis: 2(...) -> 2*(...)
-    result = re.sub(r'(\d)\(', r'\1*(', result)
-    
-    # Agregar * entre variable y paréntesis: x(...) -> x*(...)
-    result = re.sub(r'([xy])\(', r'\1*(', result)
-    
-    # Agregar * entre paréntesis y número: (...)2 -> (...)*2
-    result = re.sub(r'\)(\d)', r')*\1', result)
-    
-    # Agregar * entre paréntesis y variable: (...)x -> (...)*x
-    result = re.sub(r'\)([xy])', r')*\1', result)
-    
-    return result
+        return x.tolist(), w.tolist(), detalles
 
 
 class EcuacionesUnaVariable:
     """Métodos para resolver ecuaciones de una variable: f(x) = 0"""
     
-    # Funciones matemáticas disponibles para eval
+    # Funciones matemáticas disponibles en las expresiones
     _math_functions = {
         'sqrt': np.sqrt,
         'sin': np.sin,
@@ -2092,16 +5259,135 @@ class EcuacionesUnaVariable:
         'e': np.e
     }
     
+    @staticmethod
+    def _compilar_funcion(expr: str):
+        """
+        Compila una expresión en x una sola vez y devuelve f(x) -> float
+        
+        La expresión se analiza con sympy (solo se aceptan x, las funciones
+        de _math_functions y constantes) y se compila con lambdify, de modo
+        que cada evaluación dentro de un método iterativo es una llamada a
+        una función de Python sin reconstruir ni analizar el string.
+        """
+        f_compilada = _compilar_expresion(expr, ('x',))
+        
+        def f(x: float) -> float:
+            try:
+                return float(f_compilada(x))
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {str(e)}")
+        
+        return f
+    
+    @staticmethod
+    def _compilar_newton(f_expr: str, df_expr: str = None):
+        """
+        Compila f y f' en una función fusionada x -> (f(x), f'(x))
+        
+        Si df_expr es None, la derivada se obtiene simbólicamente de f_expr.
+        
+        Returns:
+            Tupla (f' como string, función fusionada)
+        """
+        fuente = f_expr if df_expr is None else f"({f_expr}), ({df_expr})"
+        df, f_compilada = _cache_newton.obtener(fuente, ('x',))
+        
+        def f_df(x: float) -> Tuple[float, float]:
+            try:
+                f_val, df_val = f_compilada(x)
+                return float(f_val), float(df_val)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {str(e)}")
+        
+        return (str(df) if df_expr is None else df_expr), f_df
+    
     @staticmethod
     def _eval_function(expr: str, x: float) -> float:
         """Evalúa una expresión con soporte para funciones matemáticas"""
-        try:
-            # Reemplazar x con el valor
-            expr_repl = expr.replace('x', f'({x})')
-            # Evaluar con las funciones matemáticas disponibles
-            return eval(expr_repl, {"__builtins__": {}}, EcuacionesUnaVariable._math_functions)
-        except Exception as e:
-            raise ValueError(f"Error al evaluar la función: {str(e)}")
+        return EcuacionesUnaVariable._compilar_funcion(expr)(x)
+    
+    @staticmethod
+    def todas_las_raices(f_expr: str, a: float, b: float, puntos: int = 10000, tolerancia: float = 1e-12,
+                         max_iteraciones: int = 100, tolerancia_cero: float = 1e-10) -> Tuple[List[float], dict]:
+        """
+        Encuentra todas las raíces de f(x) = 0 en [a, b]
+        
+        f se evalúa en una malla de 'puntos' valores con una sola llamada
+        vectorizada. Cada cambio de signo entre nodos vecinos es un intervalo
+        con una raíz, y todos se refinan juntos con el método de Illinois. Los
+        mínimos locales de |f| sin cambio de signo (raíces dobles, tangentes)
+        se refinan con sección áurea sobre todos a la vez y se aceptan si
+        |f| < tolerancia_cero. Raíces más cercanas que el paso de la malla
+        pueden perderse.
+        
+        Args:
+            f_expr: Función como string (ej: 'sin(10*x)')
+            a: Límite inferior del intervalo
+            b: Límite superior del intervalo
+            puntos: Número de puntos de la malla de búsqueda
+            tolerancia: Tolerancia del refinamiento
+            max_iteraciones: Máximo de pasadas de refinamiento
+            tolerancia_cero: Umbral de |f| para aceptar un mínimo como raíz doble
+        
+        Returns:
+            Tupla (raíces ordenadas, detalles)
+        """
+        if not a < b:
+            raise ValueError("Se requiere a < b")
+        if puntos < 2:
+            raise ValueError("La malla necesita al menos 2 puntos")
+        
+        f_compilada = _compilar_expresion(f_expr, ('x',))
+        
+        def f(x):
+            with np.errstate(all='ignore'):
+                return np.broadcast_to(f_compilada(x), np.shape(x)).astype(float)
+        
+        x = np.linspace(a, b, puntos)
+        fx = f(x)
+        evaluaciones = puntos
+        
+        exactas = x[fx == 0]
+        cambios = np.nonzero(fx[:-1] * fx[1:] < 0)[0]
+        raices_cambio, pasadas, evals = _illinois_lote(f, x[cambios], x[cambios + 1], fx[cambios], fx[cambios + 1],
+                                                       tolerancia, max_iteraciones)
+        evaluaciones += evals
+        
+        # Mínimos locales de |f| sin cambio de signo alrededor
+        absf = np.abs(fx)
+        interior = np.arange(1, puntos - 1)
+        minimos = interior[(absf[1:-1] < absf[:-2]) & (absf[1:-1] <= absf[2:])
+                           & (fx[:-2] * fx[1:-1] > 0) & (fx[1:-1] * fx[2:] > 0)]
+        izquierda, derecha = x[minimos - 1], x[minimos + 1]
+        razon = (np.sqrt(5) - 1) / 2
+        for _ in range(max_iteraciones):
+            if not len(minimos) or np.all(derecha - izquierda <= tolerancia * np.maximum(1.0, np.abs(derecha))):
+                break
+            c = derecha - razon * (derecha - izquierda)
+            d = izquierda + razon * (derecha - izquierda)
+            menor_c = np.abs(f(c)) < np.abs(f(d))
+            evaluaciones += 2 * len(minimos)
+            derecha = np.where(menor_c, d, derecha)
+            izquierda = np.where(menor_c, izquierda, c)
+        candidatos = (izquierda + derecha) / 2
+        dobles = candidatos[np.abs(f(candidatos)) < tolerancia_cero]
+        evaluaciones += len(candidatos)
+        
+        raices = np.sort(np.concatenate((exactas, raices_cambio, dobles)))
+        if len(raices) > 1:
+            raices = raices[np.concatenate(([True], np.diff(raices) > 10 * tolerancia * np.maximum(1.0, np.abs(raices[1:]))))]
+        
+        return raices.tolist(), {
+            'metodo': 'Todas las raíces (malla + Illinois por lotes)',
+            'intervalo': [a, b],
+            'puntos': puntos,
+            'num_raices': len(raices),
+            'cambios_de_signo': int(len(cambios)),
+            'raices_dobles': int(len(dobles)),
+            'pasadas_refinamiento': pasadas,
+            'evaluaciones': evaluaciones,
+            'fx': np.abs(f(raices)).tolist()
+        }
     
     @staticmethod
     def biseccion(f_expr: str, a: float, b: float, tolerancia: float = 1e-5, max_iteraciones: int = 100) -> Tuple[float, dict]:
@@ -2120,9 +5406,11 @@ class EcuacionesUnaVariable:
         Returns:
             Tupla (raíz, detalles con historial de iteraciones)
         """
+        f = EcuacionesUnaVariable._compilar_funcion(f_expr)
+        
         # Verificar que haya cambio de signo
-        fa = EcuacionesUnaVariable._eval_function(f_expr, a)
-        fb = EcuacionesUnaVariable._eval_function(f_expr, b)
+        fa = f(a)
+        fb = f(b)
         
         if fa * fb > 0:
             raise ValueError("No hay cambio de signo en el intervalo [a, b]. f(a) y f(b) deben tener signos opuestos")
@@ -2131,7 +5419,7 @@ class EcuacionesUnaVariable:
         
         for i in range(max_iteraciones):
             c = (a + b) / 2
-            fc = EcuacionesUnaVariable._eval_function(f_expr, c)
+            fc = f(c)
             
             error = abs(b - a)
             
@@ -2159,7 +5447,7 @@ class EcuacionesUnaVariable:
                 fa = fc
         
         c = (a + b) / 2
-        fc = EcuacionesUnaVariable._eval_function(f_expr, c)
+        fc = f(c)
         
         return c, {
             'metodo': 'Bisección',
@@ -2185,8 +5473,10 @@ class EcuacionesUnaVariable:
         Returns:
             Tupla (raíz, detalles)
         """
-        fa = EcuacionesUnaVariable._eval_function(f_expr, a)
-        fb = EcuacionesUnaVariable._eval_function(f_expr, b)
+        f = EcuacionesUnaVariable._compilar_funcion(f_expr)
+        
+        fa = f(a)
+        fb = f(b)
         
         if fa * fb > 0:
             raise ValueError("No hay cambio de signo en el intervalo [a, b]")
@@ -2197,7 +5487,7 @@ class EcuacionesUnaVariable:
         for i in range(max_iteraciones):
             # Fórmula de falsa posición
             c = (a * fb - b * fa) / (fb - fa)
-            fc = EcuacionesUnaVariable._eval_function(f_expr, c)
+            fc = f(c)
             
             error = abs(c - x_anterior)
             
@@ -2250,8 +5540,10 @@ class EcuacionesUnaVariable:
         Returns:
             Tupla (raíz, detalles)
         """
-        f0 = EcuacionesUnaVariable._eval_function(f_expr, x0)
-        f1 = EcuacionesUnaVariable._eval_function(f_expr, x1)
+        f = EcuacionesUnaVariable._compilar_funcion(f_expr)
+        
+        f0 = f(x0)
+        f1 = f(x1)
         
         historial = []
         
@@ -2261,7 +5553,7 @@ class EcuacionesUnaVariable:
             
             # Fórmula de la secante: x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
             x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
-            f2 = EcuacionesUnaVariable._eval_function(f_expr, x2)
+            f2 = f(x2)
             
             error = abs(x2 - x1)
             
@@ -2294,13 +5586,15 @@ class EcuacionesUnaVariable:
         }
     
     @staticmethod
-    def newton_raphson(f_expr: str, df_expr: str, x0: float, tolerancia: float = 1e-5, max_iteraciones: int = 100) -> Tuple[float, dict]:
+    def newton_raphson(f_expr: str, df_expr: Union[str, None], x0: float, tolerancia: float = 1e-5, max_iteraciones: int = 100) -> Tuple[float, dict]:
         """
         Método de Newton-Raphson
         
+        f y f' se evalúan juntas en una sola llamada, una vez por iteración.
+        
         Args:
             f_expr: Función como string
-            df_expr: Derivada como string
+            df_expr: Derivada como string, o None para derivarla automáticamente
             x0: Punto inicial
             tolerancia: Criterio de convergencia
             max_iteraciones: Número máximo de iteraciones
@@ -2308,22 +5602,23 @@ class EcuacionesUnaVariable:
         Returns:
             Tupla (raíz, detalles)
         """
+        derivada, f_df = EcuacionesUnaVariable._compilar_newton(f_expr, df_expr)
+        
         historial = []
         x = x0
+        f_val, df_val = f_df(x)
         
         for i in range(max_iteraciones):
-            f_val = EcuacionesUnaVariable._eval_function(f_expr, x)
-            df_val = EcuacionesUnaVariable._eval_function(df_expr, x)
-            
             if abs(df_val) < 1e-15:
                 raise ValueError("La derivada es cero o muy cercana a cero")
             
             x_new = x - f_val / df_val
+            f_new, df_new = f_df(x_new)
             error = abs(x_new - x)
             
             historial.append({
                 'x': x_new,
-                'fx': EcuacionesUnaVariable._eval_function(f_expr, x_new),
+                'fx': f_new,
                 'error': error
             })
             
@@ -2331,23 +5626,26 @@ class EcuacionesUnaVariable:
                 return x_new, {
                     'metodo': 'Newton-Raphson',
                     'raiz': x_new,
-                    'fx': EcuacionesUnaVariable._eval_function(f_expr, x_new),
+                    'fx': f_new,
                     'iteraciones': i + 1,
                     'error_estimado': error,
-                    'historial': historial
+                    'historial': historial,
+                    'derivada': derivada,
+                    'evaluaciones': i + 2
                 }
             
             x = x_new
-        
-        f_final = EcuacionesUnaVariable._eval_function(f_expr, x)
+            f_val, df_val = f_new, df_new
         
         return x, {
             'metodo': 'Newton-Raphson',
             'raiz': x,
-            'fx': f_final,
+            'fx': f_val,
             'iteraciones': max_iteraciones,
             'error_estimado': error,
-            'historial': historial
+            'historial': historial,
+            'derivada': derivada,
+            'evaluaciones': max_iteraciones + 1
         }
     
     @staticmethod
@@ -2366,15 +5664,19 @@ class EcuacionesUnaVariable:
         Returns:
             Tupla (raíz, detalles)
         """
+        g = EcuacionesUnaVariable._compilar_funcion(g_expr)
+        
         historial = []
         x = x0
+        x_new = g(x)
         
         for i in range(max_iteraciones):
-            x_new = EcuacionesUnaVariable._eval_function(g_expr, x)
+            # g(x_new) es también el siguiente punto de la iteración
+            g_new = g(x_new)
             error = abs(x_new - x)
             
             # f(x) = x - g(x) en el nuevo punto
-            fx = x_new - EcuacionesUnaVariable._eval_function(g_expr, x_new)
+            fx = x_new - g_new
             
             historial.append({
                 'x': x_new,
@@ -2392,9 +5694,7 @@ class EcuacionesUnaVariable:
                     'historial': historial
                 }
             
-            x = x_new
-        
-        fx = x - EcuacionesUnaVariable._eval_function(g_expr, x)
+            x, x_new = x_new, g_new
         
         return x, {
             'metodo': 'Punto Fijo',
@@ -2424,9 +5724,11 @@ class EcuacionesUnaVariable:
         Returns:
             Tupla (raíz, detalles)
         """
-        f0 = EcuacionesUnaVariable._eval_function(f_expr, x0)
-        f1 = EcuacionesUnaVariable._eval_function(f_expr, x1)
-        f2 = EcuacionesUnaVariable._eval_function(f_expr, x2)
+        f = EcuacionesUnaVariable._compilar_funcion(f_expr)
+        
+        f0 = f(x0)
+        f1 = f(x1)
+        f2 = f(x2)
         
         historial = []
         
@@ -2472,7 +5774,7 @@ class EcuacionesUnaVariable:
                 else:
                     raise ValueError("Denominador demasiado pequeño")
             
-            f_new = EcuacionesUnaVariable._eval_function(f_expr, x_new)
+            f_new = f(x_new)
             error = abs(x_new - x2)
             
             historial.append({
@@ -2502,4 +5804,508 @@ class EcuacionesUnaVariable:
             'iteraciones': max_iteraciones,
             'error_estimado': error,
             'historial': historial
-        }
\ No newline at end of file
+        }
+    
+    # ================== MÉTODOS HÍBRIDOS CON INTERVALO ==================
+    
+    @staticmethod
+    def _raiz_en_extremo(metodo: str, a: float, fa: float, b: float, fb: float):
+        """Resultado inmediato si f se anula en un extremo del intervalo; None en otro caso"""
+        if fa != 0 and fb != 0:
+            return None
+        raiz, fx = (a, fa) if fa == 0 else (b, fb)
+        return raiz, {
+            'metodo': metodo,
+            'raiz': raiz,
+            'fx': fx,
+            'iteraciones': 0,
+            'error_estimado': 0.0,
+            'historial': []
+        }
+    
+    @staticmethod
+    def brent(f_expr: str, a: float, b: float, tolerancia: float = 1e-5, max_iteraciones: int = 100) -> Tuple[float, dict]:
+        """
+        Método de Brent
+        
+        Mantiene un intervalo [b, c] con cambio de signo y en cada paso prueba
+        interpolación cuadrática inversa o secante; si el paso cae fuera del
+        intervalo o no lo reduce lo suficiente, hace bisección. Converge de
+        forma superlineal sin perder la garantía de la bisección.
+        
+        Args:
+            f_expr: Función como string
+            a: Límite inferior
+            b: Límite superior
+            tolerancia: Criterio de convergencia
+            max_iteraciones: Número máximo de iteraciones
+        
+        Returns:
+            Tupla (raíz, detalles)
+        """
+        f = EcuacionesUnaVariable._compilar_funcion(f_expr)
+        
+        fa = f(a)
+        fb = f(b)
+        
+        if fa * fb > 0:
+            raise ValueError("No hay cambio de signo en el intervalo [a, b]")
+        extremo = EcuacionesUnaVariable._raiz_en_extremo('Brent', a, fa, b, fb)
+        if extremo:
+            return extremo
+        
+        eps = np.finfo(float).eps
+        c, fc = a, fa
+        d = e = b - a
+        historial = []
+        
+        for i in range(max_iteraciones):
+            # b es la mejor aproximación y [b, c] el intervalo con cambio de signo
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+        
+            tol1 = 2 * eps * abs(b) + 0.5 * tolerancia
+            xm = 0.5 * (c - b)
+        
+            if abs(e) >= tol1 and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    # Secante
+                    p = 2 * xm * s
+                    q = 1 - s
+                else:
+                    # Interpolación cuadrática inversa
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+        
+                # Aceptar la interpolación solo si cae dentro del intervalo y reduce el paso
+                if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = xm
+            else:
+                d = e = xm
+        
+            a, fa = b, fb
+            b += d if abs(d) > tol1 else (tol1 if xm > 0 else -tol1)
+            fb = f(b)
+        
+            if (fb > 0) == (fc > 0):
+                c, fc = a, fa
+                d = e = b - a
+        
+            error = abs(c - b)
+        
+            historial.append({
+                'x': b,
+                'fx': fb,
+                'error': error
+            })
+        
+            if abs(fb) < tolerancia or error < tolerancia:
+                return b, {
+                    'metodo': 'Brent',
+                    'raiz': b,
+                    'fx': fb,
+                    'iteraciones': i + 1,
+                    'error_estimado': error,
+                    'historial': historial
+                }
+        
+        return b, {
+            'metodo': 'Brent',
+            'raiz': b,
+            'fx': fb,
+            'iteraciones': max_iteraciones,
+            'error_estimado': error,
+            'historial': historial
+        }
+    
+    @staticmethod
+    def illinois(f_expr: str, a: float, b: float, tolerancia: float = 1e-5, max_iteraciones: int = 100,
+                 variante: str = 'illinois') -> Tuple[float, dict]:
+        """
+        Falsa Posición modificada (Illinois o Anderson-Björck)
+        
+        Como la falsa posición, pero cuando el mismo extremo se conserva dos
+        veces seguidas su valor de f se reduce (a la mitad en Illinois, por
+        1 - f(c)/f(b) en Anderson-Björck). Así el intervalo se cierra por
+        ambos lados y la convergencia es superlineal en lugar de quedar
+        estancada en un extremo.
+        
+        Args:
+            f_expr: Función como string
+            a: Límite inferior
+            b: Límite superior
+            tolerancia: Criterio de convergencia
+            max_iteraciones: Número máximo de iteraciones
+            variante: 'illinois' o 'anderson_bjorck'
+        
+        Returns:
+            Tupla (raíz, detalles)
+        """
+        nombres = {'illinois': 'Illinois', 'anderson_bjorck': 'Anderson-Björck'}
+        if variante not in nombres:
+            raise ValueError("variante debe ser 'illinois' o 'anderson_bjorck'")
+        metodo = nombres[variante]
+        
+        f = EcuacionesUnaVariable._compilar_funcion(f_expr)
+        
+        fa = f(a)
+        fb = f(b)
+        
+        if fa * fb > 0:
+            raise ValueError("No hay cambio de signo en el intervalo [a, b]")
+        extremo = EcuacionesUnaVariable._raiz_en_extremo(metodo, a, fa, b, fb)
+        if extremo:
+            return extremo
+        
+        historial = []
+        
+        for i in range(max_iteraciones):
+            c = (a * fb - b * fa) / (fb - fa)
+            fc = f(c)
+        
+            if fc * fb < 0:
+                # El extremo b pasa a ser a; el intervalo se cierra por el otro lado
+                a, fa = b, fb
+            elif variante == 'illinois':
+                fa *= 0.5
+            else:
+                m = 1 - fc / fb
+                fa *= m if m > 0 else 0.5
+            b, fb = c, fc
+        
+            error = abs(b - a)
+        
+            historial.append({
+                'x': c,
+                'fx': fc,
+                'error': error
+            })
+        
+            if abs(fc) < tolerancia or error < tolerancia:
+                return c, {
+                    'metodo': metodo,
+                    'raiz': c,
+                    'fx': fc,
+                    'iteraciones': i + 1,
+                    'error_estimado': error,
+                    'historial': historial
+                }
+        
+        return c, {
+            'metodo': metodo,
+            'raiz': c,
+            'fx': fc,
+            'iteraciones': max_iteraciones,
+            'error_estimado': error,
+            'historial': historial
+        }
+    
+    @staticmethod
+    def newton_biseccion(f_expr: str, a: float, b: float, df_expr: Union[str, None] = None, tolerancia: float = 1e-5,
+                         max_iteraciones: int = 100) -> Tuple[float, dict]:
+        """
+        Newton-Raphson salvaguardado con bisección
+        
+        Mantiene un intervalo con cambio de signo. Se da el paso de Newton
+        cuando cae dentro del intervalo y reduce el paso anterior al menos a
+        la mitad; si no, se hace bisección. Converge cuadráticamente cerca de
+        la raíz y nunca diverge.
+        
+        Args:
+            f_expr: Función como string
+            a: Límite inferior
+            b: Límite superior
+            df_expr: Derivada como string, o None para derivarla automáticamente
+            tolerancia: Criterio de convergencia
+            max_iteraciones: Número máximo de iteraciones
+        
+        Returns:
+            Tupla (raíz, detalles)
+        """
+        derivada, f_df = EcuacionesUnaVariable._compilar_newton(f_expr, df_expr)
+        
+        fa, _ = f_df(a)
+        fb, _ = f_df(b)
+        
+        if fa * fb > 0:
+            raise ValueError("No hay cambio de signo en el intervalo [a, b]")
+        extremo = EcuacionesUnaVariable._raiz_en_extremo('Newton-Bisección', a, fa, b, fb)
+        if extremo:
+            return extremo
+        
+        # Orientar el intervalo para que f(bajo) < 0 < f(alto)
+        bajo, alto = (a, b) if fa < 0 else (b, a)
+        x = 0.5 * (a + b)
+        fx, dfx = f_df(x)
+        if fx == 0:
+            # Raíz exacta en el punto medio (el paso de Newton sería 0/0 si f' = 0)
+            raiz, detalles = EcuacionesUnaVariable._raiz_en_extremo('Newton-Bisección', x, fx, x, fx)
+            detalles.update({'derivada': derivada, 'pasos_newton': 0})
+            return raiz, detalles
+        paso = paso_anterior = abs(b - a)
+        historial = []
+        pasos_newton = 0
+        
+        for i in range(max_iteraciones):
+            fuera = ((x - alto) * dfx - fx) * ((x - bajo) * dfx - fx) > 0
+            if fuera or abs(2 * fx) > abs(paso_anterior * dfx):
+                paso_anterior, paso = paso, 0.5 * (alto - bajo)
+                x = bajo + paso
+                tipo = 'biseccion'
+            else:
+                paso_anterior, paso = paso, fx / dfx
+                x = x - paso
+                tipo = 'newton'
+                pasos_newton += 1
+        
+            fx, dfx = f_df(x)
+            if fx < 0:
+                bajo = x
+            else:
+                alto = x
+        
+            error = abs(paso)
+        
+            historial.append({
+                'x': x,
+                'fx': fx,
+                'error': error,
+                'paso': tipo
+            })
+        
+            if abs(fx) < tolerancia or error < tolerancia:
+                return x, {
+                    'metodo': 'Newton-Bisección',
+                    'raiz': x,
+                    'fx': fx,
+                    'iteraciones': i + 1,
+                    'error_estimado': error,
+                    'historial': historial,
+                    'derivada': derivada,
+                    'pasos_newton': pasos_newton
+                }
+        
+        return x, {
+            'metodo': 'Newton-Bisección',
+            'raiz': x,
+            'fx': fx,
+            'iteraciones': max_iteraciones,
+            'error_estimado': error,
+            'historial': historial,
+            'derivada': derivada,
+            'pasos_newton': pasos_newton
+        }
+    
+    # ================== MÉTODOS POR LOTES ==================
+    
+    @staticmethod
+    def _preparar_lote(f_expr: str, parametros, *valores):
+        """
+        Compila f(x) o f(x, p) y extiende los valores iniciales y los
+        parámetros a un mismo número de carriles.
+        
+        Returns:
+            Tupla (f(x, indices) -> f de esos carriles, arreglos extendidos, p o None)
+        """
+        variables = ('x', 'p') if parametros is not None else ('x',)
+        f_compilada = _compilar_expresion(f_expr, variables)
+        
+        arreglos = [np.atleast_1d(np.asarray(v, dtype=float)) for v in valores]
+        if parametros is not None:
+            arreglos.append(np.atleast_1d(np.asarray(parametros, dtype=float)))
+        try:
+            arreglos = [np.array(v, dtype=float) for v in np.broadcast_arrays(*arreglos)]
+        except ValueError:
+            raise ValueError("Los valores iniciales y los parámetros deben tener la misma longitud (o ser un solo valor)")
+        if any(v.ndim != 1 for v in arreglos):
+            raise ValueError("Los valores iniciales y los parámetros deben ser vectores")
+        
+        p = arreglos.pop() if parametros is not None else None
+        
+        def evaluar(funcion, x, indices):
+            with np.errstate(all='ignore'):
+                valor = funcion(x, p[indices]) if p is not None else funcion(x)
+            return np.broadcast_to(valor, x.shape).astype(float)
+        
+        return (lambda x, indices: evaluar(f_compilada, x, indices)), arreglos, p, evaluar
+    
+    @staticmethod
+    def _resultado_lote(metodo: str, x: np.ndarray, fx: np.ndarray, iteraciones: np.ndarray,
+                        convergio: np.ndarray, evaluaciones: int, p: np.ndarray) -> Tuple[List, dict]:
+        """Raíces por carril (None si el carril no convergió a un valor finito) y detalles"""
+        finito = np.isfinite(x) & np.isfinite(fx)
+        convergio = convergio & finito
+        raices = [float(v) if ok else None for v, ok in zip(x, finito)]
+        
+        return raices, {
+            'metodo': metodo,
+            'carriles': len(x),
+            'convergidos': int(np.sum(convergio)),
+            'convergio': convergio.tolist(),
+            'iteraciones': iteraciones.tolist(),
+            'fx': [float(v) if ok else None for v, ok in zip(fx, finito)],
+            'evaluaciones': evaluaciones,
+            'parametros': None if p is None else p.tolist()
+        }
+    
+    @staticmethod
+    def newton_lote(f_expr: str, x0, parametros=None, df_expr: str = None, tolerancia: float = 1e-10,
+                    max_iteraciones: int = 100) -> Tuple[List, dict]:
+        """
+        Newton-Raphson para muchos puntos iniciales y parámetros a la vez
+        
+        Resuelve f(x; p) = 0 en cada carril (x0[i], p[i]); f puede usar el
+        parámetro 'p'. Cada iteración evalúa f y f' una vez sobre los carriles
+        activos y los que convergen dejan de calcularse.
+        
+        Args:
+            f_expr: Función como string (ej: 'x**2 - p')
+            x0: Puntos iniciales (vector o un solo valor)
+            parametros: Valores de p por carril (opcional)
+            df_expr: Derivada; si se omite se obtiene simbólicamente
+            tolerancia: Criterio de convergencia sobre |f| o el paso
+            max_iteraciones: Número máximo de iteraciones
+        
+        Returns:
+            Tupla (raíces por carril, detalles con iteraciones por carril)
+        """
+        f, (x,), p, _ = EcuacionesUnaVariable._preparar_lote(f_expr, parametros, x0)
+        variables = ('x', 'p') if parametros is not None else ('x',)
+        # f y f' fusionadas, como en newton_raphson (f' simbólica si no se indica)
+        fuente = f_expr if df_expr is None else f"({f_expr}), ({df_expr})"
+        _, f_df = _cache_newton.obtener(fuente, variables)
+        
+        k = len(x)
+        fx = np.full(k, np.nan)
+        iteraciones = np.zeros(k, dtype=int)
+        convergio = np.zeros(k, dtype=bool)
+        desplazados = np.zeros(k, dtype=bool)
+        activos = np.arange(k)
+        evaluaciones = 0
+        
+        for _ in range(max_iteraciones):
+            if not len(activos):
+                break
+            xa = x[activos]
+            with np.errstate(all='ignore'):
+                fa, dfa = f_df(xa, p[activos]) if p is not None else f_df(xa)
+                fa = np.broadcast_to(fa, xa.shape).astype(float)
+                dfa = np.broadcast_to(dfa, xa.shape).astype(float)
+            evaluaciones += len(activos)
+            fx[activos] = fa
+            iteraciones[activos] += 1
+        
+            with np.errstate(all='ignore'):
+                paso = fa / dfa
+            # Un carril con |f| < tolerancia se queda en el punto evaluado
+            exacto = np.abs(fa) < tolerancia
+            x[activos] = np.where(exacto, xa, xa - paso)
+            desplazados[activos] = ~exacto
+            listos = exacto | (np.abs(paso) < tolerancia)
+            fallidos = ~exacto & ~np.isfinite(paso)
+            convergio[activos[listos & ~fallidos]] = True
+            activos = activos[~(listos | fallidos)]
+        
+        # fx es el residuo en la raíz devuelta, no en el iterado anterior
+        indices = np.flatnonzero(desplazados & np.isfinite(x))
+        if len(indices):
+            fx[indices] = f(x[indices], indices)
+            evaluaciones += len(indices)
+        
+        return EcuacionesUnaVariable._resultado_lote('Newton-Raphson (lote)', x, fx, iteraciones,
+                                                     convergio, evaluaciones, p)
+    
+    @staticmethod
+    def secante_lote(f_expr: str, x0, x1, parametros=None, tolerancia: float = 1e-10,
+                     max_iteraciones: int = 100) -> Tuple[List, dict]:
+        """
+        Método de la secante para muchos pares iniciales y parámetros a la vez
+        
+        Igual que newton_lote pero sin derivada: cada carril parte de (x0[i], x1[i]).
+        """
+        f, (xa, xb), p, _ = EcuacionesUnaVariable._preparar_lote(f_expr, parametros, x0, x1)
+        k = len(xa)
+        todos = np.arange(k)
+        fa = f(xa, todos)
+        fb = f(xb, todos)
+        evaluaciones = 2 * k
+        
+        iteraciones = np.zeros(k, dtype=int)
+        convergio = np.abs(fb) < tolerancia
+        activos = todos[~convergio]
+        
+        for _ in range(max_iteraciones):
+            if not len(activos):
+                break
+            A, B, FA, FB = xa[activos], xb[activos], fa[activos], fb[activos]
+            with np.errstate(all='ignore'):
+                c = B - FB * (B - A) / (FB - FA)
+            fc = f(c, activos)
+            evaluaciones += len(activos)
+            iteraciones[activos] += 1
+        
+            xa[activos], fa[activos] = B, FB
+            xb[activos], fb[activos] = c, fc
+            listos = (np.abs(fc) < tolerancia) | (np.abs(c - B) < tolerancia)
+            fallidos = ~np.isfinite(c)
+            convergio[activos[listos & ~fallidos]] = True
+            activos = activos[~(listos | fallidos)]
+        
+        return EcuacionesUnaVariable._resultado_lote('Secante (lote)', xb, fb, iteraciones,
+                                                     convergio, evaluaciones, p)
+    
+    @staticmethod
+    def biseccion_lote(f_expr: str, a, b, parametros=None, tolerancia: float = 1e-10,
+                       max_iteraciones: int = 200) -> Tuple[List, dict]:
+        """
+        Bisección para muchos intervalos y parámetros a la vez
+        
+        Cada carril necesita un cambio de signo en [a[i], b[i]]; los carriles
+        sin él se informan como no convergidos sin detener el resto.
+        """
+        f, (a, b), p, _ = EcuacionesUnaVariable._preparar_lote(f_expr, parametros, a, b)
+        k = len(a)
+        todos = np.arange(k)
+        fa = f(a, todos)
+        fb = f(b, todos)
+        evaluaciones = 2 * k
+        
+        c = (a + b) / 2
+        fc = np.full(k, np.nan)
+        iteraciones = np.zeros(k, dtype=int)
+        convergio = np.zeros(k, dtype=bool)
+        sin_cambio = ~(fa * fb <= 0)
+        activos = todos[~sin_cambio]
+        
+        for _ in range(max_iteraciones):
+            if not len(activos):
+                break
+            A, B, FA = a[activos], b[activos], fa[activos]
+            C = (A + B) / 2
+            FC = f(C, activos)
+            evaluaciones += len(activos)
+            iteraciones[activos] += 1
+            c[activos], fc[activos] = C, FC
+        
+            izquierda = FA * FC < 0
+            b[activos] = np.where(izquierda, C, B)
+            a[activos] = np.where(izquierda, A, C)
+            fa[activos] = np.where(izquierda, FA, FC)
+        
+            listos = (np.abs(FC) < tolerancia) | (np.abs(B - A) < tolerancia)
+            convergio[activos[listos]] = True
+            activos = activos[~listos]
+        
+        raices, detalles = EcuacionesUnaVariable._resultado_lote('Bisección (lote)', c, fc, iteraciones,
+                                                                 convergio, evaluaciones, p)
+        detalles['sin_cambio_de_signo'] = np.nonzero(sin_cambio)[0].tolist()
+        return raices, detalles
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+PRUEBAS DE FORMATOS DE RESPUESTA
+====================================
+Verifica que las respuestas binarias negociadas con Accept contengan la
+misma trayectoria que la respuesta JSON
+"""
+
+import io
+import json
+import struct
+
+import pytest
+import numpy as np
+
+import app as aplicacion
+
+
+EDO = {'metodo': 'rk4', 'x0': 0, 'y0': 1, 'xf': 1, 'n': 10, 'f_expr': '-2*y'}
+SISTEMA = {'metodo': 'rk4', 'x0': 0, 'y0': [1, 0], 'xf': 1, 'n': 8, 'functions': ['y2', '-y1']}
+LOTE = {'metodo': 'rk4', 'x0': 0, 'y0': [1, 2, 3], 'xf': 1, 'n': 5, 'f_expr': '-y'}
+
+
+@pytest.fixture
+def cliente():
+    aplicacion.app.config['TESTING'] = True
+    return aplicacion.app.test_client()
+
+
+def _json(cliente, url, datos):
+    respuesta = cliente.post(url, json=datos, headers={'Accept': 'application/json'})
+    assert respuesta.status_code == 200 and respuesta.mimetype == 'application/json'
+    return respuesta.get_json()
+
+
+def _leer_columnas(cuerpo: bytes):
+    """Decodifica application/octet-stream: uint32 + encabezado JSON + columnas <f8"""
+    (longitud,) = struct.unpack('<I', cuerpo[:4])
+    assert (4 + longitud) % 8 == 0
+    encabezado = json.loads(cuerpo[4:4 + longitud])
+    assert encabezado['dtype'] == '<f8'
+    datos = np.frombuffer(cuerpo[4 + longitud:], dtype='<f8')
+    assert datos.size == len(encabezado['columnas']) * encabezado['filas']
+    return encabezado, dict(zip(encabezado['columnas'], datos.reshape(len(encabezado['columnas']), -1)))
+
+
+class TestFormatosBinarios:
+    """Tests de la negociación de formatos de /api/ecuaciones-diferenciales"""
+
+    def test_json_predeterminado(self, cliente):
+        """TEST: Sin Accept o con */* la respuesta sigue siendo JSON"""
+        for cabeceras in ({}, {'Accept': '*/*'}):
+            respuesta = cliente.post('/api/ecuaciones-diferenciales', json=EDO, headers=cabeceras)
+            assert respuesta.status_code == 200
+            assert respuesta.mimetype == 'application/json'
+            assert len(respuesta.get_json()['x_valores']) == 11
+
+    def test_octet_stream(self, cliente):
+        """TEST: Columnas float64 con encabezado JSON alineado a 8 bytes"""
+        esperado = _json(cliente, '/api/ecuaciones-diferenciales', EDO)
+        respuesta = cliente.post('/api/ecuaciones-diferenciales', json=EDO,
+                                 headers={'Accept': 'application/octet-stream'})
+        assert respuesta.status_code == 200 and respuesta.mimetype == 'application/octet-stream'
+
+        encabezado, columnas = _leer_columnas(respuesta.data)
+        assert encabezado['columnas'] == ['x', 'y'] and encabezado['filas'] == 11
+        assert encabezado['detalles'] == esperado['detalles']
+        assert np.array_equal(columnas['x'], esperado['x_valores'])
+        assert np.array_equal(columnas['y'], esperado['y_valores'][0])
+
+    def test_octet_stream_sistema_y_lote(self, cliente):
+        """TEST: Sistemas (x, y1, y2, ...) y lotes (x, t1, t2, ...)"""
+        esperado = _json(cliente, '/api/ecuaciones-diferenciales', SISTEMA)
+        respuesta = cliente.post('/api/ecuaciones-diferenciales', json=SISTEMA,
+                                 headers={'Accept': 'application/octet-stream'})
+        encabezado, columnas = _leer_columnas(respuesta.data)
+        assert encabezado['columnas'] == ['x', 'y1', 'y2']
+        assert np.array_equal(columnas['y1'], esperado['y_valores'][0])
+        assert np.array_equal(columnas['y2'], esperado['y_valores'][1])
+
+        esperado = _json(cliente, '/api/ecuaciones-diferenciales/lote', LOTE)
+        respuesta = cliente.post('/api/ecuaciones-diferenciales/lote', json=LOTE,
+                                 headers={'Accept': 'application/octet-stream'})
+        encabezado, columnas = _leer_columnas(respuesta.data)
+        assert encabezado['columnas'] == ['x', 't1', 't2', 't3']
+        for k, trayectoria in enumerate(esperado['trayectorias']):
+            assert np.array_equal(columnas[f't{k + 1}'], trayectoria)
+
+    def test_npz(self, cliente):
+        """TEST: Archivo .npz con la matriz, los nombres y los detalles en el cuerpo"""
+        esperado = _json(cliente, '/api/ecuaciones-diferenciales', EDO)
+        respuesta = cliente.post('/api/ecuaciones-diferenciales', json=EDO,
+                                 headers={'Accept': 'application/x-npz'})
+        assert respuesta.status_code == 200 and respuesta.mimetype == 'application/x-npz'
+        assert 'X-Detalles' not in respuesta.headers
+
+        with np.load(io.BytesIO(respuesta.data), allow_pickle=False) as archivo:
+            matriz = archivo['datos']
+            assert matriz.dtype == np.dtype('<f8') and matriz.shape == (2, 11)
+            assert archivo['columnas'].tolist() == ['x', 'y']
+            assert json.loads(archivo['detalles'].tobytes()) == esperado['detalles']
+        assert np.array_equal(matriz[0], esperado['x_valores'])
+        assert np.array_equal(matriz[1], esperado['y_valores'][0])
+
+    def test_detalles_grandes_fuera_de_cabeceras(self, cliente):
+        """TEST: Los detalles extensos (errores locales de RKF) no inflan las cabeceras"""
+        datos = dict(EDO, metodo='rkf', n=5000)
+        for tipo in ('application/x-npz', 'application/octet-stream'):
+            respuesta = cliente.post('/api/ecuaciones-diferenciales', json=datos, headers={'Accept': tipo})
+            assert respuesta.status_code == 200 and respuesta.mimetype == tipo
+            assert sum(len(k) + len(v) for k, v in respuesta.headers.items()) < 1024
+
+    def test_json_sigue_con_listas(self, cliente):
+        """TEST: Fuera de un formato binario los integradores devuelven listas"""
+        for datos in (dict(EDO, metodo='adams_m'), dict(SISTEMA, metodo='bdf')):
+            resultado = _json(cliente, '/api/ecuaciones-diferenciales', datos)
+            assert len(resultado['x_valores']) == datos['n'] + 1
+
+    def test_msgpack(self, cliente):
+        """TEST: Mapa MessagePack con cada columna como bytes"""
+        msgpack = pytest.importorskip('msgpack')
+        esperado = _json(cliente, '/api/ecuaciones-diferenciales', EDO)
+        respuesta = cliente.post('/api/ecuaciones-diferenciales', json=EDO,
+                                 headers={'Accept': 'application/msgpack'})
+        assert respuesta.status_code == 200 and respuesta.mimetype == 'application/msgpack'
+
+        mapa = msgpack.unpackb(respuesta.data, raw=False)
+        assert mapa['filas'] == 11 and mapa['detalles'] == esperado['detalles']
+        assert np.array_equal(np.frombuffer(mapa['columnas']['x'], dtype='<f8'), esperado['x_valores'])
+        assert np.array_equal(np.frombuffer(mapa['columnas']['y'], dtype='<f8'), esperado['y_valores'][0])
+
+    def test_msgpack_no_instalado(self, cliente, monkeypatch):
+        """TEST: Sin msgpack se responde con el siguiente formato aceptado"""
+        monkeypatch.setattr(aplicacion, 'msgpack', None)
+        respuesta = cliente.post('/api/ecuaciones-diferenciales', json=EDO,
+                                 headers={'Accept': 'application/msgpack, application/json;q=0.5'})
+        assert respuesta.status_code == 200 and respuesta.mimetype == 'application/json'
+
+        respuesta = cliente.post('/api/ecuaciones-diferenciales', json=EDO,
+                                 headers={'Accept': 'application/msgpack, application/octet-stream;q=0.5'})
+        assert respuesta.mimetype == 'application/octet-stream'
+
+
+class TestMuestreoSalida:
+    """Tests de la opción salida en /api/ecuaciones-diferenciales"""
+
+    def test_salida_en_todos_los_metodos_de_paso_fijo(self, cliente):
+        """TEST: salida reduce la respuesta también en Adams, BDF, simplécticos y RKF"""
+        casos = [
+            dict(EDO, metodo='adams_b', n=1000),
+            dict(EDO, metodo='adams_m', n=1000),
+            dict(EDO, metodo='bdf', n=1000, orden=3),
+            dict(EDO, metodo='rkf', n=1000),
+            dict(SISTEMA, metodo='verlet', n=1000),
+            dict(SISTEMA, metodo='adams_m', n=1000),
+            dict(SISTEMA, metodo='bdf', n=1000),
+        ]
+        for datos in casos:
+            datos['salida'] = {'muestras': 5}
+            resultado = _json(cliente, '/api/ecuaciones-diferenciales', datos)
+            assert len(resultado['x_valores']) == 5, datos['metodo']
+            assert resultado['detalles']['puntos_guardados'] == 5, datos['metodo']
+
+        datos = dict(EDO, metodo='rkf', tolerancia=1e-6, salida={'muestras': 5})
+        respuesta = cliente.post('/api/ecuaciones-diferenciales', json=datos)
+        assert respuesta.status_code == 400
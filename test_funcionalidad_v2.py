@@ -5,6 +5,8 @@ PRUEBAS UNITARIAS DE FUNCIONALIDAD
 Verifica que todos los métodos numéricos estén correctamente implementados
 """
 
+import warnings
+
 import pytest
 import numpy as np
 from metodos.metodos import (
@@ -12,8 +14,11 @@ from metodos.metodos import (
     EcuacionesDiferenciales, 
     Derivacion,
     SistemasLineales,
-    DiferenciasFinitas
+    DiferenciasFinitas,
+    ProblemasFrontera,
+    EcuacionesUnaVariable
 )
+from metodos.metodos import _CacheExpresiones, compilar_jacobiano
 
 
 class TestIntegracion:
@@ -168,6 +173,72 @@ class TestEcuacionesDiferenciales:
         assert resultado is not None
         assert y_vals[-1] > 0
     
+    def test_taylor_convergencia(self):
+        """TEST: Orden de convergencia de Taylor 2, 3 y 4 (derivadas totales fusionadas)"""
+        # dy/dx = x + y con y0 = 1  =>  y = 2*exp(x) - x - 1
+        esperado = 2 * np.exp(1) - 2
+        metodos = [
+            (2, EcuacionesDiferenciales.taylor_orden_2),
+            (3, EcuacionesDiferenciales.taylor_orden_3),
+            (4, EcuacionesDiferenciales.taylor_orden_4)
+        ]
+        
+        print("\n" + "="*70)
+        print("METODO: Taylor (orden observado)")
+        print("FUNCION: dy/dx = x + y, x en [0, 1], n=10 y n=20")
+        for orden, metodo in metodos:
+            e10 = abs(metodo(0, 1, 1, 10, "x + y")[1][-1] - esperado)
+            e20 = abs(metodo(0, 1, 1, 20, "x + y")[1][-1] - esperado)
+            observado = np.log2(e10 / e20)
+            print(f"Orden {orden}: error n=10 {e10:.3e}, n=20 {e20:.3e}, orden observado {observado:.2f}")
+        
+            assert abs(observado - orden) < 0.2
+        print("="*70)
+        
+        _, _, detalles = EcuacionesDiferenciales.taylor_orden_3(0, 1, 1, 10, "x + y")
+        assert detalles['ddf_expr'] == "x + y + 1"
+    
+    def test_taylor_serie(self):
+        """TEST: Taylor de orden alto por diferenciacion automatica"""
+        # dy/dx = y*cos(x) con y0 = 1  =>  y = exp(sin(x))
+        x_vals, y_vals, detalles = EcuacionesDiferenciales.taylor_serie(
+            0, 1, 10, 100, "y*cos(x)", tolerancia=1e-14
+        )
+        x = np.array(x_vals)
+        error = np.max(np.abs(np.array(y_vals) - np.exp(np.sin(x))))
+        
+        x_sis, y_sis, detalles_sis = EcuacionesDiferenciales.taylor_serie_sistema(
+            0, [1, 0], 20 * np.pi, 0, ["y2", "-y1"], tolerancia=1e-15, orden=25
+        )
+        
+        print("\n" + "="*70)
+        print("METODO: Taylor por diferenciacion automatica")
+        print("FUNCION: dy/dx = y*cos(x), tolerancia=1e-14")
+        print(f"Orden: {detalles['orden']}, pasos: {detalles['pasos']}")
+        print(f"ERROR maximo en la salida densa: {error:.3e}")
+        print(f"Oscilador armonico, orden 25: {detalles_sis['pasos']} pasos hasta x=20*pi")
+        print("="*70)
+        
+        assert detalles['orden'] >= 15
+        assert detalles['pasos'] < 50
+        assert error < 1e-12
+        assert abs(y_sis[0][-1] - 1) < 1e-12 and abs(y_sis[1][-1]) < 1e-12
+        
+        # y' = y crece hasta e^10: eps = tol*max(1, |y|) crece y el orden baja por el camino
+        _, y_exp, det_exp = EcuacionesDiferenciales.taylor_serie(0, 1, 10, 0, "y", tolerancia=1e-12)
+        assert det_exp['orden'] == 15 and det_exp['orden_min'] < det_exp['orden']
+        assert abs(y_exp[-1] / np.exp(10) - 1) < 1e-10
+        _, _, det_fijo = EcuacionesDiferenciales.taylor_serie(0, 1, 10, 0, "y", tolerancia=1e-12, orden=15)
+        assert det_fijo['orden'] == det_fijo['orden_min'] == 15
+        
+        # Potencias negativas: y' = x/y con y0 = 1  =>  y = sqrt(x**2 + 1)
+        x_cociente, y_cociente, _ = EcuacionesDiferenciales.taylor_serie(0, 1, 1, 4, "x/y")
+        assert np.max(np.abs(np.array(y_cociente) - np.sqrt(np.array(x_cociente)**2 + 1))) < 1e-11
+        _, y_inversa, _ = EcuacionesDiferenciales.taylor_serie(0, 1, 1, 4, "y**(-2)")
+        assert abs(y_inversa[-1] - 4 ** (1 / 3)) < 1e-11
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.taylor_serie(0, 1, 1, 0, "Abs(y)")
+    
     def test_runge_kutta_3(self):
         """TEST: Runge-Kutta Orden 3"""
         x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_3(0, 1, 1, 20, "-y")
@@ -222,6 +293,596 @@ class TestEcuacionesDiferenciales:
         
         assert abs(resultado - esperado) < 0.001
 
+    def test_runge_kutta_fehlberg_adaptativo(self):
+        """TEST: Runge-Kutta-Fehlberg con control de paso adaptativo"""
+        x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_fehlberg(
+            0, 1, 10, 1, "-y + sin(x)", tolerancia=1e-8
+        )
+        esperado = 1.5 * np.exp(-10) + 0.5 * (np.sin(10) - np.cos(10))
+        error = abs(y_vals[-1] - esperado)
+        
+        print("\n" + "="*70)
+        print("METODO: Runge-Kutta-Fehlberg (Adaptativo)")
+        print("FUNCION: dy/dx = -y + sin(x), tolerancia=1e-8")
+        print(f"Pasos aceptados: {detalles['pasos_aceptados']}, rechazados: {detalles['pasos_rechazados']}")
+        print(f"Evaluaciones: {detalles['evaluaciones']}")
+        print(f"ERROR en x=10: {error:.3e}")
+        print("="*70)
+        
+        assert x_vals[-1] == 10
+        assert error < 1e-6
+        assert len(detalles['errores_locales']) == detalles['pasos_aceptados']
+        assert detalles['evaluaciones'] == 6 * (detalles['pasos_aceptados'] + detalles['pasos_rechazados'])
+    
+    def test_dormand_prince(self):
+        """TEST: Dormand-Prince 5(4) con salida densa"""
+        x_vals, y_vals, detalles = EcuacionesDiferenciales.dormand_prince(
+            0, 1, 10, 1000, "-y + sin(x)", tolerancia=1e-8
+        )
+        x = np.array(x_vals)
+        esperado = 1.5 * np.exp(-x) + 0.5 * (np.sin(x) - np.cos(x))
+        error = np.max(np.abs(np.array(y_vals) - esperado))
+        
+        x_sis, y_sis, detalles_sis = EcuacionesDiferenciales.dormand_prince_sistema(
+            0, [1, 0], 2 * np.pi, 0, ["y2", "-y1"], tolerancia=1e-9
+        )
+        
+        print("\n" + "="*70)
+        print("METODO: Dormand-Prince 5(4)")
+        print("FUNCION: dy/dx = -y + sin(x), tolerancia=1e-8, 1001 puntos de salida")
+        print(f"Pasos aceptados: {detalles['pasos_aceptados']}, evaluaciones: {detalles['evaluaciones']}")
+        print(f"ERROR maximo en la salida densa: {error:.3e}")
+        print("="*70)
+        
+        assert len(x_vals) == 1001
+        assert x_vals[-1] == 10
+        assert detalles['pasos_aceptados'] < 1000
+        assert error < 1e-6
+        # FSAL: 6 evaluaciones por paso intentado más las 2 del arranque
+        assert detalles_sis['evaluaciones'] == 6 * (detalles_sis['pasos_aceptados'] + detalles_sis['pasos_rechazados']) + 2
+        assert abs(y_sis[0][-1] - 1) < 1e-7 and abs(y_sis[1][-1]) < 1e-7
+    
+    def test_expresion_compilada(self):
+        """TEST: Expresiones con funciones y valores negativos de y"""
+        # dy/dx = -y**2 con y0 = -1  =>  y = 1 / (x - 1)
+        _, y_vals, _ = EcuacionesDiferenciales.runge_kutta_4(0, -1, 0.5, 50, "-y**2")
+        esperado = 1 / (0.5 - 1)
+
+        # dy/dx = exp(x) con y0 = 1  =>  y = exp(x)
+        _, y_adams, _ = EcuacionesDiferenciales.adams_moulton(0, 1, 1, 40, "exp(x)")
+
+        print("\n" + "="*70)
+        print("METODO: Runge-Kutta 4 / Adams-Moulton (expresion compilada)")
+        print(f"RK4 dy/dx = -y**2 en x=0.5: {y_vals[-1]:.10f} (esperado {esperado:.10f})")
+        print(f"Adams-Moulton dy/dx = exp(x) en x=1: {y_adams[-1]:.10f} (esperado {np.e:.10f})")
+        print("="*70)
+
+        assert abs(y_vals[-1] - esperado) < 1e-6
+        assert abs(y_adams[-1] - np.e) < 1e-6
+
+    def test_rk4_sistema_vectorizado(self):
+        """TEST: Runge-Kutta 4 para un sistema grande (cadena de 50 osciladores)"""
+        m = 50
+        # Pares (posición, velocidad): dq/dx = v, dv/dx = -q
+        f_exprs = []
+        for i in range(1, m + 1, 2):
+            f_exprs += [f"y{i + 1}", f"-y{i}"]
+        y0 = [1.0 if i % 2 == 0 else 0.0 for i in range(m)]
+        
+        x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4_sistema(0, y0, np.pi, 200, f_exprs)
+        error = max(abs(y_vals[i][-1] + 1.0) for i in range(0, m, 2))
+        
+        print("\n" + "="*70)
+        print("METODO: Runge-Kutta 4 (Sistema vectorizado)")
+        print(f"Ecuaciones: {m}, pasos: {detalles['n']}")
+        print(f"Error maximo en x=pi (q = cos(x) = -1): {error:.3e}")
+        print("="*70)
+        
+        assert len(y_vals) == m
+        assert len(y_vals[0]) == 201
+        assert error < 1e-8
+
+    def test_sistemas_rigidos(self):
+        """TEST: BDF y Rosenbrock en el problema rígido de Robertson"""
+        f_exprs = [
+            "-0.04*y1 + 1e4*y2*y3",
+            "0.04*y1 - 1e4*y2*y3 - 3e7*y2**2",
+            "3e7*y2**2"
+        ]
+        referencia = [0.7158270687, 9.185534765e-6, 0.2841637458]
+        
+        _, y_bdf, detalles_bdf = EcuacionesDiferenciales.bdf_sistema(0, [1, 0, 0], 40, 400, f_exprs, orden=3)
+        _, y_ros, detalles_ros = EcuacionesDiferenciales.rosenbrock_sistema(
+            0, [1, 0, 0], 40, 0, f_exprs, tolerancia=1e-6
+        )
+        error_bdf = max(abs(y_bdf[i][-1] - referencia[i]) for i in range(3))
+        error_ros = max(abs(y_ros[i][-1] - referencia[i]) for i in range(3))
+        
+        print("\n" + "="*70)
+        print("METODO: BDF orden 3 / Rosenbrock 2(3) (Robertson, x en [0, 40])")
+        print(f"BDF: 400 pasos, {detalles_bdf['factorizaciones_lu']} factorizaciones LU, error {error_bdf:.3e}")
+        print(f"Rosenbrock: {detalles_ros['pasos_aceptados']} pasos aceptados, error {error_ros:.3e}")
+        print("="*70)
+        
+        assert error_bdf < 1e-4
+        assert detalles_bdf['factorizaciones_lu'] < 100
+        assert error_ros < 1e-5
+        assert detalles_ros['pasos_aceptados'] < 500
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.bdf_sistema(0, [1, 0, 0], 40, 10, f_exprs, orden=6)
+        # El arranque no degrada el orden: BDF4 converge como O(h^4)
+        e100 = abs(EcuacionesDiferenciales.bdf_sistema(0, [1], 1, 100, ["y"], 4)[1][0][-1] - np.e)
+        e200 = abs(EcuacionesDiferenciales.bdf_sistema(0, [1], 1, 200, ["y"], 4)[1][0][-1] - np.e)
+        assert e100 < 1e-8 and abs(np.log2(e100 / e200) - 4) < 0.2
+    
+    def test_jacobiano_sistema(self):
+        """TEST: Jacobiano simbolico compilado, patron de dispersion y cache"""
+        f_exprs = ["y2", "-sin(y1) + x*y2"]
+        J = compilar_jacobiano(f_exprs)
+        matriz = J(1.0, np.array([0.5, 2.0]))
+        esperado = np.array([[0.0, 1.0], [-np.cos(0.5), 1.0]])
+        
+        # Cadena de 60 ecuaciones acopladas solo con sus vecinas (tridiagonal)
+        m = 60
+        cadena = [f"y{i - 1} - 2*y{i} + y{i + 1}" for i in range(2, m)]
+        cadena = ["-2*y1 + y2"] + cadena + [f"y{m - 1} - 2*y{m}"]
+        J_cadena = compilar_jacobiano(cadena)
+        Y = np.linspace(0, 1, m)
+        
+        _, detalles = EcuacionesDiferenciales.jacobiano(["y2", "-1000*y1 - 1001*y2"], 0, [1, 0])
+        
+        print("\n" + "="*70)
+        print("METODO: Jacobiano simbolico compilado")
+        print(f"J(1, [0.5, 2]) = {matriz.tolist()}")
+        print(f"Cadena de {m} ecuaciones: densidad {J_cadena.densidad:.3f}")
+        print(f"Razon de rigidez de y'' + 1001y' + 1000y = 0: {detalles['razon_rigidez']:.1f}")
+        print("="*70)
+        
+        assert np.allclose(matriz, esperado)
+        assert np.allclose(J.derivada_x(1.0, [0.5, 2.0]), [0.0, 2.0])
+        assert compilar_jacobiano(["y2", "-sin(y1)+x*y2"]) is J
+        assert J_cadena.patron.sum() == 3 * m - 2
+        assert J_cadena.conviene_dispersa
+        assert np.allclose(J_cadena.dispersa(0, Y).toarray(), J_cadena(0, Y))
+        assert abs(detalles['razon_rigidez'] - 1000) < 1e-6
+    
+    def test_eventos(self):
+        """TEST: Deteccion de eventos y terminacion anticipada"""
+        # Tiro vertical: y1 altura, y2 velocidad; cae al suelo en x = 2*v0/g
+        x_vals, y_vals, detalles = EcuacionesDiferenciales.runge_kutta_4_sistema(
+            0, [0, 20], 10, 100, ["y2", "-9.81"],
+            eventos=[{"expr": "y1", "terminal": True, "direccion": -1}, "y2"]
+        )
+        suelo = 2 * 20 / 9.81
+        
+        _, _, detalles_rk4 = EcuacionesDiferenciales.runge_kutta_4(
+            0, 0, 10, 50, "cos(x)", eventos=[{"expr": "y", "direccion": 1}]
+        )
+        
+        print("\n" + "="*70)
+        print("METODO: Runge-Kutta 4 con eventos")
+        print(f"Altura maxima en x={detalles['eventos'][0]['x']:.10f} (esperado {suelo / 2:.10f})")
+        print(f"Llega al suelo en x={x_vals[-1]:.10f} (esperado {suelo:.10f})")
+        print("="*70)
+        
+        assert detalles['terminado_por_evento']
+        assert [e['evento'] for e in detalles['eventos']] == [1, 0]
+        assert abs(detalles['eventos'][0]['x'] - suelo / 2) < 1e-10
+        assert abs(x_vals[-1] - suelo) < 1e-10
+        assert abs(y_vals[0][-1]) < 1e-10
+        assert len(x_vals) == 42
+        # y = sin(x) cruza cero hacia arriba solo en 2*pi dentro de (0, 10]
+        assert [round(e['x'], 6) for e in detalles_rk4['eventos']] == [round(2 * np.pi, 6)]
+        assert not detalles_rk4['terminado_por_evento']
+    
+    def test_generar_pasos(self):
+        """TEST: Integracion como generador con checkpoints"""
+        pasos = EcuacionesDiferenciales.generar_pasos('rk4', 0, 1, 1, 1000, "-y", cada=300)
+        puntos = list(pasos)
+        
+        _, y_rk4, _ = EcuacionesDiferenciales.runge_kutta_4(0, 1, 1, 1000, "-y")
+        sistema = list(EcuacionesDiferenciales.generar_pasos('euler', 0, [1, 0], 1, 10, ["y2", "-y1"]))
+        
+        print("\n" + "="*70)
+        print("METODO: Generador de pasos (rk4, n=1000, cada=300)")
+        print(f"Puntos entregados: {[round(x, 3) for x, _ in puntos]}")
+        print("="*70)
+        
+        assert [round(x, 10) for x, _ in puntos] == [0, 0.3, 0.6, 0.9, 1.0]
+        assert abs(puntos[-1][1] - y_rk4[-1]) < 1e-14
+        assert len(sistema) == 11 and len(sistema[-1][1]) == 2
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.generar_pasos('rk4', 0, 1, 1, 10, "-y", cada=0)
+    
+    def test_adams_orden_sistema(self):
+        """TEST: Adams-Bashforth/Moulton de orden variable para sistemas"""
+        errores = {}
+        for orden in (1, 2, 3, 4, 5):
+            e = []
+            for n in (50, 100):
+                _, y, detalles = EcuacionesDiferenciales.adams_moulton_sistema(
+                    0, [0, 1], 2, n, ["y2", "-y1"], orden=orden
+                )
+                e.append(abs(y[0][-1] - np.sin(2)))
+            errores[orden] = np.log2(e[0] / e[1])
+        _, y_ab, _ = EcuacionesDiferenciales.adams_bashforth_sistema(0, [0, 1], 2, 200, ["y2", "-y1"], orden=6)
+        
+        print("\n" + "="*70)
+        print("METODO: Adams-Moulton (Sistema)")
+        print(f"Orden observado: {[round(v, 2) for v in errores.values()]}")
+        print("="*70)
+        
+        for orden, observado in errores.items():
+            assert abs(observado - orden) < 0.3
+        assert detalles['pasos_sin_convergencia'] == 0
+        assert abs(y_ab[0][-1] - np.sin(2)) < 1e-9
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.adams_bashforth(0, 1, 1, 3, "-y", orden=4)
+    
+    def test_barrido_parametros(self):
+        """TEST: Barrido de parámetros en un pool de procesos"""
+        k = [0.5, 1.0, 2.0]
+        resultados, detalles = EcuacionesDiferenciales.barrido_parametros(
+            'rk4', "-k*y", 0, 1, 1, 100, {'k': k, 'y0': [1, 3]}, procesos=2
+        )
+        finales = [r['y_valores'][-1] for r in resultados]
+        esperado = [y0 * np.exp(-kk) for kk in k for y0 in (1, 3)]
+        
+        print("\n" + "="*70)
+        print("METODO: Barrido de parámetros (rk4)")
+        print(f"Tareas: {detalles['num_tareas']}, procesos: {detalles['procesos']}")
+        print("="*70)
+        
+        assert detalles['num_tareas'] == 6 and detalles['errores'] == 0
+        assert [r['parametros'] for r in resultados][:2] == [{'k': 0.5, 'y0': 1}, {'k': 0.5, 'y0': 3}]
+        assert np.max(np.abs(np.array(finales) - esperado)) < 1e-8
+        assert all(r['tiempo'] >= 0 for r in resultados)
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.barrido_parametros('rk4', "-k*y", 0, 1, 1, 10, {'y': [1]})
+    
+    def test_simplecticos(self):
+        """TEST: Integradores simplécticos con energía acotada en horizontes largos"""
+        energia = "(y1**2 + y2**2)/2"
+        _, y_sim, detalles = EcuacionesDiferenciales.simplectico_sistema(
+            0, [1, 0], 10000, 20000, ["y2", "-y1"], 'yoshida4', energia
+        )
+        _, y_rk4, _ = EcuacionesDiferenciales.runge_kutta_4_sistema(0, [1, 0], 10000, 20000, ["y2", "-y1"])
+        deriva_rk4 = abs((y_rk4[0][-1]**2 + y_rk4[1][-1]**2) / 2 - 0.5)
+        
+        ordenes = {}
+        for metodo in ('verlet', 'yoshida4', 'yoshida6'):
+            e = [abs(EcuacionesDiferenciales.simplectico_sistema(0, [0, 1], 5, n, ["y2", "-y1"], metodo)[1][0][-1]
+                     - np.sin(5)) for n in (100, 200)]
+            ordenes[metodo] = np.log2(e[0] / e[1])
+        
+        print("\n" + "="*70)
+        print("METODO: Yoshida 4 (oscilador armónico, x = 0..10000, h = 0.5)")
+        print(f"Deriva de energía: Yoshida4 {detalles['deriva_energia_max']:.2e}, RK4 {deriva_rk4:.2e}")
+        print(f"Orden observado: {ordenes}")
+        print("="*70)
+        
+        assert detalles['deriva_energia_max'] < 5e-3
+        assert deriva_rk4 > 0.1
+        assert abs(ordenes['verlet'] - 2) < 0.1 and abs(ordenes['yoshida4'] - 4) < 0.1
+        assert abs(ordenes['yoshida6'] - 6) < 0.2
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.simplectico_sistema(0, [0, 1], 5, 10, ["y1", "-y1"])
+    
+    def test_bulirsch_stoer(self):
+        """TEST: Bulirsch-Stoer alcanza 1e-12 con pocas evaluaciones"""
+        x, y, detalles = EcuacionesDiferenciales.bulirsch_stoer_sistema(
+            0, [0, 1], 10, 0, ["y2", "-y1"], tolerancia=1e-13
+        )
+        error_bs = np.max(np.abs(np.array(y[0]) - np.sin(x)))
+        _, y_rk4, _ = EcuacionesDiferenciales.runge_kutta_4_sistema(0, [0, 1], 10, 4000, ["y2", "-y1"])
+        error_rk4 = abs(y_rk4[0][-1] - np.sin(10))
+        _, y_esc, _ = EcuacionesDiferenciales.bulirsch_stoer(0, 1, 2, 0, "-y + sin(x)", 1e-12)
+        esperado = 0.5 * (np.sin(2) - np.cos(2)) + 1.5 * np.exp(-2)
+        
+        print("\n" + "="*70)
+        print("METODO: Bulirsch-Stoer (oscilador, x = 0..10)")
+        print(f"Error: {error_bs:.2e} con {detalles['evaluaciones']} evaluaciones "
+              f"(RK4: {error_rk4:.2e} con 16000)")
+        print("="*70)
+        
+        assert error_bs < 1e-12 and error_bs < error_rk4
+        assert detalles['evaluaciones'] < 0.15 * 16000
+        assert abs(y_esc[-1] - esperado) < 1e-11
+        # La tabla de trabajo por paso no divide entre el paso nulo de la fila 0
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            _, y_grueso, _ = EcuacionesDiferenciales.bulirsch_stoer(0, 1, 1, 4, "y", 1e-2)
+        assert abs(y_grueso[-1] - np.e) < 1e-3
+    
+    def test_retardo(self):
+        """TEST: Ecuaciones con retardo e historia acotada"""
+        # y' = -y(x - 1), phi = 1: y = 1 - x en [0, 1] y 1 - x + (x - 1)^2/2 en [1, 2]
+        x, y, detalles = EcuacionesDiferenciales.retardo(0, 1, 2, 200, "-y(x - 1)")
+        x = np.array(x)
+        exacta = np.where(x <= 1, 1 - x, 1 - x + (x - 1)**2 / 2)
+        error = np.max(np.abs(np.array(y) - exacta))
+        
+        # y' = e*y(x - 1) con phi = exp(x) tiene solución exp(x)
+        _, y_exp, _ = EcuacionesDiferenciales.retardo(0, 1, 3, 600, "E*y(x - 1)", historia="exp(x)")
+        _, y_largo, det_largo = EcuacionesDiferenciales.retardo_sistema(
+            0, [1.2], 1000, 10000, ["0.2*y(x - 17)/(1 + y(x - 17)**10) - 0.1*y"], salida={'muestras': 100}
+        )
+        
+        print("\n" + "="*70)
+        print("METODO: RK4 con retardo")
+        print(f"Error y' = -y(x-1): {error:.2e}; y' = e*y(x-1): {abs(y_exp[-1] - np.exp(3)):.2e}")
+        print(f"Mackey-Glass: {det_largo['nodos_en_historia']} nodos en historia para 10000 pasos")
+        print("="*70)
+        
+        assert error < 1e-12
+        assert abs(y_exp[-1] - np.exp(3)) < 1e-9
+        assert det_largo['nodos_en_historia'] < 200 and len(y_largo[0]) == 100
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.retardo(0, 1, 1, 10, "-y(x - 0.01)")
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.retardo(0, 1, 1, 10, "-y(x - __import__('os').getpid()*0 - 1)")
+    
+    def test_muestreo_salida(self):
+        """TEST: Salida diezmada e interpolada sin cambiar la integración"""
+        x_todo, y_todo, _ = EcuacionesDiferenciales.runge_kutta_4(0, 1, 1, 10000, "-y")
+        x_m, y_m, detalles = EcuacionesDiferenciales.runge_kutta_4(0, 1, 1, 10000, "-y", salida={'muestras': 5})
+        x_c, _, _ = EcuacionesDiferenciales.euler(0, 1, 1, 10, "-y", salida={'cada': 4})
+        x_p, y_p, _ = EcuacionesDiferenciales.runge_kutta_4_sistema(
+            0, [0, 1], 2, 200, ["y2", "-y1"], salida={'x_salida': [1.234, 0.5]}
+        )
+        
+        print("\n" + "="*70)
+        print("METODO: Runge-Kutta 4 (muestreo de la salida)")
+        print(f"Puntos guardados: {detalles['puntos_guardados']} de {len(x_todo)}")
+        print("="*70)
+        
+        assert [round(x, 10) for x in x_m] == [0, 0.25, 0.5, 0.75, 1.0]
+        assert y_m[-1] == y_todo[-1]
+        assert [round(x, 10) for x in x_c] == [0, 0.4, 0.8, 1.0]
+        assert x_p == [0.5, 1.234]
+        assert abs(y_p[0][1] - np.sin(1.234)) < 1e-8
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.euler(0, 1, 1, 10, "-y", salida={'x_salida': [2.0]})
+        
+        # Multipaso, implícitos, simplécticos y RKF de paso fijo con la misma salida
+        muestras = {'muestras': 5}
+        metodos = {
+            'rkf': lambda s: EcuacionesDiferenciales.runge_kutta_fehlberg(0, 1, 1, 1000, "-y", salida=s),
+            'adams_b': lambda s: EcuacionesDiferenciales.adams_bashforth(0, 1, 1, 1000, "-y", salida=s),
+            'adams_m': lambda s: EcuacionesDiferenciales.adams_moulton(0, 1, 1, 1000, "-y", salida=s),
+            'adams_m_sistema': lambda s: EcuacionesDiferenciales.adams_moulton_sistema(
+                0, [1], 1, 1000, ["-y1"], salida=s),
+            'bdf': lambda s: EcuacionesDiferenciales.bdf_sistema(0, [1], 1, 1000, ["-y1"], 3, salida=s),
+            'verlet': lambda s: EcuacionesDiferenciales.simplectico_sistema(
+                0, [1, 0], 1, 1000, ["y2", "-y1"], salida=s),
+        }
+        for nombre, metodo in metodos.items():
+            x_todo, y_todo, _ = metodo(None)
+            x_m, y_m, detalles = metodo(muestras)
+            assert [round(x, 10) for x in x_m] == [0, 0.25, 0.5, 0.75, 1.0], nombre
+            assert detalles['puntos_guardados'] == 5 and len(x_todo) == 1001, nombre
+            assert np.atleast_2d(y_m)[0][-1] == np.atleast_2d(y_todo)[0][-1], nombre
+        with pytest.raises(ValueError):
+            EcuacionesDiferenciales.runge_kutta_fehlberg(0, 1, 1, 10, "-y", 1e-6, salida=muestras)
+    
+    def test_resolver_lote(self):
+        """TEST: Lote de condiciones iniciales y parámetros en una sola integración"""
+        y0 = np.linspace(0.5, 2.0, 7)
+        p = np.linspace(0.5, 1.5, 7)
+        x_vals, trayectorias, detalles = EcuacionesDiferenciales.resolver_lote(
+            'rk4', 0, y0.tolist(), 1, 50, "-p*y", parametros=p.tolist()
+        )
+        finales = np.array([t[-1] for t in trayectorias])
+        esperado = y0 * np.exp(-p)
+        
+        # Sistema: matriz (k, m) de condiciones iniciales
+        _, tray_sis, _ = EcuacionesDiferenciales.resolver_lote(
+            'rk4', 0, [[1, 0], [2, 0], [3, 0]], np.pi, 200, ['y2', '-y1']
+        )
+        
+        print("\n" + "="*70)
+        print("METODO: Runge-Kutta 4 (Lote)")
+        print(f"Trayectorias: {detalles['num_trayectorias']}")
+        print(f"Error maximo: {np.max(np.abs(finales - esperado)):.3e}")
+        print("="*70)
+        
+        assert len(trayectorias) == 7
+        assert np.max(np.abs(finales - esperado)) < 1e-6
+        assert np.allclose([t[0][-1] for t in tray_sis], [-1, -2, -3], atol=1e-6)
+
+
+class TestProblemasFrontera:
+    """Tests para problemas de valor en la frontera"""
+    
+    def test_disparo_y_diferencias_finitas(self):
+        """TEST: y'' = (32 + 2x^3 - y y')/8, y(1) = 17, y(3) = 43/3"""
+        f = "(32 + 2*x**3 - y1*y2)/8"
+        x_d, y_d, det_d = ProblemasFrontera.disparo(1, 3, 17, 43/3, 200, f)
+        x_f, y_f, det_f = ProblemasFrontera.diferencias_finitas(1, 3, 17, 43/3, 2000, f)
+        exacta = lambda x: np.asarray(x)**2 + 16 / np.asarray(x)
+        error_d = np.max(np.abs(np.array(y_d) - exacta(x_d)))
+        error_f = np.max(np.abs(np.array(y_f) - exacta(x_f)))
+        
+        print("\n" + "="*70)
+        print("METODO: Disparo y diferencias finitas (no lineal)")
+        print(f"Disparo: error {error_d:.2e} en {det_d['disparos']} disparos")
+        print(f"Diferencias finitas: error {error_f:.2e} en {det_f['iteraciones']} iteraciones de Newton")
+        print("="*70)
+        
+        assert error_d < 1e-8
+        assert error_f < 1e-6
+        assert det_f['iteraciones'] < 10
+        _, y_lineal, det_lineal = ProblemasFrontera.diferencias_finitas(0, np.pi / 2, 0, 1, 10, "-y")
+        assert det_lineal['iteraciones'] <= 2 and y_lineal[-1] == 1
+        # y'' = |y| con y >= 0 en [0, 1]  =>  y = sinh(x)/sinh(1)
+        x_abs, y_abs, _ = ProblemasFrontera.diferencias_finitas(0, 1, 0, 1, 100, "abs(y1)")
+        assert np.max(np.abs(np.array(y_abs) - np.sinh(x_abs) / np.sinh(1))) < 1e-5
+
+
+class TestEcuacionesUnaVariable:
+    """Tests para raíces de ecuaciones de una variable"""
+    
+    def test_todas_las_raices(self):
+        """TEST: Todas las raíces de sin(x) en un intervalo largo"""
+        raices, detalles = EcuacionesUnaVariable.todas_las_raices("sin(x)", 0.5, 500*np.pi + 0.5, 100000)
+        error = np.max(np.abs(np.array(raices) - np.pi * np.arange(1, 501)))
+        dobles, det_dobles = EcuacionesUnaVariable.todas_las_raices("(x - 1)**2*(x + 2)", -3, 3, 1001)
+        
+        print("\n" + "="*70)
+        print("METODO: Todas las raíces (malla + Illinois por lotes)")
+        print(f"Raíces de sin(x): {detalles['num_raices']}, error máximo {error:.2e}")
+        print(f"Pasadas de refinamiento: {detalles['pasadas_refinamiento']}")
+        print("="*70)
+        
+        assert len(raices) == 500 and error < 1e-10
+        assert detalles['pasadas_refinamiento'] < 10
+        assert len(dobles) == 2 and det_dobles['raices_dobles'] == 1
+        assert abs(dobles[0] + 2) < 1e-12 and abs(dobles[1] - 1) < 1e-6
+    
+    def test_funciones_compiladas(self):
+        """TEST: Los seis métodos con expresiones compiladas"""
+        raiz_ln2 = np.log(2)
+        resultados = {
+            'biseccion': EcuacionesUnaVariable.biseccion("exp(x) - 2", 0, 1, 1e-10)[0],
+            'falsa_posicion': EcuacionesUnaVariable.falsa_posicion("exp(x) - 2", 0, 1, 1e-10)[0],
+            'secante': EcuacionesUnaVariable.secante("exp(x) - 2", 0, 1, 1e-10)[0],
+            'newton_raphson': EcuacionesUnaVariable.newton_raphson("exp(x) - 2", "exp(x)", 1, 1e-10)[0],
+            'punto_fijo': EcuacionesUnaVariable.punto_fijo("x - (exp(x) - 2)/3", 1, 1e-10)[0],
+            'muller': EcuacionesUnaVariable.muller("exp(x) - 2", 0, 0.5, 1, 1e-10)[0],
+        }
+        
+        print("\n" + "="*70)
+        print("METODO: Raíces con expresiones compiladas")
+        for nombre, raiz in resultados.items():
+            print(f"{nombre}: {raiz:.12f}")
+        print("="*70)
+        
+        for raiz in resultados.values():
+            assert abs(raiz - raiz_ln2) < 1e-8
+        assert abs(EcuacionesUnaVariable.biseccion("log10(x) - 1", 1, 50, 1e-10)[0] - 10) < 1e-8
+        with pytest.raises(ValueError):
+            EcuacionesUnaVariable.secante("x**2 - y", 0, 1)
+
+    def test_expresiones_no_seguras(self):
+        """TEST: Las expresiones se validan antes de que sympy las evalúe"""
+        maliciosas = [
+            "__import__('os').getpid()*0 + x - 1",
+            "x.__class__",
+            "sin.__globals__",
+            "(1).real + x",
+            "__builtins__",
+            "x + __name__",
+            "[c for c in ()]",
+            "(lambda: 1)() + x",
+            "'1' + x",
+        ]
+        for expr in maliciosas:
+            with pytest.raises(ValueError):
+                EcuacionesUnaVariable.biseccion(expr, 0, 2)
+        assert abs(EcuacionesUnaVariable.biseccion("abs(x) - 1", 0, 2, 1e-10)[0] - 1) < 1e-8
+
+    def test_newton_derivada_automatica(self):
+        """TEST: Newton-Raphson con derivada simbólica automática"""
+        raiz, detalles = EcuacionesUnaVariable.newton_raphson("x**3 - 2*x - 5", None, 2.0, 1e-12)
+        raiz_manual, detalles_manual = EcuacionesUnaVariable.newton_raphson("x**3 - 2*x - 5", "3*x**2 - 2", 2.0, 1e-12)
+        
+        print("\n" + "="*70)
+        print("METODO: Newton-Raphson (derivada automática)")
+        print(f"f'(x) = {detalles['derivada']}, raíz {raiz:.15f}")
+        print(f"Iteraciones: {detalles['iteraciones']}, evaluaciones de (f, f'): {detalles['evaluaciones']}")
+        print("="*70)
+        
+        assert abs(raiz - 2.0945514815423265) < 1e-12
+        assert raiz == raiz_manual and detalles['iteraciones'] == detalles_manual['iteraciones']
+        # Una evaluación fusionada por iteración más la del punto inicial
+        assert detalles['evaluaciones'] == detalles['iteraciones'] + 1
+        # Derivada respecto a x real: d|x|/dx = sign(x)
+        raiz_abs, detalles_abs = EcuacionesUnaVariable.newton_raphson("abs(x) - 1", None, 2)
+        assert raiz_abs == 1 and detalles_abs['derivada'] == "sign(x)"
+        with pytest.raises(ValueError):
+            EcuacionesUnaVariable.newton_raphson("x + floor(x) - 1", None, 2)
+    
+    def test_metodos_hibridos(self):
+        """TEST: Brent, Illinois, Anderson-Björck y Newton-Bisección"""
+        f, a, b = "x**10 - 1", 0, 1.3
+        _, det_biseccion = EcuacionesUnaVariable.biseccion(f, a, b, 1e-12, 200)
+        _, det_falsa = EcuacionesUnaVariable.falsa_posicion(f, a, b, 1e-12, 200)
+        resultados = {
+            'brent': EcuacionesUnaVariable.brent(f, a, b, 1e-12),
+            'illinois': EcuacionesUnaVariable.illinois(f, a, b, 1e-12),
+            'anderson_bjorck': EcuacionesUnaVariable.illinois(f, a, b, 1e-12, variante='anderson_bjorck'),
+            'newton_biseccion': EcuacionesUnaVariable.newton_biseccion(f, a, b, None, 1e-12),
+        }
+        
+        print("\n" + "="*70)
+        print("METODO: Métodos híbridos con intervalo")
+        print(f"Bisección: {det_biseccion['iteraciones']} iteraciones, falsa posición: {det_falsa['iteraciones']}")
+        for nombre, (raiz, detalles) in resultados.items():
+            print(f"{nombre}: {raiz:.12f} en {detalles['iteraciones']} iteraciones")
+        print("="*70)
+        
+        for raiz, detalles in resultados.values():
+            assert abs(raiz - 1) < 1e-10
+            assert detalles['iteraciones'] < det_biseccion['iteraciones'] / 1.5
+        # Newton desde el punto medio saldría del intervalo; la salvaguarda lo evita
+        pasos = [h['paso'] for h in resultados['newton_biseccion'][1]['historial']]
+        assert 'biseccion' in pasos and pasos[-1] == 'newton'
+        # Raíz exacta con f' = 0 en el punto medio
+        raiz_triple, det_triple = EcuacionesUnaVariable.newton_biseccion("x**3", -1, 1)
+        assert raiz_triple == 0 and det_triple['iteraciones'] == 0
+        with pytest.raises(ValueError):
+            EcuacionesUnaVariable.brent(f, 2, 3)
+    
+    def test_raices_por_lotes(self):
+        """TEST: Newton, secante y bisección sobre miles de parámetros"""
+        p = np.linspace(1, 100, 5000)
+        r_newton, det_newton = EcuacionesUnaVariable.newton_lote("x**2 - p", 1.0, p)
+        r_secante, _ = EcuacionesUnaVariable.secante_lote("x**2 - p", 1.0, 2.0, p)
+        r_biseccion, det_biseccion = EcuacionesUnaVariable.biseccion_lote("x**2 - p", [0, 2], [3, 3], [4, 1])
+        
+        print("\n" + "="*70)
+        print("METODO: Newton-Raphson por lotes (5000 carriles)")
+        print(f"Iteraciones: min {min(det_newton['iteraciones'])}, max {max(det_newton['iteraciones'])}")
+        print("="*70)
+        
+        assert det_newton['convergidos'] == 5000
+        assert np.max(np.abs(np.array(r_newton) - np.sqrt(p))) < 1e-9
+        assert np.max(np.abs(np.array(r_secante) - np.sqrt(p))) < 1e-9
+        # Los carriles convergen en distinto número de iteraciones
+        assert min(det_newton['iteraciones']) < max(det_newton['iteraciones'])
+        # fx es el residuo en la raíz devuelta
+        assert np.allclose(det_newton['fx'], np.array(r_newton)**2 - p, rtol=0, atol=1e-15)
+        r_abs, det_abs = EcuacionesUnaVariable.newton_lote("abs(x) - 1", [2, -2])
+        assert r_abs == [1, -1] and det_abs['fx'] == [0, 0]
+        assert abs(r_biseccion[0] - 2) < 1e-9 and r_biseccion[1] is None
+        assert det_biseccion['sin_cambio_de_signo'] == [1]
+
+
+class TestCacheExpresiones:
+    """Tests para la caché de expresiones compiladas"""
+    
+    def test_cache_lru(self):
+        """TEST: Aciertos, fallos y desalojo de la caché LRU"""
+        cache = _CacheExpresiones(capacidad=2)
+        
+        _, f1 = cache.obtener("x + y", ('x', 'y'))
+        _, f2 = cache.obtener("x+y", ('x', 'y'))    # misma expresión normalizada
+        cache.obtener("x*y", ('x', 'y'))
+        cache.obtener("x - y", ('x', 'y'))          # desaloja 'x+y'
+        cache.obtener("x + y", ('x', 'y'))
+        stats = cache.estadisticas()
+        
+        print("\n" + "="*70)
+        print("METODO: Caché LRU de expresiones")
+        print(f"Estadísticas: {stats}")
+        print("="*70)
+        
+        assert f1 is f2
+        assert f1(1.0, 2.0) == 3.0
+        assert stats['aciertos'] == 1
+        assert stats['fallos'] == 4
+        assert stats['entradas'] == 2
+
 
 class TestSistemasLineales:
     """Tests para sistemas lineales"""
@@ -250,6 +911,24 @@ class TestSistemasLineales:
         print("="*70)
         
         assert error < 0.0001
+    
+    def test_tridiagonal(self):
+        """TEST: Algoritmo de Thomas"""
+        n = 50
+        A = 4 * np.eye(n) + np.eye(n, k=1) + np.eye(n, k=-1)
+        esperado = np.linspace(-1, 1, n)
+        b = A @ esperado
+        resultado, detalles = SistemasLineales.tridiagonal(np.ones(n - 1), 4 * np.ones(n), np.ones(n - 1), b)
+        
+        print("\n" + "="*70)
+        print("METODO: Algoritmo de Thomas (n = 50)")
+        print(f"Residuo: {detalles['residuo']:.2e}")
+        print("="*70)
+        
+        assert np.max(np.abs(np.array(resultado) - esperado)) < 1e-12
+        assert detalles['diagonalmente_dominante']
+        with pytest.raises(ValueError):
+            SistemasLineales.tridiagonal([1], [0, 1], [1], [1, 1])
 
 
 if __name__ == '__main__':